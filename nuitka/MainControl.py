@@ -25,13 +25,12 @@ a distribution folder.
 """
 
 import os
-import shutil
 import sys
 from logging import info, warning
 
 from nuitka.finalizations.FinalizeMarkups import getImportedNames
 from nuitka.freezer.Standalone import copyDataFiles
-from nuitka.importing import Importing, Recursion
+from nuitka.importing import ImportGraph, Importing, Reachability, Recursion
 from nuitka.Options import getPythonFlags
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PostProcessing import executePostProcessing
@@ -43,6 +42,7 @@ from nuitka.PythonVersions import (
     python_version_str,
 )
 from nuitka.tree import SyntaxErrors
+from nuitka.tree.SourceReading import stopSourceCodePrefetching
 from nuitka.utils import Execution, InstanceCounters, MemoryUsage, Utils
 from nuitka.utils.AppDirs import getCacheDir
 from nuitka.utils.FileOperations import (
@@ -59,7 +59,8 @@ from .build import SconsInterface
 from .codegen import CodeGeneration, ConstantCodes, Reports
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
-from .freezer.Standalone import copyUsedDLLs, detectEarlyImports
+from .freezer.Onefile import packDistFolder
+from .freezer.Standalone import copyDistFile, copyUsedDLLs, detectEarlyImports
 from .optimizations import Optimization
 from .tree import Building
 
@@ -140,6 +141,15 @@ def createNodeTree(filename):
     # Then optimize the tree and potentially recursed modules.
     Optimization.optimize(main_module.getOutputFilename())
 
+    # No more modules get built, reading more sources is pointless.
+    stopSourceCodePrefetching()
+
+    if Options.shallPruneUnreachableModules() or Options.getModuleReportFilename():
+        Reachability.analyzeModuleReachability()
+
+    if Options.getImportGraphFilename():
+        ImportGraph.writeImportGraph(Options.getImportGraphFilename())
+
     if Options.isExperimental("check_xml_persistence"):
         for module in ModuleRegistry.getRootModules():
             if module.isMainModule():
@@ -208,6 +218,28 @@ def getResultFullpath(main_module):
     return result
 
 
+def getOnefileBootstrapPath(main_module):
+    result = os.path.join(getSourceDirectoryPath(main_module), "onefile-bootstrap")
+
+    if Utils.getOS() == "Windows":
+        result += ".exe"
+
+    return result
+
+
+def getOnefileResultPath(main_module):
+    result = Options.getOutputPath(
+        path=os.path.basename(getTreeFilenameWithSuffix(main_module, ""))
+    )
+
+    if Utils.getOS() == "Windows":
+        result += ".exe"
+    else:
+        result += ".bin"
+
+    return result
+
+
 def cleanSourceDirectory(source_dir):
     extensions = (
         ".bin",
@@ -411,7 +443,7 @@ def makeSourceDirectory(main_module):
             if not os.path.isdir(target_dir):
                 makePath(target_dir)
 
-            shutil.copyfile(module.getFilename(), target_filename)
+            copyDistFile(module.getFilename(), target_filename)
 
             standalone_entry_points.append(
                 (module.getFilename(), target_filename, module.getPackage())
@@ -494,6 +526,13 @@ def runScons(main_module, quiet):
     if Options.isStandaloneMode():
         options["standalone_mode"] = "true"
 
+    if Options.shallCompressConstants():
+        options["compressed_constants"] = "true"
+
+    if Options.isOnefileMode():
+        options["onefile_mode"] = "true"
+        options["onefile_bootstrap_exe"] = getOnefileBootstrapPath(main_module)
+
     if (
         not Options.isStandaloneMode()
         and not Options.shallMakeModule()
@@ -524,6 +563,24 @@ def runScons(main_module, quiet):
     if Options.isClang():
         options["clang_mode"] = "true"
 
+    if Options.getFreelistSizes():
+        options["freelist_sizes"] = ",".join(
+            "%s=%d" % (kind, count)
+            for kind, count in sorted(Options.getFreelistSizes().items())
+        )
+
+    if Options.isFreelistAdaptive():
+        options["freelist_adaptive"] = "true"
+
+    if Options.shallProvideFreelistStatistics():
+        options["freelist_statistics"] = "true"
+
+    if Options.shallProvideRuntimeStatistics():
+        options["runtime_statistics"] = "true"
+
+    if Options.isLazyExtensionBinding():
+        options["lazy_extension_binding"] = "true"
+
     if Options.getIconPath():
         options["icon_path"] = Options.getIconPath()
 
@@ -649,7 +706,9 @@ def compileTree(main_module):
         if not isWin32Windows():
             writeBinaryData(
                 filename=os.path.join(source_dir, "__constants.bin"),
-                binary_data=ConstantCodes.stream_data.getBytes(),
+                binary_data=ConstantCodes.stream_data.getBytes(
+                    compressed=Options.shallCompressConstants()
+                ),
             )
     else:
         source_dir = getSourceDirectoryPath(main_module)
@@ -758,6 +817,9 @@ def main():
 
         executePostProcessing(getResultFullpath(main_module))
 
+        # DLLs of the distribution folder and the binaries using them.
+        used_dlls = {}
+
         if Options.isStandaloneMode():
             binary_filename = options["result_exe"]
 
@@ -770,7 +832,7 @@ def main():
                     Plugins.considerExtraDlls(dist_dir, module)
                 )
 
-            copyUsedDLLs(
+            used_dlls = copyUsedDLLs(
                 source_dir=getSourceDirectoryPath(main_module),
                 dist_dir=dist_dir,
                 standalone_entry_points=standalone_entry_points,
@@ -784,6 +846,27 @@ def main():
 
             Plugins.onStandaloneDistributionFinished(dist_dir)
 
+            if Options.isOnefileMode():
+                packDistFolder(
+                    bootstrap_filename=getOnefileBootstrapPath(main_module),
+                    dist_dir=dist_dir,
+                    main_filename=binary_filename,
+                    result_filename=getOnefileResultPath(main_module),
+                )
+
+        if Options.getModuleReportFilename():
+            Reachability.writeModuleReport(
+                report_filename=Options.getModuleReportFilename(),
+                module_filenames=pickSourceFilenames(
+                    source_dir=getSourceDirectoryPath(main_module),
+                    modules=ModuleRegistry.getDoneModules(),
+                ),
+                dist_dir=getStandaloneDirectoryPath(main_module)
+                if Options.isStandaloneMode()
+                else None,
+                used_dlls=used_dlls,
+            )
+
         # Remove the source directory (now build directory too) if asked to.
         if Options.isRemoveBuildDir():
             removeDirectory(
@@ -830,6 +913,11 @@ __name__ = ...
                     tree=main_module,
                     clean_path=Options.shallClearPythonPathEnvironment(),
                 )
+            elif Options.isOnefileMode():
+                executeMain(
+                    binary_filename=getOnefileResultPath(main_module),
+                    clean_path=Options.shallClearPythonPathEnvironment(),
+                )
             else:
                 executeMain(
                     binary_filename=getResultFullpath(main_module),
@@ -34,6 +34,9 @@ from nuitka.utils.FileOperations import areSamePaths
 # One or more root modules, i.e. entry points that must be there.
 root_modules = OrderedSet()
 
+# Root modules that were only detected as used, not requested.
+optional_root_modules = set()
+
 # To be traversed modules
 active_modules = OrderedSet()
 
@@ -43,10 +46,21 @@ done_modules = set()
 # Uncompiled modules
 uncompiled_modules = set()
 
+# Module currently traversed, and the modules each traversed module uses.
+current_module = None
+module_uses = {}
+
 
-def addRootModule(module):
+def addRootModule(module, required=True):
     root_modules.add(module)
 
+    if not required:
+        optional_root_modules.add(module)
+
+
+def isRequiredRootModule(module):
+    return module in root_modules and module not in optional_root_modules
+
 
 def getRootModules():
     return root_modules
@@ -71,6 +85,15 @@ def replaceRootModule(old, new):
 
     root_modules = new_root_modules
 
+    if old in optional_root_modules:
+        optional_root_modules.remove(old)
+        optional_root_modules.add(new)
+
+
+def removeRootModule(module):
+    root_modules.discard(module)
+    optional_root_modules.discard(module)
+
 
 def addUncompiledModule(module):
     uncompiled_modules.add(module)
@@ -129,16 +152,26 @@ def removeUncompiledModule(module):
 def startTraversal():
     # Using global here, as this is really a singleton, in the form of a module,
     # pylint: disable=global-statement
-    global active_modules, done_modules
+    global active_modules, done_modules, current_module, module_uses
 
     active_modules = OrderedSet(root_modules)
     done_modules = set()
 
+    current_module = None
+    module_uses = {}
+
     for active_module in active_modules:
         active_module.startTraversal()
 
 
 def addUsedModule(module):
+    # Record which module uses it, for reachability analysis.
+    if current_module is not None and module is not current_module:
+        if current_module not in module_uses:
+            module_uses[current_module] = OrderedSet()
+
+        module_uses[current_module].add(module)
+
     if module not in done_modules and module not in active_modules:
         active_modules.add(module)
 
@@ -146,12 +179,18 @@ def addUsedModule(module):
 
 
 def nextModule():
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global current_module
+
     if active_modules:
         result = active_modules.pop()
         done_modules.add(result)
 
+        current_module = result
         return result
     else:
+        current_module = None
         return None
 
 
@@ -174,6 +213,12 @@ def removeDoneModule(module):
     done_modules.remove(module)
 
 
+def getModuleUses(module):
+    """ Modules the module used during the last traversal. """
+
+    return tuple(module_uses.get(module, ()))
+
+
 def getModuleFromCodeName(code_name):
     # TODO: We need something to just load modules.
     for module in root_modules:
@@ -73,6 +73,18 @@ implies these option: "--recurse-all". You may also want to use
 of code dependencies. Defaults to off.""",
 )
 
+parser.add_option(
+    "--onefile",
+    action="store_true",
+    dest="is_onefile",
+    default=False,
+    help="""\
+In addition to the standalone distribution folder, create a single executable
+that contains it. On first run, it is extracted to a cache directory named
+after its contents hash, later runs use that directly. Implies "--standalone".
+Defaults to off.""",
+)
+
 
 if os.name == "nt":
     parser.add_option(
@@ -262,6 +274,17 @@ in any case, overrides all other options. Can be given multiple times. Default
 empty.""",
 )
 
+recurse_group.add_option(
+    "--prune-unreachable-modules",
+    action="store_true",
+    dest="prune_unreachable_modules",
+    default=False,
+    help="""\
+After optimization, remove included modules that are not reachable from the
+main program, the modules requested by the user, and the modules needed for
+Python startup. These can only come from detected extension modules, that
+nothing uses. Defaults to off.""",
+)
 
 parser.add_option_group(recurse_group)
 
@@ -348,6 +371,119 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is.""",
 )
 
+codegen_group.add_option(
+    "--lazy-constants",
+    action="store_true",
+    dest="lazy_constants",
+    default=False,
+    help="""\
+Create constants shared by multiple modules only when the first module using
+them is loaded, instead of all at program start. Reduces startup time and
+memory usage of programs that do not load all the included modules.
+Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--compress-constants",
+    action="store_true",
+    dest="compress_constants",
+    default=False,
+    help="""\
+Store the binary blob with constants and bytecode of included modules in
+compressed chunks, which are decompressed only when a module using them is
+loaded. Makes the binary smaller. Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--compilation-profile",
+    action="store",
+    dest="compilation_profile",
+    metavar="PROFILE_FILE",
+    default=None,
+    help="""\
+Decide between compiled and bytecode modules with a profile from a training
+run of the program, either written by "python -m cProfile -o PROFILE_FILE",
+or a text file with a module name and hit count per line. Modules with fewer
+hits than the threshold are included as bytecode. Default is to compile all
+modules, unless plugins decide otherwise.""",
+)
+
+codegen_group.add_option(
+    "--compilation-profile-threshold",
+    action="store",
+    dest="compilation_profile_threshold",
+    metavar="HITS",
+    default="100",
+    help="""\
+Minimum number of hits of a module in the compilation profile, to compile
+it. For "cProfile" output, these are the calls of its functions, including
+its module code. Defaults to 100.""",
+)
+
+codegen_group.add_option(
+    "--lazy-imports",
+    action="append",
+    dest="lazy_import_packages",
+    metavar="PACKAGE",
+    default=[],
+    help="""\
+Make module level imports in the modules of this package lazy, where the
+imported name is only used for attribute lookups inside functions. These
+modules are then only imported when such a function uses them first. Until
+then, other modules accessing the name, e.g. with "from module import name",
+get a proxy object rather than the module. This changes when the imports
+happen, therefore it must be asked for per package, e.g. "some_package" or
+"some_package.sub_package". Default empty.""",
+)
+
+codegen_group.add_option(
+    "--freelist-size",
+    action="append",
+    dest="freelist_sizes",
+    metavar="KIND=COUNT",
+    default=[],
+    help="""\
+Maximum number of objects kept for reuse in the free lists of compiled
+types, given per kind, e.g. "frame=1000". Supported kinds are "function",
+"method", "generator", "coroutine", "asyncgen", "frame", "cell", "traceback"
+and "all". Can be given multiple times. Defaults to 1000 for cells and
+tracebacks, and 100 otherwise.""",
+)
+
+codegen_group.add_option(
+    "--freelist-adaptive",
+    action="store_true",
+    dest="freelist_adaptive",
+    default=False,
+    help="""\
+Let free lists of compiled types grow at run time, up to 64 times their
+size, when the program creates and releases more objects than they can
+hold. Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--freelist-statistics",
+    action="store_true",
+    dest="freelist_statistics",
+    default=False,
+    help="""\
+Provide "sys._nuitka_freelist_statistics()" in the compiled program, which
+reports the size, hits, misses and discards of the free lists of compiled
+types, to tune them. Defaults to off.""",
+)
+
+codegen_group.add_option(
+    "--runtime-statistics",
+    action="store_true",
+    dest="runtime_statistics",
+    default=False,
+    help="""\
+Provide a "__nuitka_stats__" module in the compiled program, which reports
+free list usage, reuse of cached frames, compiled and uncompiled calls, uses
+of generic helpers where no specialized one existed, and import times of the
+included modules. Makes the program slower. Defaults to off.""",
+)
+
 parser.add_option_group(codegen_group)
 
 output_group = OptionGroup(parser, "Output choices")
@@ -391,6 +527,42 @@ Removes the build directory after producing the module or exe file.
 Defaults to off.""",
 )
 
+output_group.add_option(
+    "--dist-file-links",
+    action="store",
+    dest="dist_file_links",
+    choices=("copy", "hardlink", "reflink"),
+    default="copy",
+    help="""\
+How files are put into the distribution folder in standalone mode. With
+"hardlink" or "reflink", the files are kept once in a store in the Nuitka cache
+directory, and linked or, on file systems that support it, cloned from there.
+Files that need changes are copied still. Falls back to copying where linking
+is not possible. Defaults to "copy".""",
+)
+
+output_group.add_option(
+    "--strip-dist-binaries",
+    action="store_true",
+    dest="strip_dist_binaries",
+    default=False,
+    help="""\
+Remove debug information from extension modules and shared libraries in the
+distribution folder of standalone mode with the "strip" tool. Not done on
+Windows. Defaults to off.""",
+)
+
+output_group.add_option(
+    "--lazy-extension-binding",
+    action="store_true",
+    dest="lazy_extension_binding",
+    default=False,
+    help="""\
+Load the extension modules of the distribution folder of standalone mode with
+lazy binding, so their symbols are resolved by the dynamic loader when first
+used, not all of them when imported. Not done on Windows. Defaults to off.""",
+)
+
 output_group.add_option(
     "--no-pyi-file",
     action="store_false",
@@ -637,6 +809,34 @@ tracing_group.add_option(
 Defaults to off.""",
 )
 
+tracing_group.add_option(
+    "--report-modules",
+    action="store",
+    dest="module_report",
+    metavar="REPORT_FILENAME",
+    default=None,
+    help="""\
+Write a report of the included modules to the given file, with their status
+of reachability from the main program, the module that made them included,
+and their sizes in C code, object code, bytecode, extension module binaries
+and used DLLs. Default empty.""",
+)
+
+tracing_group.add_option(
+    "--import-graph",
+    action="store",
+    dest="import_graph",
+    metavar="GRAPH_FILENAME",
+    default=None,
+    help="""\
+Write the import graph of the included modules to the given file, as GraphML
+if it ends in ".graphml", and as JSON otherwise. Imports are marked as done at
+module level or in functions. With "--runtime-statistics" the compiled program
+writes its import times to the file named by the "NUITKA_IMPORT_TIMES"
+environment variable, and "python -m nuitka.tools.profiler.import_chain"
+combines both into the chain of imports that dominates startup. Default empty.""",
+)
+
 tracing_group.add_option(
     "--verbose",
     action="store_true",
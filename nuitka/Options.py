@@ -29,6 +29,18 @@ positional_args = None
 extra_args = []
 is_nuitka_run = None
 
+# Kinds of compiled objects, that have free lists of configurable size.
+freelist_kinds = (
+    "function",
+    "method",
+    "generator",
+    "coroutine",
+    "asyncgen",
+    "frame",
+    "cell",
+    "traceback",
+)
+
 
 def parseArgs():
     # singleton with many cases, pylint: disable=global-statement,too-many-branches
@@ -41,6 +53,10 @@ def parseArgs():
     else:
         logging.getLogger().setLevel(logging.INFO)
 
+    # Onefile mode packs the standalone distribution folder.
+    if options.is_onefile:
+        options.is_standalone = True
+
     # Standalone mode implies an executable, not importing "site" module, which is
     # only for this machine, recursing to all modules, and even including the
     # standard library.
@@ -94,6 +110,16 @@ Error, '--nofollow-import-to' takes only module names, not directory path '%s'."
                 % no_case_module
             )
 
+    for freelist_size in options.freelist_sizes:
+        kind, _, count = freelist_size.partition("=")
+
+        if kind not in freelist_kinds + ("all",) or not count.isdigit():
+            sys.exit(
+                """\
+Error, '--freelist-size' takes values like 'frame=1000' with kinds %s, not '%s'."""
+                % (", ".join(freelist_kinds + ("all",)), freelist_size)
+            )
+
     scons_python = getPythonPathForScons()
 
     if scons_python is not None and not os.path.exists(scons_python):
@@ -358,6 +384,71 @@ def isLto():
     return options.lto
 
 
+def shallCreateConstantsLazily():
+    """ *bool* = "--lazy-constants"
+    """
+    return options.lazy_constants
+
+
+def shallCompressConstants():
+    """ *bool* = "--compress-constants"
+    """
+    return options.compress_constants
+
+
+def getCompilationProfileFilename():
+    """ *str* or *None*, value of "--compilation-profile="
+    """
+    return options.compilation_profile
+
+
+def getCompilationProfileThreshold():
+    """ *int*, value of "--compilation-profile-threshold="
+    """
+    return int(options.compilation_profile_threshold)
+
+
+def getLazyImportPackages():
+    """ *list*, items of "--lazy-imports="
+    """
+    return sum([_splitShellPattern(x) for x in options.lazy_import_packages], [])
+
+
+def getFreelistSizes():
+    """ *dict*, kinds and counts of "--freelist-size=", with "all" expanded
+    """
+    result = {}
+
+    for freelist_size in options.freelist_sizes:
+        kind, count = freelist_size.split("=", 1)
+
+        if kind == "all":
+            for freelist_kind in freelist_kinds:
+                result[freelist_kind] = int(count)
+        else:
+            result[kind] = int(count)
+
+    return result
+
+
+def isFreelistAdaptive():
+    """ *bool* = "--freelist-adaptive"
+    """
+    return options.freelist_adaptive
+
+
+def shallProvideFreelistStatistics():
+    """ *bool* = "--freelist-statistics"
+    """
+    return options.freelist_statistics
+
+
+def shallProvideRuntimeStatistics():
+    """ *bool* = "--runtime-statistics"
+    """
+    return options.runtime_statistics
+
+
 def isClang():
     """ *bool* = "--clang"
     """
@@ -406,6 +497,24 @@ def isShowInclusion():
     return options.show_inclusion
 
 
+def getModuleReportFilename():
+    """ *str* = "--report-modules"
+    """
+    return options.module_report
+
+
+def getImportGraphFilename():
+    """ *str* = "--import-graph"
+    """
+    return options.import_graph
+
+
+def shallPruneUnreachableModules():
+    """ *bool* = "--prune-unreachable-modules"
+    """
+    return options.prune_unreachable_modules
+
+
 def isRemoveBuildDir():
     """ *bool* = "--remove-output"
     """
@@ -450,6 +559,12 @@ def isStandaloneMode():
     return options.is_standalone
 
 
+def isOnefileMode():
+    """ *bool* = "--onefile"
+    """
+    return options.is_onefile
+
+
 def getIconPath():
     """ *str*, value of "--windows-icon"
     """
@@ -509,6 +624,28 @@ def shallNotStoreDependsExeCachedResults():
     return options.no_dependency_cache
 
 
+def getDistFileLinkMode():
+    """ *str* = "--dist-file-links", one of "copy", "hardlink", or "reflink"
+    """
+    return options.dist_file_links
+
+
+def shallStripDistBinaries():
+    """ *bool* = "--strip-dist-binaries"
+    """
+    return options.strip_dist_binaries and not Utils.isWin32Windows()
+
+
+def isLazyExtensionBinding():
+    """ *bool* = "--lazy-extension-binding"
+    """
+    return (
+        options.lazy_extension_binding
+        and isStandaloneMode()
+        and not Utils.isWin32Windows()
+    )
+
+
 def getPluginsEnabled():
     """ *tuple*, enabled plugins (including user plugins)
 
@@ -53,7 +53,9 @@ def executePostProcessing(result_filename):
         # Attach the binary blob as a Windows resource.
         addResourceToFile(
             target_filename=result_filename,
-            data=ConstantCodes.stream_data.getBytes(),
+            data=ConstantCodes.stream_data.getBytes(
+                compressed=Options.shallCompressConstants()
+            ),
             resource_kind=RT_RCDATA,
             res_name=3,
             lang_id=0,
@@ -22,8 +22,10 @@
 
 extern PyObject *const_tuple_empty;
 
-NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION(PyObject *function_object, PyObject *positional_args,
-                                                    PyObject *named_args) {
+// Call without counting it in the run time statistics, for the helpers that
+// counted the call already.
+NUITKA_MAY_BE_UNUSED static PyObject *_CALL_FUNCTION(PyObject *function_object, PyObject *positional_args,
+                                                     PyObject *named_args) {
     // Not allowed to enter with an error set. This often catches leaked errors from
     // elsewhere.
     assert(!ERROR_OCCURRED());
@@ -63,6 +65,13 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION(PyObject *function_object, P
     }
 }
 
+NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION(PyObject *function_object, PyObject *positional_args,
+                                                    PyObject *named_args) {
+    NUITKA_STATISTICS_CALL(function_object);
+
+    return _CALL_FUNCTION(function_object, positional_args, named_args);
+}
+
 // Function call variant with no arguments provided at all.
 extern PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called);
 
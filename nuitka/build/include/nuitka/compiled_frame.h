@@ -47,6 +47,9 @@ struct Nuitka_FrameObject {
     if (isFrameUnusable(cache_identifier)) {                                                                           \
         Py_XDECREF(cache_identifier);                                                                                  \
         cache_identifier = MAKE_FUNCTION_FRAME(code_identifier, module_identifier, locals_size);                       \
+        NUITKA_STATISTICS_COUNT(frames_created);                                                                       \
+    } else {                                                                                                           \
+        NUITKA_STATISTICS_COUNT(frames_reused);                                                                        \
     }                                                                                                                  \
     assert(((struct Nuitka_FrameObject *)cache_identifier)->m_type_description == NULL);
 
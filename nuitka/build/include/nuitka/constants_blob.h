@@ -40,4 +40,19 @@ const unsigned char constant_bin[0];
 #endif
 #endif
 
+/* Access to a range of the constants binary blob. If it is compressed, this
+ * decompresses the chunks it touches, unless done already, otherwise it is
+ * merely a pointer into it.
+ */
+#if defined(_NUITKA_CONSTANTS_COMPRESSED)
+#ifdef __cplusplus
+extern "C" unsigned char const *getConstantsBlobRange(size_t offset, size_t size);
+#else
+extern unsigned char const *getConstantsBlobRange(size_t offset, size_t size);
+#endif
+#define CONSTANT_BIN_RANGE(offset, size) (getConstantsBlobRange(offset, size))
+#else
+#define CONSTANT_BIN_RANGE(offset, size) (&constant_bin[offset])
+#endif
+
 #endif
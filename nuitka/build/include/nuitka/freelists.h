@@ -19,12 +19,83 @@
 #ifndef __NUITKA_FREELISTS_H__
 #define __NUITKA_FREELISTS_H__
 
+// Limits and usage counters of a free list. The limits are given at compile
+// time per object type, and with adaptive free lists, they can grow at run
+// time, if allocations find the free list empty too often.
+struct Nuitka_FreeListInfo {
+    char const *name;
+
+    int const *count;
+    int max_count;
+    int max_count_limit;
+
+    // Allocations served from the free list, and those that were not.
+    unsigned long hits;
+    unsigned long misses;
+
+    // Releases that did not fit into the free list anymore.
+    unsigned long discards;
+
+    // Value of misses when the limit was last adapted.
+    unsigned long adapted_misses;
+};
+
+// Growth limit for adaptive free lists, as a factor of the compile time limit.
+#ifndef NUITKA_FREELIST_ADAPTIVE_FACTOR
+#define NUITKA_FREELIST_ADAPTIVE_FACTOR 64
+#endif
+
+#define NUITKA_DECLARE_FREE_LIST(free_list, object_type, max_free_list_count)                                          \
+    static object_type *free_list = NULL;                                                                              \
+    static int free_list##_count = 0;                                                                                  \
+    struct Nuitka_FreeListInfo free_list##_info = {#free_list,                                                         \
+                                                   &free_list##_count,                                                 \
+                                                   max_free_list_count,                                                \
+                                                   max_free_list_count * NUITKA_FREELIST_ADAPTIVE_FACTOR,              \
+                                                   0,                                                                  \
+                                                   0,                                                                  \
+                                                   0,                                                                  \
+                                                   0};
+
+#if _NUITKA_FREELIST_ADAPTIVE
+// When more allocations missed the free list since the last adaptation, than
+// it may hold, the churn exceeds its size, so double it, within limits.
+static inline bool Nuitka_FreeList_Adapt(struct Nuitka_FreeListInfo *info) {
+    if (info->max_count < info->max_count_limit &&
+        info->misses - info->adapted_misses > (unsigned long)info->max_count) {
+        info->max_count *= 2;
+
+        if (info->max_count > info->max_count_limit) {
+            info->max_count = info->max_count_limit;
+        }
+
+        info->adapted_misses = info->misses;
+
+        return true;
+    }
+
+    return false;
+}
+#define NUITKA_FREELIST_ADAPT(info) Nuitka_FreeList_Adapt(info)
+#else
+#define NUITKA_FREELIST_ADAPT(info) false
+#endif
+
+// The usage counters are only maintained when something uses them, to keep
+// the default build free of these writes.
+#if _NUITKA_FREELIST_STATISTICS || _NUITKA_FREELIST_ADAPTIVE || _NUITKA_STATISTICS
+#define NUITKA_FREELIST_COUNT(counter) counter += 1;
+#else
+#define NUITKA_FREELIST_COUNT(counter)
+#endif
+
 #define allocateFromFreeList(free_list, object_type, type_type, size)                                                  \
     if (free_list != NULL) {                                                                                           \
         result = free_list;                                                                                            \
         free_list = *((object_type **)free_list);                                                                      \
         free_list##_count -= 1;                                                                                        \
         assert(free_list##_count >= 0);                                                                                \
+        NUITKA_FREELIST_COUNT(free_list##_info.hits)                                                                   \
                                                                                                                        \
         if (Py_SIZE(result) < size) {                                                                                  \
             result = PyObject_GC_Resize(object_type, result, size);                                                    \
@@ -33,6 +104,7 @@
                                                                                                                        \
         _Py_NewReference((PyObject *)result);                                                                          \
     } else {                                                                                                           \
+        NUITKA_FREELIST_COUNT(free_list##_info.misses)                                                                 \
         result = (object_type *)Nuitka_GC_NewVar(&type_type, size);                                                    \
     }                                                                                                                  \
     CHECK_OBJECT(result);
@@ -43,16 +115,19 @@
         free_list = *((object_type **)free_list);                                                                      \
         free_list##_count -= 1;                                                                                        \
         assert(free_list##_count >= 0);                                                                                \
+        NUITKA_FREELIST_COUNT(free_list##_info.hits)                                                                   \
                                                                                                                        \
         _Py_NewReference((PyObject *)result);                                                                          \
     } else {                                                                                                           \
+        NUITKA_FREELIST_COUNT(free_list##_info.misses)                                                                 \
         result = (object_type *)PyObject_GC_New(object_type, &type_type);                                              \
     }                                                                                                                  \
     CHECK_OBJECT(result);
 
-#define releaseToFreeList(free_list, object, max_free_list_count)                                                      \
+#define releaseToFreeList(free_list, object)                                                                           \
     if (free_list != NULL) {                                                                                           \
-        if (free_list##_count > max_free_list_count) {                                                                 \
+        if (free_list##_count > free_list##_info.max_count && !NUITKA_FREELIST_ADAPT(&free_list##_info)) {             \
+            NUITKA_FREELIST_COUNT(free_list##_info.discards)                                                           \
             PyObject_GC_Del(object);                                                                                   \
         } else {                                                                                                       \
             *((void **)object) = (void *)free_list;                                                                    \
@@ -69,4 +144,7 @@
         free_list##_count += 1;                                                                                        \
     }
 
+// Report the usage of all free lists, for tuning their sizes.
+extern PyObject *Nuitka_GetFreeListStatistics(void);
+
 #endif
@@ -340,6 +340,10 @@ extern void patchBuiltinModule(void);
 /* Replace inspect functions with ones that handle compiles types too. */
 #if PYTHON_VERSION >= 300
 extern void patchInspectModule(void);
+
+// For the meta path based loader, to patch "inspect" when it is imported.
+extern bool isInspectModulePatchPending(char const *name);
+extern PyObject *importAndPatchInspectModule(void);
 #endif
 
 // Replace type comparison with one that accepts compiled types too, will work
@@ -33,6 +33,11 @@ extern PyObject *IMPORT_MODULE5(PyObject *module_name, PyObject *globals, PyObje
 extern PyObject *IMPORT_MODULE_KW(PyObject *module_name, PyObject *globals, PyObject *locals, PyObject *import_items,
                                   PyObject *level);
 
+// Create a proxy for a module level import, that is done on first attribute
+// access, and then replaces the proxy as value of the module variable.
+extern PyObject *IMPORT_MODULE_LAZY(PyObject *variable_name, PyObject *module_name, PyObject *globals, PyObject *locals,
+                                    PyObject *import_items, PyObject *level);
+
 extern bool IMPORT_MODULE_STAR(PyObject *target, bool is_module, PyObject *module);
 
 extern PyObject *IMPORT_EMBEDDED_MODULE(PyObject *module_name, char const *name);
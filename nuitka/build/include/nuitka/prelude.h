@@ -255,6 +255,9 @@ extern PyThreadState *_PyThreadState_Current;
 #define PyThreadState_GET() (_PyThreadState_Current)
 #endif
 
+// Needed by the calling helpers already.
+#include "nuitka/statistics.h"
+
 #include "nuitka/helpers.h"
 
 #include "nuitka/compiled_frame.h"
@@ -0,0 +1,95 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_STATISTICS_H__
+#define __NUITKA_STATISTICS_H__
+
+// Run time statistics, only collected if the program is compiled with
+// "--runtime-statistics", and then reported by the "__nuitka_stats__"
+// module. Otherwise the counting macros expand to nothing at all.
+
+#if _NUITKA_STATISTICS
+
+struct Nuitka_RuntimeStatistics {
+    // Frames of functions, taken from their cache or newly created.
+    unsigned long frames_reused;
+    unsigned long frames_created;
+
+    // Calls made through the calling helpers or directly, by the kind of
+    // the called object.
+    unsigned long calls_compiled;
+    unsigned long calls_uncompiled;
+};
+
+extern struct Nuitka_RuntimeStatistics nuitka_statistics;
+
+#define NUITKA_STATISTICS_COUNT(counter_name) nuitka_statistics.counter_name += 1;
+
+// Not inline, as "calling.h" uses it before compiled types are declared.
+extern void Nuitka_Statistics_CountCall(PyObject *called);
+
+#define NUITKA_STATISTICS_CALL(called) Nuitka_Statistics_CountCall(called);
+
+// Counter for a use of a generic helper, where code generation had no
+// specialized one, registered with the first use.
+struct Nuitka_StatisticsCounter {
+    char const *name;
+    unsigned long count;
+
+    struct Nuitka_StatisticsCounter *next;
+};
+
+extern void Nuitka_Statistics_RegisterCounter(struct Nuitka_StatisticsCounter *counter);
+
+#define NUITKA_STATISTICS_FALLBACK(helper_name)                                                                        \
+    {                                                                                                                  \
+        static struct Nuitka_StatisticsCounter counter = {helper_name, 0, NULL};                                       \
+        if (counter.count++ == 0) {                                                                                    \
+            Nuitka_Statistics_RegisterCounter(&counter);                                                               \
+        }                                                                                                              \
+    }
+
+extern double Nuitka_Statistics_GetTime(void);
+
+// Time the import of a module, and remember which module imported it.
+extern double Nuitka_Statistics_StartImport(char const *name);
+extern void Nuitka_Statistics_EndImport(char const *name, double import_start);
+
+// Write import times and parents as JSON to "NUITKA_IMPORT_TIMES" if set.
+extern void Nuitka_Statistics_WriteImportTimes(void);
+
+// Time the phases of program startup, the first one starts at process entry.
+extern void Nuitka_Statistics_StartupBegin(void);
+extern void Nuitka_Statistics_StartupPhaseDone(char const *name);
+
+// Write startup phase times as JSON to "NUITKA_STARTUP_TIMES" if set.
+extern void Nuitka_Statistics_WriteStartupTimes(void);
+
+#define NUITKA_STATISTICS_STARTUP_BEGIN() Nuitka_Statistics_StartupBegin();
+#define NUITKA_STATISTICS_STARTUP_PHASE(phase_name) Nuitka_Statistics_StartupPhaseDone(phase_name);
+
+#else
+
+#define NUITKA_STATISTICS_COUNT(counter_name)
+#define NUITKA_STATISTICS_CALL(called)
+#define NUITKA_STATISTICS_FALLBACK(helper_name)
+#define NUITKA_STATISTICS_STARTUP_BEGIN()
+#define NUITKA_STATISTICS_STARTUP_PHASE(phase_name)
+
+#endif
+
+#endif
@@ -26,6 +26,11 @@ extern volatile int _Py_Ticker;
 #define _Py_CheckInterval 20
 #endif
 
+// Decide if releasing the GIL can be of use to other threads at all, and for
+// Python3, if the switch interval has passed.
+extern bool Nuitka_ShallReleaseGIL(PyThreadState *tstate);
+extern void Nuitka_NoteGILAcquired(void);
+
 NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING(void) {
     // Decrease ticker
     if (--_Py_Ticker < 0) {
@@ -40,12 +45,12 @@ NUITKA_MAY_BE_UNUSED static inline bool CONSIDER_THREADING(void) {
         PyThreadState *tstate = PyThreadState_GET();
         assert(tstate);
 
-        if (PyEval_ThreadsInitialized()) {
-            // Release and acquire the GIL, it's very inefficient, because we
-            // don't even know if it makes sense to do it. A controlling thread
-            // should be used to determine if it's needed at all.
+        if (PyEval_ThreadsInitialized() && Nuitka_ShallReleaseGIL(tstate)) {
+            // Release and acquire the GIL, so other threads get to run.
             PyEval_SaveThread();
             PyEval_AcquireThread(tstate);
+
+            Nuitka_NoteGILAcquired();
         }
 
         if (unlikely(tstate->async_exc != NULL)) {
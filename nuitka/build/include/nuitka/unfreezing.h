@@ -44,6 +44,12 @@ struct Nuitka_MetaPathBasedLoaderEntry {
 
     /* Flags: Indicators if this is compiled, bytecode or shared library. */
     int flags;
+
+    /* For packages, indexes of the entries of their direct children. The
+     * entries are sorted by name, so these are too.
+     */
+    int const *children;
+    int children_count;
 };
 
 /* For embedded modules, register the meta path based loader. Used by main
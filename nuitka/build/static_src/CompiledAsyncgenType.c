@@ -532,9 +532,10 @@ static PyObject *Nuitka_Asyncgen_athrow(struct Nuitka_AsyncgenObject *asyncgen,
     return Nuitka_AsyncgenAthrow_New(asyncgen, args);
 }
 
+#ifndef MAX_ASYNCGEN_FREE_LIST_COUNT
 #define MAX_ASYNCGEN_FREE_LIST_COUNT 100
-static struct Nuitka_AsyncgenObject *free_list_asyncgens = NULL;
-static int free_list_asyncgens_count = 0;
+#endif
+NUITKA_DECLARE_FREE_LIST(free_list_asyncgens, struct Nuitka_AsyncgenObject, MAX_ASYNCGEN_FREE_LIST_COUNT)
 
 // TODO: This might have to be finalize actually.
 static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
@@ -598,7 +599,7 @@ static void Nuitka_Asyncgen_tp_dealloc(struct Nuitka_AsyncgenObject *asyncgen) {
     Py_DECREF(asyncgen->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_asyncgens, asyncgen, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgens, asyncgen);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -756,15 +757,15 @@ struct Nuitka_AsyncgenWrappedValueObject {
     PyObject_HEAD PyObject *m_value;
 };
 
-static struct Nuitka_AsyncgenWrappedValueObject *free_list_asyncgen_value_wrappers = NULL;
-static int free_list_asyncgen_value_wrappers_count = 0;
+NUITKA_DECLARE_FREE_LIST(free_list_asyncgen_value_wrappers, struct Nuitka_AsyncgenWrappedValueObject,
+                         MAX_ASYNCGEN_FREE_LIST_COUNT)
 
 static void asyncgen_value_wrapper_tp_dealloc(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper) {
     Nuitka_GC_UnTrack((PyObject *)asyncgen_value_wrapper);
 
     Py_DECREF(asyncgen_value_wrapper->m_value);
 
-    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_value_wrappers, asyncgen_value_wrapper);
 }
 
 static int asyncgen_value_wrapper_tp_traverse(struct Nuitka_AsyncgenWrappedValueObject *asyncgen_value_wrapper,
@@ -891,8 +892,7 @@ static PyObject *Nuitka_Asyncgen_unwrap_value(struct Nuitka_AsyncgenObject *asyn
     return result;
 }
 
-static struct Nuitka_AsyncgenAsendObject *free_list_asyncgen_asends = NULL;
-static int free_list_asyncgen_asends_count = 0;
+NUITKA_DECLARE_FREE_LIST(free_list_asyncgen_asends, struct Nuitka_AsyncgenAsendObject, MAX_ASYNCGEN_FREE_LIST_COUNT)
 
 static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *asyncgen_asend) {
     Nuitka_GC_UnTrack(asyncgen_asend);
@@ -900,7 +900,7 @@ static void Nuitka_AsyncgenAsend_tp_dealloc(struct Nuitka_AsyncgenAsendObject *a
     Py_DECREF(asyncgen_asend->m_gen);
     Py_DECREF(asyncgen_asend->m_sendval);
 
-    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_asends, asyncgen_asend);
 }
 
 static int Nuitka_AsyncgenAsend_tp_traverse(struct Nuitka_AsyncgenAsendObject *asyncgen_asend, visitproc visit,
@@ -1081,8 +1081,7 @@ struct Nuitka_AsyncgenAthrowObject {
     AwaitableState m_state;
 };
 
-static struct Nuitka_AsyncgenAthrowObject *free_list_asyncgen_athrows = NULL;
-static int free_list_asyncgen_athrows_count = 0;
+NUITKA_DECLARE_FREE_LIST(free_list_asyncgen_athrows, struct Nuitka_AsyncgenAthrowObject, MAX_ASYNCGEN_FREE_LIST_COUNT)
 
 static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow) {
     Nuitka_GC_UnTrack(asyncgen_athrow);
@@ -1090,7 +1089,7 @@ static void Nuitka_AsyncgenAthrow_dealloc(struct Nuitka_AsyncgenAthrowObject *as
     Py_DECREF(asyncgen_athrow->m_gen);
     Py_XDECREF(asyncgen_athrow->m_args);
 
-    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow, MAX_ASYNCGEN_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_asyncgen_athrows, asyncgen_athrow);
 }
 
 static int Nuitka_AsyncgenAthrow_traverse(struct Nuitka_AsyncgenAthrowObject *asyncgen_athrow, visitproc visit,
@@ -20,15 +20,16 @@
 
 #include "nuitka/freelists.h"
 
+#ifndef MAX_CELL_FREE_LIST_COUNT
 #define MAX_CELL_FREE_LIST_COUNT 1000
-static struct Nuitka_CellObject *free_list_cells = NULL;
-static int free_list_cells_count = 0;
+#endif
+NUITKA_DECLARE_FREE_LIST(free_list_cells, struct Nuitka_CellObject, MAX_CELL_FREE_LIST_COUNT)
 
 static void Nuitka_Cell_tp_dealloc(struct Nuitka_CellObject *cell) {
     Nuitka_GC_UnTrack(cell);
     Py_XDECREF(cell->ob_ref);
 
-    releaseToFreeList(free_list_cells, cell, MAX_CELL_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_cells, cell);
 }
 
 #if PYTHON_VERSION < 300
@@ -1948,8 +1948,56 @@ void _initBuiltinOriginalValues() {
 // Used for threading.
 #if PYTHON_VERSION >= 300
 volatile int _Py_Ticker = _Py_CheckInterval;
+
+#if PYTHON_VERSION < 350
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <sys/time.h>
+#endif
 #endif
 
+static unsigned long getMonotonicMicroseconds(void) {
+#if PYTHON_VERSION >= 350
+    return (unsigned long)(_PyTime_GetMonotonicClock() / 1000);
+#elif defined(_WIN32)
+    return (unsigned long)GetTickCount() * 1000;
+#else
+    struct timeval now;
+    gettimeofday(&now, NULL);
+
+    return (unsigned long)now.tv_sec * 1000000 + now.tv_usec;
+#endif
+}
+
+// When we last took the GIL back from other threads.
+static unsigned long gil_acquired_time = 0;
+
+void Nuitka_NoteGILAcquired(void) { gil_acquired_time = getMonotonicMicroseconds(); }
+#else
+void Nuitka_NoteGILAcquired(void) {}
+#endif
+
+bool Nuitka_ShallReleaseGIL(PyThreadState *tstate) {
+    // Without another thread, nobody can be waiting for the GIL.
+    PyThreadState *thread_head = PyInterpreterState_ThreadHead(tstate->interp);
+
+    if (thread_head == tstate && PyThreadState_Next(thread_head) == NULL) {
+        return false;
+    }
+
+#if PYTHON_VERSION >= 300
+    // Like CPython, keep the GIL for the interval given via
+    // "sys.setswitchinterval", the flag that waiting threads use to request
+    // it is private to the interpreter.
+    if (getMonotonicMicroseconds() - gil_acquired_time < _PyEval_GetSwitchInterval()) {
+        return false;
+    }
+#endif
+
+    return true;
+}
+
 // Reverse operation mapping.
 static int const swapped_op[] = {Py_GT, Py_GE, Py_EQ, Py_NE, Py_LT, Py_LE};
 
@@ -1995,6 +2043,12 @@ void _initSlotIternext() {
 
 #include "HelpersConstantsBlob.c"
 
+#include "HelpersFreelists.c"
+
+#if _NUITKA_STATISTICS
+#include "HelpersStatistics.c"
+#endif
+
 #if _NUITKA_PROFILE
 #include "HelpersProfiling.c"
 #endif
@@ -753,8 +753,10 @@ static long Nuitka_Coroutine_tp_traverse(PyObject *coroutine, visitproc visit, v
     return 0;
 }
 
-static struct Nuitka_CoroutineWrapperObject *free_list_coro_wrappers = NULL;
-static int free_list_coro_wrappers_count = 0;
+#ifndef MAX_COROUTINE_FREE_LIST_COUNT
+#define MAX_COROUTINE_FREE_LIST_COUNT 100
+#endif
+NUITKA_DECLARE_FREE_LIST(free_list_coro_wrappers, struct Nuitka_CoroutineWrapperObject, MAX_COROUTINE_FREE_LIST_COUNT)
 
 static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine) {
 #if _DEBUG_COROUTINE
@@ -779,9 +781,7 @@ static PyObject *Nuitka_Coroutine_await(struct Nuitka_CoroutineObject *coroutine
     return (PyObject *)result;
 }
 
-#define MAX_COROUTINE_FREE_LIST_COUNT 100
-static struct Nuitka_CoroutineObject *free_list_coros = NULL;
-static int free_list_coros_count = 0;
+NUITKA_DECLARE_FREE_LIST(free_list_coros, struct Nuitka_CoroutineObject, MAX_COROUTINE_FREE_LIST_COUNT)
 
 static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine) {
     // Revive temporarily.
@@ -820,7 +820,7 @@ static void Nuitka_Coroutine_tp_dealloc(struct Nuitka_CoroutineObject *coroutine
     Py_DECREF(coroutine->m_qualname);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_coros, coroutine, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coros, coroutine);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
@@ -915,7 +915,7 @@ static void Nuitka_CoroutineWrapper_tp_dealloc(struct Nuitka_CoroutineWrapperObj
     Py_DECREF(cw->m_coroutine);
     cw->m_coroutine = NULL;
 
-    releaseToFreeList(free_list_coro_wrappers, cw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coro_wrappers, cw);
 }
 
 static PyObject *Nuitka_CoroutineWrapper_tp_iternext(struct Nuitka_CoroutineWrapperObject *cw) {
@@ -1246,8 +1246,7 @@ static int Nuitka_AIterWrapper_traverse(struct Nuitka_AIterWrapper *aw, visitpro
     return 0;
 }
 
-static struct Nuitka_AIterWrapper *free_list_coroutine_aiter_wrappers = NULL;
-static int free_list_coroutine_aiter_wrappers_count = 0;
+NUITKA_DECLARE_FREE_LIST(free_list_coroutine_aiter_wrappers, struct Nuitka_AIterWrapper, MAX_COROUTINE_FREE_LIST_COUNT)
 
 static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Nuitka_GC_UnTrack((PyObject *)aw);
@@ -1255,7 +1254,7 @@ static void Nuitka_AIterWrapper_dealloc(struct Nuitka_AIterWrapper *aw) {
     Py_DECREF(aw->aw_aiter);
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw, MAX_COROUTINE_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_coroutine_aiter_wrappers, aw);
 }
 
 static PyAsyncMethods Nuitka_AIterWrapper_as_async = {
@@ -309,9 +309,10 @@ static void Nuitka_Frame_tp_clear(struct Nuitka_FrameObject *frame) {
 
 void Nuitka_Frame_ReleaseLocals(struct Nuitka_FrameObject *frame) { Nuitka_Frame_tp_clear(frame); }
 
+#ifndef MAX_FRAME_FREE_LIST_COUNT
 #define MAX_FRAME_FREE_LIST_COUNT 100
-static struct Nuitka_FrameObject *free_list_frames = NULL;
-static int free_list_frames_count = 0;
+#endif
+NUITKA_DECLARE_FREE_LIST(free_list_frames, struct Nuitka_FrameObject, MAX_FRAME_FREE_LIST_COUNT)
 
 static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -339,7 +340,7 @@ static void Nuitka_Frame_tp_dealloc(struct Nuitka_FrameObject *nuitka_frame) {
 
     Nuitka_Frame_tp_clear(nuitka_frame);
 
-    releaseToFreeList(free_list_frames, nuitka_frame, MAX_FRAME_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_frames, nuitka_frame);
 
 #ifndef __NUITKA_NO_ASSERT__
     PyThreadState *tstate = PyThreadState_GET();
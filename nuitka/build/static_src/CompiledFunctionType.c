@@ -455,9 +455,10 @@ static PyObject *Nuitka_Function_reduce(struct Nuitka_FunctionObject *function)
     return result;
 }
 
+#ifndef MAX_FUNCTION_FREE_LIST_COUNT
 #define MAX_FUNCTION_FREE_LIST_COUNT 100
-static struct Nuitka_FunctionObject *free_list_functions = NULL;
-static int free_list_functions_count = 0;
+#endif
+NUITKA_DECLARE_FREE_LIST(free_list_functions, struct Nuitka_FunctionObject, MAX_FUNCTION_FREE_LIST_COUNT)
 
 static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
 #ifndef __NUITKA_NO_ASSERT__
@@ -499,7 +500,7 @@ static void Nuitka_Function_tp_dealloc(struct Nuitka_FunctionObject *function) {
     }
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_functions, function, MAX_FUNCTION_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_functions, function);
 
 #ifndef __NUITKA_NO_ASSERT__
     PyThreadState *tstate = PyThreadState_GET();
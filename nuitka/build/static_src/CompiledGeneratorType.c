@@ -802,9 +802,10 @@ static void Nuitka_Generator_tp_finalizer(struct Nuitka_GeneratorObject *generat
 
 #endif
 
+#ifndef MAX_GENERATOR_FREE_LIST_COUNT
 #define MAX_GENERATOR_FREE_LIST_COUNT 100
-static struct Nuitka_GeneratorObject *free_list_generators = NULL;
-static int free_list_generators_count = 0;
+#endif
+NUITKA_DECLARE_FREE_LIST(free_list_generators, struct Nuitka_GeneratorObject, MAX_GENERATOR_FREE_LIST_COUNT)
 
 static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator) {
     // Revive temporarily.
@@ -854,7 +855,7 @@ static void Nuitka_Generator_tp_dealloc(struct Nuitka_GeneratorObject *generator
 #endif
 
     /* Put the object into freelist or release to GC */
-    releaseToFreeList(free_list_generators, generator, MAX_GENERATOR_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_generators, generator);
 
     RESTORE_ERROR_OCCURRED(save_exception_type, save_exception_value, save_exception_tb);
 }
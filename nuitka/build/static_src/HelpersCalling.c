@@ -152,6 +152,8 @@ static PyObject *_fast_function_noargs(PyObject *func) {
 PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called) {
     CHECK_OBJECT(called);
 
+    NUITKA_STATISTICS_CALL(called);
+
     if (Nuitka_Function_Check(called)) {
         if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
             return NULL;
@@ -232,7 +234,7 @@ PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called) {
         return _fast_function_noargs(called);
     }
 
-    return CALL_FUNCTION(called, const_tuple_empty, NULL);
+    return _CALL_FUNCTION(called, const_tuple_empty, NULL);
 }
 
 PyObject *CALL_METHOD_WITH_POSARGS(PyObject *source, PyObject *attribute, PyObject *positional_args) {
@@ -267,6 +269,8 @@ PyObject *CALL_METHOD_WITH_POSARGS(PyObject *source, PyObject *attribute, PyObje
             descrgetfunc descr_get = Py_TYPE(called_object)->tp_descr_get;
 
             if (descr_get == Nuitka_Function_Type.tp_descr_get) {
+                NUITKA_STATISTICS_CALL(called_object);
+
                 return Nuitka_CallMethodFunctionPosArgs((struct Nuitka_FunctionObject const *)called_object, source,
                                                         &PyTuple_GET_ITEM(positional_args, 0),
                                                         PyTuple_GET_SIZE(positional_args));
@@ -413,6 +417,8 @@ PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attr_name) {
 
         if (func != NULL) {
             if (func == Nuitka_Function_Type.tp_descr_get) {
+                NUITKA_STATISTICS_CALL(descr);
+
                 PyObject *result = Nuitka_CallMethodFunctionNoArgs((struct Nuitka_FunctionObject const *)descr, source);
 
                 Py_DECREF(descr);
@@ -476,6 +482,8 @@ PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attr_name) {
             descrgetfunc descr_get = Py_TYPE(called_object)->tp_descr_get;
 
             if (descr_get == Nuitka_Function_Type.tp_descr_get) {
+                NUITKA_STATISTICS_CALL(called_object);
+
                 return Nuitka_CallMethodFunctionNoArgs((struct Nuitka_FunctionObject const *)called_object, source);
             } else if (descr_get != NULL) {
                 PyObject *method = descr_get(called_object, source, (PyObject *)source_instance->in_class);
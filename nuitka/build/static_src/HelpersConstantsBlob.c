@@ -46,3 +46,431 @@ void loadConstantsResource() {
     assert(constant_bin);
 }
 #endif
+
+#if defined(_NUITKA_CONSTANTS_COMPRESSED)
+
+/* The compressed blob starts with the uncompressed size, the chunk size, the
+ * number of chunks, and the offsets of the chunks plus their end, all as 32
+ * bit little endian values, followed by the chunks in raw "deflate" format,
+ * see "BlobCodes.py" for how it is created.
+ *
+ * The uncompressed blob is allocated as a whole, so ranges spanning chunks
+ * are contiguous, but only the touched chunks get decompressed, so pages of
+ * the others are never used.
+ *
+ * This must not use the Python API, as the frozen modules are taken from it
+ * before Python is initialized.
+ */
+
+static unsigned char *constants_blob = NULL;
+static unsigned char *constants_blob_chunk_done = NULL;
+static size_t constants_blob_size;
+static size_t constants_blob_chunk_size;
+static size_t constants_blob_chunk_count;
+static unsigned char const *constants_blob_chunk_offsets;
+static unsigned char const *constants_blob_chunks;
+
+static size_t readBlobUInt32(unsigned char const *buffer) {
+    return (size_t)buffer[0] | ((size_t)buffer[1] << 8) | ((size_t)buffer[2] << 16) | ((size_t)buffer[3] << 24);
+}
+
+static void constantsBlobError(char const *message) {
+    fprintf(stderr, "Error, constants blob is corrupt: %s\n", message);
+    abort();
+}
+
+// Decompressor for the raw "deflate" format, RFC 1951. Short codes are decoded
+// with a lookup table, longer ones bit by bit.
+
+struct InflateState {
+    unsigned char const *source;
+    unsigned char const *source_end;
+    unsigned long bit_buffer;
+    unsigned int bit_count;
+
+    unsigned char *dest_start;
+    unsigned char *dest;
+    unsigned char *dest_end;
+};
+
+#define INFLATE_FAST_BITS 9
+
+struct InflateHuffman {
+    unsigned short counts[16];
+    unsigned short symbols[288];
+
+    // Indexed by the next bits of input, symbol and code length, or 0.
+    unsigned short fast[1 << INFLATE_FAST_BITS];
+};
+
+static unsigned int inflateBits(struct InflateState *state, unsigned int count) {
+    unsigned long value = state->bit_buffer;
+
+    while (state->bit_count < count) {
+        if (unlikely(state->source == state->source_end)) {
+            constantsBlobError("compressed data ends early");
+        }
+
+        value |= (unsigned long)(*state->source++) << state->bit_count;
+        state->bit_count += 8;
+    }
+
+    state->bit_buffer = value >> count;
+    state->bit_count -= count;
+
+    return (unsigned int)(value & ((1UL << count) - 1));
+}
+
+static void inflateBuildHuffman(struct InflateHuffman *huffman, unsigned char const *lengths, unsigned int count) {
+    unsigned short offsets[16];
+
+    memset(huffman->counts, 0, sizeof(huffman->counts));
+
+    for (unsigned int i = 0; i < count; i++) {
+        huffman->counts[lengths[i]] += 1;
+    }
+    huffman->counts[0] = 0;
+
+    offsets[1] = 0;
+    for (unsigned int i = 1; i < 15; i++) {
+        offsets[i + 1] = offsets[i] + huffman->counts[i];
+    }
+
+    for (unsigned int i = 0; i < count; i++) {
+        if (lengths[i] != 0) {
+            huffman->symbols[offsets[lengths[i]]++] = (unsigned short)i;
+        }
+    }
+
+    // Codes are assigned in order of length and symbol, but stored with the
+    // first bit lowest, so they are reversed for the lookup table.
+    memset(huffman->fast, 0, sizeof(huffman->fast));
+
+    unsigned int code = 0;
+    unsigned int index = 0;
+
+    for (unsigned int length = 1; length <= INFLATE_FAST_BITS; length++) {
+        for (unsigned int i = 0; i < huffman->counts[length]; i++) {
+            unsigned int reversed = 0;
+
+            for (unsigned int bit = 0; bit < length; bit++) {
+                reversed |= ((code >> bit) & 1) << (length - 1 - bit);
+            }
+
+            for (unsigned int fill = reversed; fill < (1 << INFLATE_FAST_BITS); fill += 1 << length) {
+                huffman->fast[fill] = (unsigned short)(huffman->symbols[index] | (length << 12));
+            }
+
+            code += 1;
+            index += 1;
+        }
+
+        code <<= 1;
+    }
+}
+
+static unsigned int inflateDecode(struct InflateState *state, struct InflateHuffman const *huffman) {
+    while (state->bit_count < INFLATE_FAST_BITS && state->source != state->source_end) {
+        state->bit_buffer |= (unsigned long)(*state->source++) << state->bit_count;
+        state->bit_count += 8;
+    }
+
+    unsigned int entry = huffman->fast[state->bit_buffer & ((1 << INFLATE_FAST_BITS) - 1)];
+
+    if (entry != 0 && (entry >> 12) <= state->bit_count) {
+        state->bit_buffer >>= entry >> 12;
+        state->bit_count -= entry >> 12;
+
+        return entry & 0x1ff;
+    }
+
+    // Codes are canonical, so decoding a bit at a time, only counts are needed.
+    int code = 0;
+    int first = 0;
+    int index = 0;
+
+    for (unsigned int length = 1; length < 16; length++) {
+        code |= (int)inflateBits(state, 1);
+
+        int count = huffman->counts[length];
+
+        if (code - count < first) {
+            return huffman->symbols[index + (code - first)];
+        }
+
+        index += count;
+        first += count;
+        first <<= 1;
+        code <<= 1;
+    }
+
+    constantsBlobError("invalid huffman code");
+    return 0;
+}
+
+static unsigned short const inflate_length_base[29] = {3,  4,  5,  6,  7,  8,  9,  10, 11,  13,  15,  17,  19,  23, 27,
+                                                       31, 35, 43, 51, 59, 67, 83, 99, 115, 131, 163, 195, 227, 258};
+static unsigned char const inflate_length_extra[29] = {0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2,
+                                                       2, 3, 3, 3, 3, 4, 4, 4, 4, 5, 5, 5, 5, 0};
+static unsigned short const inflate_distance_base[30] = {1,    2,    3,    4,    5,    7,     9,     13,    17,  25,
+                                                         33,   49,   65,   97,   129,  193,   257,   385,   513, 769,
+                                                         1025, 1537, 2049, 3073, 4097, 6145, 8193, 12289, 16385, 24577};
+static unsigned char const inflate_distance_extra[30] = {0, 0, 0, 0, 1, 1, 2, 2,  3,  3,  4,  4,  5,  5,  6,
+                                                         6, 7, 7, 8, 8, 9, 9, 10, 10, 11, 11, 12, 12, 13, 13};
+
+static void inflateCodes(struct InflateState *state, struct InflateHuffman const *lengths,
+                         struct InflateHuffman const *distances) {
+    for (;;) {
+        unsigned int symbol = inflateDecode(state, lengths);
+
+        if (symbol < 256) {
+            if (unlikely(state->dest == state->dest_end)) {
+                constantsBlobError("decompressed data too large");
+            }
+
+            *state->dest++ = (unsigned char)symbol;
+        } else if (symbol == 256) {
+            return;
+        } else {
+            symbol -= 257;
+
+            if (unlikely(symbol >= 29)) {
+                constantsBlobError("invalid length code");
+            }
+
+            size_t length = inflate_length_base[symbol] + inflateBits(state, inflate_length_extra[symbol]);
+
+            symbol = inflateDecode(state, distances);
+
+            if (unlikely(symbol >= 30)) {
+                constantsBlobError("invalid distance code");
+            }
+
+            size_t distance = inflate_distance_base[symbol] + inflateBits(state, inflate_distance_extra[symbol]);
+
+            if (unlikely(distance > (size_t)(state->dest - state->dest_start) ||
+                         length > (size_t)(state->dest_end - state->dest))) {
+                constantsBlobError("invalid back reference");
+            }
+
+            unsigned char const *from = state->dest - distance;
+
+            // Overlapping copies repeat the data, "memcpy" cannot do that.
+            if (distance >= length) {
+                memcpy(state->dest, from, length);
+                state->dest += length;
+            } else {
+                while (length--) {
+                    *state->dest++ = *from++;
+                }
+            }
+        }
+    }
+}
+
+static void inflateFixed(struct InflateState *state) {
+    static struct InflateHuffman lengths, distances;
+    static bool init_done = false;
+
+    if (init_done == false) {
+        unsigned char code_lengths[288];
+        unsigned int i;
+
+        for (i = 0; i < 144; i++) {
+            code_lengths[i] = 8;
+        }
+        for (; i < 256; i++) {
+            code_lengths[i] = 9;
+        }
+        for (; i < 280; i++) {
+            code_lengths[i] = 7;
+        }
+        for (; i < 288; i++) {
+            code_lengths[i] = 8;
+        }
+        inflateBuildHuffman(&lengths, code_lengths, 288);
+
+        for (i = 0; i < 30; i++) {
+            code_lengths[i] = 5;
+        }
+        inflateBuildHuffman(&distances, code_lengths, 30);
+
+        init_done = true;
+    }
+
+    inflateCodes(state, &lengths, &distances);
+}
+
+static void inflateDynamic(struct InflateState *state) {
+    static unsigned char const order[19] = {16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15};
+
+    struct InflateHuffman lengths, distances;
+    unsigned char code_lengths[288 + 32];
+
+    unsigned int length_count = inflateBits(state, 5) + 257;
+    unsigned int distance_count = inflateBits(state, 5) + 1;
+    unsigned int code_count = inflateBits(state, 4) + 4;
+
+    if (unlikely(length_count > 286 || distance_count > 30)) {
+        constantsBlobError("invalid dynamic block");
+    }
+
+    memset(code_lengths, 0, sizeof(code_lengths));
+
+    for (unsigned int i = 0; i < code_count; i++) {
+        code_lengths[order[i]] = (unsigned char)inflateBits(state, 3);
+    }
+
+    inflateBuildHuffman(&lengths, code_lengths, 19);
+
+    unsigned int index = 0;
+
+    while (index < length_count + distance_count) {
+        unsigned int symbol = inflateDecode(state, &lengths);
+
+        if (symbol < 16) {
+            code_lengths[index++] = (unsigned char)symbol;
+        } else {
+            unsigned char value = 0;
+            unsigned int repeat;
+
+            if (symbol == 16) {
+                if (unlikely(index == 0)) {
+                    constantsBlobError("invalid dynamic block");
+                }
+
+                value = code_lengths[index - 1];
+                repeat = 3 + inflateBits(state, 2);
+            } else if (symbol == 17) {
+                repeat = 3 + inflateBits(state, 3);
+            } else {
+                repeat = 11 + inflateBits(state, 7);
+            }
+
+            if (unlikely(index + repeat > length_count + distance_count)) {
+                constantsBlobError("invalid dynamic block");
+            }
+
+            while (repeat--) {
+                code_lengths[index++] = value;
+            }
+        }
+    }
+
+    inflateBuildHuffman(&lengths, code_lengths, length_count);
+    inflateBuildHuffman(&distances, code_lengths + length_count, distance_count);
+
+    inflateCodes(state, &lengths, &distances);
+}
+
+static void inflateStored(struct InflateState *state) {
+    // Stored blocks start at a byte boundary, and whole bytes read ahead for
+    // decoding belong to it.
+    state->source -= state->bit_count / 8;
+    state->bit_buffer = 0;
+    state->bit_count = 0;
+
+    if (unlikely(state->source_end - state->source < 4)) {
+        constantsBlobError("compressed data ends early");
+    }
+
+    size_t length = state->source[0] | (state->source[1] << 8);
+    state->source += 4;
+
+    if (unlikely((size_t)(state->source_end - state->source) < length ||
+                 (size_t)(state->dest_end - state->dest) < length)) {
+        constantsBlobError("invalid stored block");
+    }
+
+    memcpy(state->dest, state->source, length);
+    state->source += length;
+    state->dest += length;
+}
+
+static void inflateChunk(unsigned char *dest, size_t dest_size, unsigned char const *source, size_t source_size) {
+    struct InflateState state;
+
+    state.source = source;
+    state.source_end = source + source_size;
+    state.bit_buffer = 0;
+    state.bit_count = 0;
+    state.dest_start = dest;
+    state.dest = dest;
+    state.dest_end = dest + dest_size;
+
+    unsigned int last;
+
+    do {
+        last = inflateBits(&state, 1);
+
+        switch (inflateBits(&state, 2)) {
+        case 0:
+            inflateStored(&state);
+            break;
+        case 1:
+            inflateFixed(&state);
+            break;
+        case 2:
+            inflateDynamic(&state);
+            break;
+        default:
+            constantsBlobError("invalid block type");
+        }
+    } while (!last);
+
+    if (unlikely(state.dest != state.dest_end)) {
+        constantsBlobError("decompressed data too small");
+    }
+}
+
+static void initConstantsBlob(void) {
+    constants_blob_size = readBlobUInt32(&constant_bin[0]);
+    constants_blob_chunk_size = readBlobUInt32(&constant_bin[4]);
+    constants_blob_chunk_count = readBlobUInt32(&constant_bin[8]);
+    constants_blob_chunk_offsets = &constant_bin[12];
+    constants_blob_chunks = constants_blob_chunk_offsets + 4 * (constants_blob_chunk_count + 1);
+
+    constants_blob = (unsigned char *)malloc(constants_blob_size + 1);
+    constants_blob_chunk_done = (unsigned char *)calloc(constants_blob_chunk_count + 1, 1);
+
+    if (unlikely(constants_blob == NULL || constants_blob_chunk_done == NULL)) {
+        fprintf(stderr, "Error, cannot allocate memory for constants blob.\n");
+        abort();
+    }
+}
+
+unsigned char const *getConstantsBlobRange(size_t offset, size_t size) {
+    if (unlikely(constants_blob == NULL)) {
+        initConstantsBlob();
+    }
+
+    if (size != 0) {
+        size_t last_chunk = (offset + size - 1) / constants_blob_chunk_size;
+
+        if (unlikely(last_chunk >= constants_blob_chunk_count)) {
+            constantsBlobError("range outside of data");
+        }
+
+        for (size_t chunk = offset / constants_blob_chunk_size; chunk <= last_chunk; chunk++) {
+            if (constants_blob_chunk_done[chunk] == 0) {
+                size_t start = readBlobUInt32(constants_blob_chunk_offsets + 4 * chunk);
+                size_t end = readBlobUInt32(constants_blob_chunk_offsets + 4 * (chunk + 1));
+
+                size_t chunk_start = chunk * constants_blob_chunk_size;
+                size_t chunk_size = constants_blob_size - chunk_start;
+
+                if (chunk_size > constants_blob_chunk_size) {
+                    chunk_size = constants_blob_chunk_size;
+                }
+
+                inflateChunk(constants_blob + chunk_start, chunk_size, constants_blob_chunks + start, end - start);
+
+                constants_blob_chunk_done[chunk] = 1;
+            }
+        }
+    }
+
+    return constants_blob + offset;
+}
+
+#endif
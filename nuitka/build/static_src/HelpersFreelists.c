@@ -0,0 +1,103 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for reporting the usage of the free lists of compiled
+ * types, so their sizes can be tuned with data.
+ */
+
+#include "nuitka/freelists.h"
+
+extern struct Nuitka_FreeListInfo free_list_cells_info;
+extern struct Nuitka_FreeListInfo free_list_functions_info;
+extern struct Nuitka_FreeListInfo free_list_methods_info;
+extern struct Nuitka_FreeListInfo free_list_generators_info;
+extern struct Nuitka_FreeListInfo free_list_frames_info;
+extern struct Nuitka_FreeListInfo free_list_tracebacks_info;
+#if PYTHON_VERSION >= 350
+extern struct Nuitka_FreeListInfo free_list_coros_info;
+extern struct Nuitka_FreeListInfo free_list_coro_wrappers_info;
+extern struct Nuitka_FreeListInfo free_list_coroutine_aiter_wrappers_info;
+#endif
+#if PYTHON_VERSION >= 360
+extern struct Nuitka_FreeListInfo free_list_asyncgens_info;
+extern struct Nuitka_FreeListInfo free_list_asyncgen_value_wrappers_info;
+extern struct Nuitka_FreeListInfo free_list_asyncgen_asends_info;
+extern struct Nuitka_FreeListInfo free_list_asyncgen_athrows_info;
+#endif
+
+static struct Nuitka_FreeListInfo *free_list_infos[] = {&free_list_cells_info,
+                                                        &free_list_functions_info,
+                                                        &free_list_methods_info,
+                                                        &free_list_generators_info,
+                                                        &free_list_frames_info,
+                                                        &free_list_tracebacks_info,
+#if PYTHON_VERSION >= 350
+                                                        &free_list_coros_info,
+                                                        &free_list_coro_wrappers_info,
+                                                        &free_list_coroutine_aiter_wrappers_info,
+#endif
+#if PYTHON_VERSION >= 360
+                                                        &free_list_asyncgens_info,
+                                                        &free_list_asyncgen_value_wrappers_info,
+                                                        &free_list_asyncgen_asends_info,
+                                                        &free_list_asyncgen_athrows_info,
+#endif
+                                                        NULL};
+
+static void setFreeListStatisticsItem(PyObject *dict, char const *name, PyObject *value) {
+    PyDict_SetItemString(dict, name, value);
+    Py_DECREF(value);
+}
+
+PyObject *Nuitka_GetFreeListStatistics(void) {
+    PyObject *result = PyDict_New();
+
+    for (struct Nuitka_FreeListInfo **current = free_list_infos; *current != NULL; current++) {
+        struct Nuitka_FreeListInfo *info = *current;
+
+        PyObject *item = PyDict_New();
+
+        setFreeListStatisticsItem(item, "count", PyInt_FromLong(*info->count));
+        setFreeListStatisticsItem(item, "max_count", PyInt_FromLong(info->max_count));
+        setFreeListStatisticsItem(item, "hits", PyLong_FromUnsignedLong(info->hits));
+        setFreeListStatisticsItem(item, "misses", PyLong_FromUnsignedLong(info->misses));
+        setFreeListStatisticsItem(item, "discards", PyLong_FromUnsignedLong(info->discards));
+
+        // Report without the "free_list_" prefix of the C names.
+        setFreeListStatisticsItem(result, info->name + strlen("free_list_"), item);
+    }
+
+    return result;
+}
+
+#if _NUITKA_FREELIST_STATISTICS
+
+static PyObject *_nuitka_freelist_statistics(PyObject *self, PyObject *args) { return Nuitka_GetFreeListStatistics(); }
+
+static PyMethodDef _method_def_freelist_statistics = {"_nuitka_freelist_statistics",
+                                                      (PyCFunction)_nuitka_freelist_statistics, METH_NOARGS, NULL};
+
+void _initFreeListStatistics(void) {
+    PyObject *function = PyCFunction_New(&_method_def_freelist_statistics, NULL);
+    CHECK_OBJECT(function);
+
+    PySys_SetObject((char *)"_nuitka_freelist_statistics", function);
+    Py_DECREF(function);
+}
+
+#endif
@@ -143,6 +143,174 @@ PyObject *IMPORT_MODULE5(PyObject *module_name, PyObject *globals, PyObject *loc
     return import_result;
 }
 
+// Proxy for a module variable that is imported on first attribute access, as
+// created by "IMPORT_MODULE_LAZY".
+struct Nuitka_LazyModuleObject {
+    PyObject_HEAD
+
+        // The module variable name it is assigned to.
+        PyObject *m_variable_name;
+
+    // The arguments for "__import__", some of which can be NULL.
+    PyObject *m_module_name;
+    PyObject *m_globals;
+    PyObject *m_locals;
+    PyObject *m_import_items;
+    PyObject *m_level;
+
+    // The imported module, once it was imported.
+    PyObject *m_module;
+};
+
+static void Nuitka_LazyModule_tp_dealloc(struct Nuitka_LazyModuleObject *lazy_module) {
+    Py_DECREF(lazy_module->m_variable_name);
+    Py_DECREF(lazy_module->m_module_name);
+    Py_XDECREF(lazy_module->m_globals);
+    Py_XDECREF(lazy_module->m_locals);
+    Py_XDECREF(lazy_module->m_import_items);
+    Py_XDECREF(lazy_module->m_level);
+    Py_XDECREF(lazy_module->m_module);
+
+    PyObject_Del(lazy_module);
+}
+
+// Returns a new reference to the module, importing it if not done yet. The
+// proxy may be released by this, as it replaces itself in the module dict.
+static PyObject *RESOLVE_LAZY_MODULE(struct Nuitka_LazyModuleObject *lazy_module) {
+    PyObject *module = lazy_module->m_module;
+
+    if (module != NULL) {
+        Py_INCREF(module);
+        return module;
+    }
+
+    module = IMPORT_MODULE_KW(lazy_module->m_module_name, lazy_module->m_globals, lazy_module->m_locals,
+                              lazy_module->m_import_items, lazy_module->m_level);
+
+    if (unlikely(module == NULL)) {
+        return NULL;
+    }
+
+    lazy_module->m_module = module;
+    Py_INCREF(module);
+
+    // Later uses of the module variable should not pay for the proxy.
+    PyObject *globals = lazy_module->m_globals;
+
+    if (globals != NULL && PyDict_Check(globals) &&
+        PyDict_GetItem(globals, lazy_module->m_variable_name) == (PyObject *)lazy_module) {
+        Py_INCREF(globals);
+        int res = PyDict_SetItem(globals, lazy_module->m_variable_name, module);
+        Py_DECREF(globals);
+
+        if (unlikely(res != 0)) {
+            Py_DECREF(module);
+            return NULL;
+        }
+    }
+
+    return module;
+}
+
+static PyObject *Nuitka_LazyModule_tp_getattro(struct Nuitka_LazyModuleObject *lazy_module, PyObject *attr_name) {
+    PyObject *module = RESOLVE_LAZY_MODULE(lazy_module);
+
+    if (unlikely(module == NULL)) {
+        return NULL;
+    }
+
+    PyObject *result = PyObject_GetAttr(module, attr_name);
+    Py_DECREF(module);
+
+    return result;
+}
+
+static int Nuitka_LazyModule_tp_setattro(struct Nuitka_LazyModuleObject *lazy_module, PyObject *attr_name,
+                                         PyObject *value) {
+    PyObject *module = RESOLVE_LAZY_MODULE(lazy_module);
+
+    if (unlikely(module == NULL)) {
+        return -1;
+    }
+
+    int result = PyObject_SetAttr(module, attr_name, value);
+    Py_DECREF(module);
+
+    return result;
+}
+
+static PyObject *Nuitka_LazyModule_tp_repr(struct Nuitka_LazyModuleObject *lazy_module) {
+    if (lazy_module->m_module != NULL) {
+        return PyObject_Repr(lazy_module->m_module);
+    }
+
+#if PYTHON_VERSION < 300
+    return PyString_FromFormat("<lazy module '%s'>", Nuitka_String_AsString(lazy_module->m_module_name));
+#else
+    return PyUnicode_FromFormat("<lazy module %R>", lazy_module->m_module_name);
+#endif
+}
+
+static PyTypeObject Nuitka_LazyModule_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0) "lazy_module",
+    sizeof(struct Nuitka_LazyModuleObject),
+    0,
+    (destructor)Nuitka_LazyModule_tp_dealloc,    /* tp_dealloc */
+    0,                                           /* tp_print */
+    0,                                           /* tp_getattr */
+    0,                                           /* tp_setattr */
+    0,                                           /* tp_compare */
+    (reprfunc)Nuitka_LazyModule_tp_repr,         /* tp_repr */
+    0,                                           /* tp_as_number */
+    0,                                           /* tp_as_sequence */
+    0,                                           /* tp_as_mapping */
+    0,                                           /* tp_hash */
+    0,                                           /* tp_call */
+    0,                                           /* tp_str */
+    (getattrofunc)Nuitka_LazyModule_tp_getattro, /* tp_getattro */
+    (setattrofunc)Nuitka_LazyModule_tp_setattro, /* tp_setattro */
+    0,                                           /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT,                          /* tp_flags */
+};
+
+PyObject *IMPORT_MODULE_LAZY(PyObject *variable_name, PyObject *module_name, PyObject *globals, PyObject *locals,
+                             PyObject *import_items, PyObject *level) {
+    CHECK_OBJECT(variable_name);
+    CHECK_OBJECT(module_name);
+
+    static bool init_done = false;
+
+    if (init_done == false) {
+        if (unlikely(PyType_Ready(&Nuitka_LazyModule_Type) < 0)) {
+            return NULL;
+        }
+
+        init_done = true;
+    }
+
+    struct Nuitka_LazyModuleObject *result = PyObject_New(struct Nuitka_LazyModuleObject, &Nuitka_LazyModule_Type);
+
+    if (unlikely(result == NULL)) {
+        return NULL;
+    }
+
+    result->m_variable_name = variable_name;
+    Py_INCREF(variable_name);
+    result->m_module_name = module_name;
+    Py_INCREF(module_name);
+    result->m_globals = globals;
+    Py_XINCREF(globals);
+    result->m_locals = locals;
+    Py_XINCREF(locals);
+    result->m_import_items = import_items;
+    Py_XINCREF(import_items);
+    result->m_level = level;
+    Py_XINCREF(level);
+    result->m_module = NULL;
+
+    return (PyObject *)result;
+}
+
 extern PyObject *const_str_plain___all__;
 
 bool IMPORT_MODULE_STAR(PyObject *target, bool is_module, PyObject *module) {
@@ -0,0 +1,303 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/**
+ * This is responsible for the "__nuitka_stats__" module, which reports run
+ * time statistics of the compiled program, so it can be checked, how much
+ * of the compiled code takes fast paths.
+ */
+
+#if _NUITKA_STATISTICS
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <sys/time.h>
+#endif
+
+struct Nuitka_RuntimeStatistics nuitka_statistics = {0, 0, 0, 0};
+
+static struct Nuitka_StatisticsCounter *fallback_counters = NULL;
+
+void Nuitka_Statistics_CountCall(PyObject *called) {
+    if (Nuitka_Function_Check(called) || Nuitka_Method_Check(called)) {
+        nuitka_statistics.calls_compiled += 1;
+    } else {
+        nuitka_statistics.calls_uncompiled += 1;
+    }
+}
+
+void Nuitka_Statistics_RegisterCounter(struct Nuitka_StatisticsCounter *counter) {
+    counter->next = fallback_counters;
+    fallback_counters = counter;
+}
+
+double Nuitka_Statistics_GetTime(void) {
+#ifdef _WIN32
+    LARGE_INTEGER frequency, counter;
+
+    QueryPerformanceFrequency(&frequency);
+    QueryPerformanceCounter(&counter);
+
+    return (double)counter.QuadPart / (double)frequency.QuadPart;
+#else
+    struct timeval now;
+
+    gettimeofday(&now, NULL);
+
+    return now.tv_sec + now.tv_usec / 1000000.0;
+#endif
+}
+
+// Module name to seconds spent, including the modules it imported itself.
+static PyObject *import_times = NULL;
+
+// Module name to the name of the module that was being imported, when it got
+// imported, or "None" for the ones imported from outside of any import.
+static PyObject *import_parents = NULL;
+
+// The modules currently being imported, innermost last.
+#define NUITKA_MAX_IMPORT_DEPTH 256
+static char const *import_stack[NUITKA_MAX_IMPORT_DEPTH];
+static int import_depth = 0;
+
+double Nuitka_Statistics_StartImport(char const *name) {
+    if (import_depth < NUITKA_MAX_IMPORT_DEPTH) {
+        import_stack[import_depth] = name;
+    }
+
+    import_depth += 1;
+
+    return Nuitka_Statistics_GetTime();
+}
+
+void Nuitka_Statistics_EndImport(char const *name, double import_start) {
+    double seconds = Nuitka_Statistics_GetTime() - import_start;
+
+    import_depth -= 1;
+
+    if (import_times == NULL) {
+        import_times = PyDict_New();
+        import_parents = PyDict_New();
+    }
+
+    PyObject *value = PyFloat_FromDouble(seconds);
+    PyDict_SetItemString(import_times, name, value);
+    Py_DECREF(value);
+
+    if (import_depth > 0 && import_depth <= NUITKA_MAX_IMPORT_DEPTH) {
+#if PYTHON_VERSION < 300
+        value = PyString_FromString(import_stack[import_depth - 1]);
+#else
+        value = PyUnicode_FromString(import_stack[import_depth - 1]);
+#endif
+    } else {
+        value = Py_None;
+        Py_INCREF(value);
+    }
+
+    PyDict_SetItemString(import_parents, name, value);
+    Py_DECREF(value);
+}
+
+void Nuitka_Statistics_WriteImportTimes(void) {
+    char const *filename = getenv("NUITKA_IMPORT_TIMES");
+
+    if (filename == NULL || import_times == NULL) {
+        return;
+    }
+
+    FILE *output = fopen(filename, "w");
+
+    if (output == NULL) {
+        return;
+    }
+
+    // Module names need no escaping, and this must not touch the exception
+    // that may be pending from the main module.
+    fprintf(output, "{");
+
+    Py_ssize_t pos = 0;
+    PyObject *key, *value;
+    bool first = true;
+
+    while (PyDict_Next(import_times, &pos, &key, &value)) {
+        PyObject *parent = PyDict_GetItem(import_parents, key);
+
+        fprintf(output, "%s\n  \"%s\": {\"seconds\": %.9f, \"parent\": ", first ? "" : ",",
+                Nuitka_String_AsString(key), PyFloat_AS_DOUBLE(value));
+
+        if (parent == NULL || parent == Py_None) {
+            fprintf(output, "null}");
+        } else {
+            fprintf(output, "\"%s\"}", Nuitka_String_AsString(parent));
+        }
+
+        first = false;
+    }
+
+    fprintf(output, "\n}\n");
+    fclose(output);
+}
+
+// Startup phases in order, with the time they were done. These are recorded
+// from before the interpreter exists, so no Python objects are used.
+#define NUITKA_MAX_STARTUP_PHASES 16
+static char const *startup_phase_names[NUITKA_MAX_STARTUP_PHASES];
+static double startup_phase_times[NUITKA_MAX_STARTUP_PHASES];
+static int startup_phase_count = 0;
+static double startup_start_time = 0.0;
+
+void Nuitka_Statistics_StartupBegin(void) { startup_start_time = Nuitka_Statistics_GetTime(); }
+
+void Nuitka_Statistics_StartupPhaseDone(char const *name) {
+    if (startup_phase_count < NUITKA_MAX_STARTUP_PHASES) {
+        startup_phase_names[startup_phase_count] = name;
+        startup_phase_times[startup_phase_count] = Nuitka_Statistics_GetTime();
+
+        startup_phase_count += 1;
+    }
+}
+
+static double getStartupPhaseSeconds(int index) {
+    double previous = index == 0 ? startup_start_time : startup_phase_times[index - 1];
+
+    return startup_phase_times[index] - previous;
+}
+
+void Nuitka_Statistics_WriteStartupTimes(void) {
+    char const *filename = getenv("NUITKA_STARTUP_TIMES");
+
+    if (filename == NULL) {
+        return;
+    }
+
+    FILE *output = fopen(filename, "w");
+
+    if (output == NULL) {
+        return;
+    }
+
+    fprintf(output, "[");
+
+    for (int i = 0; i < startup_phase_count; i++) {
+        fprintf(output, "%s\n  {\"phase\": \"%s\", \"seconds\": %.9f}", i == 0 ? "" : ",", startup_phase_names[i],
+                getStartupPhaseSeconds(i));
+    }
+
+    fprintf(output, "\n]\n");
+    fclose(output);
+}
+
+static void setStatisticsItem(PyObject *dict, char const *name, PyObject *value) {
+    PyDict_SetItemString(dict, name, value);
+    Py_DECREF(value);
+}
+
+static PyObject *_nuitka_stats_freelists(PyObject *self, PyObject *args) { return Nuitka_GetFreeListStatistics(); }
+
+static PyObject *_nuitka_stats_frames(PyObject *self, PyObject *args) {
+    PyObject *result = PyDict_New();
+
+    setStatisticsItem(result, "reused", PyLong_FromUnsignedLong(nuitka_statistics.frames_reused));
+    setStatisticsItem(result, "created", PyLong_FromUnsignedLong(nuitka_statistics.frames_created));
+
+    return result;
+}
+
+static PyObject *_nuitka_stats_calls(PyObject *self, PyObject *args) {
+    PyObject *result = PyDict_New();
+
+    setStatisticsItem(result, "compiled", PyLong_FromUnsignedLong(nuitka_statistics.calls_compiled));
+    setStatisticsItem(result, "uncompiled", PyLong_FromUnsignedLong(nuitka_statistics.calls_uncompiled));
+
+    return result;
+}
+
+static PyObject *_nuitka_stats_fallbacks(PyObject *self, PyObject *args) {
+    PyObject *result = PyDict_New();
+
+    // The same helper can be used in many places, each of which has its own
+    // counter, so sum them up.
+    for (struct Nuitka_StatisticsCounter *counter = fallback_counters; counter != NULL; counter = counter->next) {
+        unsigned long count = counter->count;
+
+        PyObject *old = PyDict_GetItemString(result, counter->name);
+        if (old != NULL) {
+            count += PyLong_AsUnsignedLong(old);
+        }
+
+        setStatisticsItem(result, counter->name, PyLong_FromUnsignedLong(count));
+    }
+
+    return result;
+}
+
+static PyObject *_nuitka_stats_import_times(PyObject *self, PyObject *args) {
+    if (import_times == NULL) {
+        return PyDict_New();
+    }
+
+    return PyDict_Copy(import_times);
+}
+
+static PyObject *_nuitka_stats_import_parents(PyObject *self, PyObject *args) {
+    if (import_parents == NULL) {
+        return PyDict_New();
+    }
+
+    return PyDict_Copy(import_parents);
+}
+
+static PyObject *_nuitka_stats_startup_phases(PyObject *self, PyObject *args) {
+    PyObject *result = PyList_New(startup_phase_count);
+
+    for (int i = 0; i < startup_phase_count; i++) {
+        PyObject *phase = Py_BuildValue("(sd)", startup_phase_names[i], getStartupPhaseSeconds(i));
+
+        PyList_SET_ITEM(result, i, phase);
+    }
+
+    return result;
+}
+
+static PyMethodDef _nuitka_stats_methods[] = {{"freelists", (PyCFunction)_nuitka_stats_freelists, METH_NOARGS, NULL},
+                                              {"frames", (PyCFunction)_nuitka_stats_frames, METH_NOARGS, NULL},
+                                              {"calls", (PyCFunction)_nuitka_stats_calls, METH_NOARGS, NULL},
+                                              {"fallbacks", (PyCFunction)_nuitka_stats_fallbacks, METH_NOARGS, NULL},
+                                              {"import_times", (PyCFunction)_nuitka_stats_import_times,
+                                               METH_NOARGS, NULL},
+                                              {"import_parents", (PyCFunction)_nuitka_stats_import_parents,
+                                               METH_NOARGS, NULL},
+                                              {"startup_phases", (PyCFunction)_nuitka_stats_startup_phases,
+                                               METH_NOARGS, NULL},
+                                              {NULL, NULL, 0, NULL}};
+
+void _initRuntimeStatistics(void) {
+    // This registers it in "sys.modules" already, so it can be imported.
+    PyObject *module = PyImport_AddModule("__nuitka_stats__");
+    CHECK_OBJECT(module);
+
+    for (PyMethodDef *method_def = _nuitka_stats_methods; method_def->ml_name != NULL; method_def++) {
+        PyObject *function = PyCFunction_New(method_def, NULL);
+        CHECK_OBJECT(function);
+
+        PyModule_AddObject(module, method_def->ml_name, function);
+    }
+}
+
+#endif
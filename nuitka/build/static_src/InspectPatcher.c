@@ -128,32 +128,7 @@ static PyMethodDef _method_def_types_coroutine_replacement = {"coroutine", (PyCF
 #endif
 
 /* Replace inspect functions with ones that handle compiles types too. */
-void patchInspectModule(void) {
-    static bool is_done = false;
-    if (is_done)
-        return;
-
-#if PYTHON_VERSION >= 300
-#ifdef _NUITKA_EXE
-    // May need to import the "site" module, because otherwise the patching can
-    // fail with it being unable to load it.
-    if (Py_NoSiteFlag == 0) {
-        PyObject *site_module = IMPORT_MODULE5(const_str_plain_site, Py_None, Py_None, const_tuple_empty, const_int_0);
-
-        if (site_module == NULL) {
-            // Ignore "ImportError", having a "site" module is not a must.
-            CLEAR_ERROR_OCCURRED();
-        }
-    }
-#endif
-
-    // TODO: Change this into an import hook that is executed after it is imported.
-    module_inspect = IMPORT_MODULE5(const_str_plain_inspect, Py_None, Py_None, const_tuple_empty, const_int_0);
-
-    if (module_inspect == NULL) {
-        PyErr_PrintEx(0);
-        Py_Exit(1);
-    }
+static void patchInspectFunctions(void) {
     CHECK_OBJECT(module_inspect);
 
     // Patch "inspect.getgeneratorstate" unless it is already patched.
@@ -181,6 +156,12 @@ void patchInspectModule(void) {
         PyObject_SetAttrString(module_inspect, "getcoroutinestate", inspect_getcoroutinestate_replacement);
     }
 
+#endif
+}
+
+#if PYTHON_VERSION >= 350
+/* Replace types functions with ones that handle compiled types too. */
+static void patchTypesModule(void) {
     module_types = IMPORT_MODULE5(const_str_plain_types, Py_None, Py_None, const_tuple_empty, const_int_0);
 
     if (module_types == NULL) {
@@ -226,9 +207,87 @@ types._GeneratorWrapper = GeneratorWrapperEnhanced\
 
         Py_DECREF(module);
     }
+}
+#endif
+
+// Importing "inspect" is expensive, and most programs never do it, therefore
+// it is patched only once it gets imported, with the meta path based loader
+// claiming the import of it while this is set.
+static bool inspect_patch_pending = false;
+
+bool isInspectModulePatchPending(char const *name) { return inspect_patch_pending && strcmp(name, "inspect") == 0; }
+
+PyObject *importAndPatchInspectModule(void) {
+    assert(inspect_patch_pending);
+
+    // Only the nested import, this loader will deny responsibility for it now.
+    inspect_patch_pending = false;
+
+    module_inspect = IMPORT_MODULE5(const_str_plain_inspect, Py_None, Py_None, const_tuple_empty, const_int_0);
+
+    if (unlikely(module_inspect == NULL)) {
+        inspect_patch_pending = true;
+        return NULL;
+    }
+
+    patchInspectFunctions();
+
+    Py_INCREF(module_inspect);
+    return module_inspect;
+}
+
+static bool isFrozenModule(char const *name) {
+    for (struct _frozen const *p = PyImport_FrozenModules; p->name != NULL; p++) {
+        if (strcmp(p->name, name) == 0) {
+            return true;
+        }
+    }
+
+    return false;
+}
 
+void patchInspectModule(void) {
+    static bool is_done = false;
+    if (is_done)
+        return;
+
+#ifdef _NUITKA_EXE
+    // May need to import the "site" module, because otherwise the patching can
+    // fail with it being unable to load it.
+    if (Py_NoSiteFlag == 0) {
+        PyObject *site_module = IMPORT_MODULE5(const_str_plain_site, Py_None, Py_None, const_tuple_empty, const_int_0);
+
+        if (site_module == NULL) {
+            // Ignore "ImportError", having a "site" module is not a must.
+            CLEAR_ERROR_OCCURRED();
+        }
+    }
 #endif
 
+    // Patch it right away if it is already imported, e.g. by "site", otherwise
+    // when it gets imported.
+    module_inspect = PyDict_GetItem(PyImport_GetModuleDict(), const_str_plain_inspect);
+
+    if (module_inspect != NULL) {
+        Py_INCREF(module_inspect);
+        patchInspectFunctions();
+    } else if (isFrozenModule("inspect")) {
+        // The "FrozenImporter" comes before our loader, which then never gets
+        // to see the import, so this must be done eagerly.
+        module_inspect = IMPORT_MODULE5(const_str_plain_inspect, Py_None, Py_None, const_tuple_empty, const_int_0);
+
+        if (module_inspect == NULL) {
+            PyErr_PrintEx(0);
+            Py_Exit(1);
+        }
+
+        patchInspectFunctions();
+    } else {
+        inspect_patch_pending = true;
+    }
+
+#if PYTHON_VERSION >= 350
+    patchTypesModule();
 #endif
 
     is_done = true;
@@ -324,9 +383,10 @@ void patchTypeComparison() {
 
 #include "nuitka/freelists.h"
 
+#ifndef MAX_TRACEBACK_FREE_LIST_COUNT
 #define MAX_TRACEBACK_FREE_LIST_COUNT 1000
-static PyTracebackObject *free_list_tracebacks = NULL;
-static int free_list_tracebacks_count = 0;
+#endif
+NUITKA_DECLARE_FREE_LIST(free_list_tracebacks, PyTracebackObject, MAX_TRACEBACK_FREE_LIST_COUNT)
 
 // Create a traceback for a given frame, using a freelist hacked into the
 // existing type.
@@ -359,7 +419,7 @@ static void Nuitka_tb_dealloc(PyTracebackObject *tb) {
     Py_XDECREF(tb->tb_next);
     Py_XDECREF(tb->tb_frame);
 
-    releaseToFreeList(free_list_tracebacks, tb, MAX_TRACEBACK_FREE_LIST_COUNT);
+    releaseToFreeList(free_list_tracebacks, tb);
 
     // Py_TRASHCAN_SAFE_END( tb )
 }
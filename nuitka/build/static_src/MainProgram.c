@@ -126,6 +126,12 @@ extern void _initCompiledCoroutineTypes();
 #if PYTHON_VERSION >= 360
 extern void _initCompiledAsyncgenTypes();
 #endif
+#if _NUITKA_FREELIST_STATISTICS
+extern void _initFreeListStatistics(void);
+#endif
+#if _NUITKA_STATISTICS
+extern void _initRuntimeStatistics(void);
+#endif
 
 #include <locale.h>
 
@@ -218,6 +224,8 @@ int main(int argc, char **argv) {
 #endif
     NUITKA_PRINT_TRACE("main(): Entered.");
 
+    NUITKA_STATISTICS_STARTUP_BEGIN();
+
     orig_argv = argv;
     orig_argc = argc;
 
@@ -317,6 +325,8 @@ int main(int argc, char **argv) {
 #endif
 #endif
 
+    NUITKA_STATISTICS_STARTUP_PHASE("prepare");
+
     /* Initialize the embedded CPython interpreter. */
     NUITKA_PRINT_TRACE("main(): Calling Py_Initialize to initialize interpreter.");
     Py_Initialize();
@@ -326,6 +336,8 @@ int main(int argc, char **argv) {
     restoreStandaloneEnvironment();
 #endif
 
+    NUITKA_STATISTICS_STARTUP_PHASE("interpreter");
+
     /* Lie about it, believe it or not, there are "site" files, that check
      * against later imports, see below.
      */
@@ -353,6 +365,8 @@ int main(int argc, char **argv) {
     NUITKA_PRINT_TRACE("main(): Calling _initBuiltinOriginalValues().");
     _initBuiltinOriginalValues();
 
+    NUITKA_STATISTICS_STARTUP_PHASE("constants");
+
     /* Revert the wrong "sys.flags" value, it's used by "site" on at least
      * Debian for Python 3.3, more uses may exist.
      */
@@ -377,6 +391,14 @@ int main(int argc, char **argv) {
     _initCompiledAsyncgenTypes();
 #endif
 
+#if _NUITKA_FREELIST_STATISTICS
+    _initFreeListStatistics();
+#endif
+
+#if _NUITKA_STATISTICS
+    _initRuntimeStatistics();
+#endif
+
 #if PYTHON_VERSION < 300
     _initSlotCompare();
 #endif
@@ -396,6 +418,8 @@ int main(int argc, char **argv) {
     NUITKA_PRINT_TRACE("main(): Calling patchTracebackDealloc().");
     patchTracebackDealloc();
 
+    NUITKA_STATISTICS_STARTUP_PHASE("types");
+
     /* Allow to override the ticker value, to remove checks for threads in
      * CPython core from impact on benchmarks. */
     char const *ticker_value = getenv("NUITKA_TICKER");
@@ -447,6 +471,8 @@ int main(int argc, char **argv) {
     patchInspectModule();
 #endif
 
+    NUITKA_STATISTICS_STARTUP_PHASE("loader");
+
 #if _NUITKA_PROFILE
     startProfiling();
 #endif
@@ -473,6 +499,13 @@ int main(int argc, char **argv) {
     stopProfiling();
 #endif
 
+    NUITKA_STATISTICS_STARTUP_PHASE("main");
+
+#if _NUITKA_STATISTICS
+    Nuitka_Statistics_WriteImportTimes();
+    Nuitka_Statistics_WriteStartupTimes();
+#endif
+
 #ifndef __NUITKA_NO_ASSERT__
     checkGlobalConstants();
 
@@ -53,21 +53,50 @@ static inline bool isVerbose(void) { return false; }
 #endif
 
 static struct Nuitka_MetaPathBasedLoaderEntry *loader_entries = NULL;
+static int loader_entries_count = 0;
 
-static bool hasFrozenModule(char const *name) {
-    for (struct _frozen const *p = PyImport_FrozenModules;; p++) {
-        if (p->name == NULL) {
-            return false;
+#if _NUITKA_FROZEN > 0
+// Our frozen modules, sorted by name, and appended to the ones of CPython.
+extern struct _frozen const *nuitka_frozen_modules;
+#endif
+
+static struct _frozen const *findFrozenModule(char const *name) {
+    struct _frozen const *end = NULL;
+
+#if _NUITKA_FROZEN > 0
+    if (nuitka_frozen_modules != NULL) {
+        int low = 0;
+        int high = _NUITKA_FROZEN - 1;
+
+        while (low <= high) {
+            int middle = (low + high) / 2;
+            int cmp = strcmp(nuitka_frozen_modules[middle].name, name);
+
+            if (cmp == 0) {
+                return &nuitka_frozen_modules[middle];
+            } else if (cmp < 0) {
+                low = middle + 1;
+            } else {
+                high = middle - 1;
+            }
         }
 
+        // Only the few ones of CPython remain to be checked.
+        end = nuitka_frozen_modules;
+    }
+#endif
+
+    for (struct _frozen const *p = PyImport_FrozenModules; p != end && p->name != NULL; p++) {
         if (strcmp(p->name, name) == 0) {
-            break;
+            return p;
         }
     }
 
-    return true;
+    return NULL;
 }
 
+static bool hasFrozenModule(char const *name) { return findFrozenModule(name) != NULL; }
+
 static char *copyModulenameAsPath(char *buffer, char const *module_name) {
     while (*module_name) {
         if (*module_name == '.') {
@@ -235,16 +264,24 @@ static PyObject *loadModuleFromCodeObject(PyCodeObject *code_object, char const
     return module;
 }
 
+// The entries are sorted by name at compile time.
 static struct Nuitka_MetaPathBasedLoaderEntry *findEntry(char const *name) {
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-    assert(current);
+    assert(loader_entries);
 
-    while (current->name != NULL) {
-        if (strcmp(name, current->name) == 0) {
-            return current;
-        }
+    int low = 0;
+    int high = loader_entries_count - 1;
+
+    while (low <= high) {
+        int middle = (low + high) / 2;
+        int cmp = strcmp(loader_entries[middle].name, name);
 
-        current++;
+        if (cmp == 0) {
+            return &loader_entries[middle];
+        } else if (cmp < 0) {
+            low = middle + 1;
+        } else {
+            high = middle - 1;
+        }
     }
 
     return NULL;
@@ -292,6 +329,19 @@ static PyObject *_path_unfreezer_find_module(PyObject *self, PyObject *args, PyO
         return metapath_based_loader;
     }
 
+#if PYTHON_VERSION >= 300
+    if (isInspectModulePatchPending(name)) {
+        if (isVerbose()) {
+            PySys_WriteStderr("import %s # claimed responsibility (patched)\n", name);
+        }
+
+        PyObject *metapath_based_loader = (PyObject *)&Nuitka_Loader_Type;
+
+        Py_INCREF(metapath_based_loader);
+        return metapath_based_loader;
+    }
+#endif
+
     if (isVerbose()) {
         PySys_WriteStderr("import %s # denied responsibility\n", name);
     }
@@ -421,6 +471,12 @@ PyObject *callIntoShlibModule(const char *full_name, const char *filename) {
 #else
     int dlopenflags = PyThreadState_GET()->interp->dlopenflags;
 
+#ifdef _NUITKA_LAZY_EXTENSION_BINDING
+    // Resolve the symbols on first use only, most of them are never used, but
+    // keep other flags, e.g. "RTLD_GLOBAL" given with "sys.setdlopenflags".
+    dlopenflags = (dlopenflags & ~RTLD_NOW) | RTLD_LAZY;
+#endif
+
     if (isVerbose()) {
         PySys_WriteStderr("import %s # dlopen(\"%s\", %x);\n", full_name, filename, dlopenflags);
     }
@@ -624,7 +680,7 @@ static PyObject *loadModule(PyObject *module_name, struct Nuitka_MetaPathBasedLo
 #endif
         if ((entry->flags & NUITKA_BYTECODE_FLAG) != 0) {
         PyCodeObject *code_object = (PyCodeObject *)PyMarshal_ReadObjectFromString(
-            (char *)&constant_bin[entry->bytecode_start], entry->bytecode_size);
+            (char *)CONSTANT_BIN_RANGE(entry->bytecode_start, entry->bytecode_size), entry->bytecode_size);
 
         // TODO: Probably a bit harsh reaction.
         if (unlikely(code_object == NULL)) {
@@ -678,6 +734,8 @@ static PyObject *loadModule(PyObject *module_name, struct Nuitka_MetaPathBasedLo
                 if (loader) {
                     int res = PyDict_SetItem(path_importer_cache, path_element, loader);
                     assert(res == 0);
+
+                    Py_DECREF(loader);
                 }
             }
         }
@@ -713,9 +771,21 @@ PyObject *IMPORT_EMBEDDED_MODULE(PyObject *module_name, char const *name) {
 
     PyObject *result = NULL;
 
+#if _NUITKA_STATISTICS
+    double import_start = 0.0;
+
+    if (entry != NULL || frozen_import) {
+        import_start = Nuitka_Statistics_StartImport(name);
+    }
+#endif
+
     if (entry != NULL) {
         result = loadModule(module_name, entry);
 
+#if _NUITKA_STATISTICS
+        Nuitka_Statistics_EndImport(name, import_start);
+#endif
+
         if (result == NULL) {
             return NULL;
         }
@@ -724,6 +794,10 @@ PyObject *IMPORT_EMBEDDED_MODULE(PyObject *module_name, char const *name) {
     if (frozen_import) {
         int res = PyImport_ImportFrozenModule((char *)name);
 
+#if _NUITKA_STATISTICS
+        Nuitka_Statistics_EndImport(name, import_start);
+#endif
+
         if (unlikely(res == -1)) {
             return NULL;
         }
@@ -766,13 +840,20 @@ static PyObject *_path_unfreezer_load_module(PyObject *self, PyObject *args, PyO
         PySys_WriteStderr("Loading %s\n", name);
     }
 
+#if PYTHON_VERSION >= 300
+    if (isInspectModulePatchPending(name)) {
+        return importAndPatchInspectModule();
+    }
+#endif
+
     return IMPORT_EMBEDDED_MODULE(module_name, name);
 }
 
 static PyObject *_path_unfreezer_is_package(PyObject *self, PyObject *args, PyObject *kwds) {
     PyObject *module_name;
+    PyObject *unused;
 
-    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O:is_package", _kwlist, &module_name);
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O|O:is_package", _kwlist, &module_name, &unused);
 
     if (unlikely(res == 0)) {
         return NULL;
@@ -790,8 +871,15 @@ static PyObject *_path_unfreezer_is_package(PyObject *self, PyObject *args, PyOb
     if (entry) {
         result = BOOL_FROM((entry->flags & NUITKA_PACKAGE_FLAG) != 0);
     } else {
-        // TODO: Maybe needs to be an exception.
-        result = Py_None;
+        struct _frozen const *frozen = findFrozenModule(name);
+
+        if (frozen != NULL) {
+            // Packages are indicated with negative size.
+            result = BOOL_FROM(frozen->size < 0);
+        } else {
+            // TODO: Maybe needs to be an exception.
+            result = Py_None;
+        }
     }
 
     Py_INCREF(result);
@@ -826,7 +914,7 @@ static PyObject *createModuleSpec(PyObject *module_name) {
 
     struct Nuitka_MetaPathBasedLoaderEntry *entry = findEntry(name);
 
-    if (entry == NULL) {
+    if (entry == NULL && !isInspectModulePatchPending(name)) {
         if (isVerbose()) {
             PySys_WriteStderr("import %s # denied responsibility\n", name);
         }
@@ -879,48 +967,42 @@ static PyObject *_path_unfreezer_find_spec(PyObject *self, PyObject *args, PyObj
 
 #endif
 
-static char *_kwlist_iter_modules[] = {(char *)"self", (char *)"package", NULL};
+struct Nuitka_LoaderObject {
+    PyObject_HEAD PyObject *module_name; /* Module we are responsible for */
+};
 
-extern PyObject *const_str_plain_name;
+static char *_kwlist_iter_modules[] = {(char *)"prefix", NULL};
 
-static PyObject *_path_unfreezer_iter_modules(PyObject *self, PyObject *args, PyObject *kwds) {
+static PyObject *_path_unfreezer_iter_modules(struct Nuitka_LoaderObject *self, PyObject *args, PyObject *kwds) {
     PyObject *prefix;
 
-    int res = PyArg_ParseTupleAndKeywords(args, kwds, "OO:iter_modules", _kwlist_iter_modules, &self, &prefix);
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O:iter_modules", _kwlist_iter_modules, &prefix);
 
     if (unlikely(res == 0)) {
         return NULL;
     }
 
     // Search relativ to us only.
-    PyObject *asked_name = LOOKUP_ATTRIBUTE(self, const_str_plain_name);
+    PyObject *asked_name = self->module_name;
 
-    PyObject *result = PyList_New(0);
+    if (unlikely(asked_name == NULL)) {
+        PyErr_Format(PyExc_ValueError, "loader has no module name");
+        return NULL;
+    }
 
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-    assert(current);
+    PyObject *result = PyList_New(0);
 
     char const *s = Nuitka_String_AsString(asked_name);
 
-    while (current->name != NULL) {
-        int c = strncmp(s, current->name, strlen(s));
-
-        if (c != 0) {
-            current++;
-            continue;
-        }
-
-        if (current->name[strlen(s)] == 0) {
-            current++;
-            continue;
-        }
+    // The direct children of packages are known at compile time.
+    struct Nuitka_MetaPathBasedLoaderEntry *package_entry = findEntry(s);
 
-        char const *sub = strchr(current->name + strlen(s) + 1, '.');
+    if (package_entry == NULL) {
+        return result;
+    }
 
-        if (sub != NULL) {
-            current++;
-            continue;
-        }
+    for (int i = 0; i < package_entry->children_count; i++) {
+        struct Nuitka_MetaPathBasedLoaderEntry *current = &loader_entries[package_entry->children[i]];
 
         PyObject *r = PyTuple_New(2);
 
@@ -941,38 +1023,32 @@ static PyObject *_path_unfreezer_iter_modules(PyObject *self, PyObject *args, Py
 
         PyList_Append(result, r);
         Py_DECREF(r);
-
-        current++;
     }
 
     return result;
 }
 
-static char *_kwlist_dunder_init[] = {(char *)"self", (char *)"module_name", NULL};
+static char *_kwlist_dunder_init[] = {(char *)"module_name", NULL};
 
-static PyObject *_path_unfreezer_dunder_init(PyObject *self, PyObject *args, PyObject *kwds) {
-    PyObject *loader_object;
+static int Nuitka_Loader_tp_init(PyObject *self, PyObject *args, PyObject *kwds) {
+    struct Nuitka_LoaderObject *loader = (struct Nuitka_LoaderObject *)self;
     PyObject *module_name;
 
-    int res = PyArg_ParseTupleAndKeywords(args, kwds, "OO:__init__", _kwlist_dunder_init, &loader_object, &module_name);
+    int res = PyArg_ParseTupleAndKeywords(args, kwds, "O:__init__", _kwlist_dunder_init, &module_name);
 
     if (unlikely(res == 0)) {
-        return NULL;
+        return -1;
     }
 
-    SET_ATTRIBUTE(loader_object, const_str_plain_name, module_name);
+    PyObject *old = loader->module_name;
+    Py_INCREF(module_name);
+    loader->module_name = module_name;
+    Py_XDECREF(old);
 
-    PyObject *result = Py_None;
-    Py_INCREF(result);
-    return result;
+    return 0;
 }
 
-struct Nuitka_LoaderObject {
-    PyObject_HEAD PyObject *module_name; /* Module we are responsible for */
-};
-
 static PyMethodDef Nuitka_Loader_methods[] = {
-    {"__init__", (PyCFunction)_path_unfreezer_dunder_init, METH_VARARGS | METH_KEYWORDS, NULL},
     {"iter_modules", (PyCFunction)_path_unfreezer_iter_modules, METH_VARARGS | METH_KEYWORDS, NULL},
 
     {"get_data", (PyCFunction)_path_unfreezer_get_data, METH_STATIC | METH_VARARGS | METH_KEYWORDS, NULL},
@@ -1001,11 +1077,19 @@ static int Nuitka_Loader_tp_traverse(struct Nuitka_LoaderObject *loader, visitpr
     return 0;
 }
 
+static void Nuitka_Loader_tp_dealloc(struct Nuitka_LoaderObject *loader) {
+    Nuitka_GC_UnTrack(loader);
+
+    Py_XDECREF(loader->module_name);
+
+    PyObject_GC_Del(loader);
+}
+
 PyTypeObject Nuitka_Loader_Type = {
     PyVarObject_HEAD_INIT(NULL, 0) "nuitka_module_loader",
     sizeof(struct Nuitka_LoaderObject),
     0,
-    0,                                       /* tp_dealloc */
+    (destructor)Nuitka_Loader_tp_dealloc,    /* tp_dealloc */
     0,                                       /* tp_print */
     0,                                       /* tp_getattr */
     0,                                       /* tp_setattr */
@@ -1031,6 +1115,14 @@ PyTypeObject Nuitka_Loader_Type = {
     Nuitka_Loader_methods,                   /* tp_methods */
     0,                                       /* tp_members */
     0,                                       /* tp_getset */
+    0,                                       /* tp_base */
+    0,                                       /* tp_dict */
+    0,                                       /* tp_descr_get */
+    0,                                       /* tp_descr_set */
+    0,                                       /* tp_dictoffset */
+    Nuitka_Loader_tp_init,                   /* tp_init */
+    0,                                       /* tp_alloc */
+    PyType_GenericNew,                       /* tp_new */
 };
 
 void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loader_entries) {
@@ -1047,6 +1139,10 @@ void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loa
 
     loader_entries = _loader_entries;
 
+    while (loader_entries[loader_entries_count].name != NULL) {
+        loader_entries_count += 1;
+    }
+
     PyType_Ready(&Nuitka_Loader_Type);
 
     // Register it as a meta path loader.
@@ -0,0 +1,730 @@
+//     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+/* The bootstrap program for onefile mode.
+ *
+ * Nuitka appends the standalone distribution folder to this program, as a
+ * payload of file contents, followed by an index of the files and a trailer
+ * that locates both. Layout of the trailer, all numbers little endian:
+ *
+ *   char magic[8];         "NUITKAOF"
+ *   uint64 payload_start;  offset of the payload in this file
+ *   uint64 index_start;    offset of the index in this file
+ *   uint64 index_size;     size of the index in bytes
+ *   uint32 entry_count;    number of files in the index
+ *   uint32 main_entry;     index entry of the program to run
+ *   char hash[32];         hex digest of payload and index
+ *
+ * Index entries are name size, flags, offset relative to the payload start,
+ * and file size, followed by the name, a relative path using "/".
+ *
+ * This program is not linked against Python, it maps itself into memory,
+ * extracts the files into a cache directory named after the hash, unless a
+ * previous run already did that, and then runs the program from there. The
+ * cache is only used, if it is private to the user, otherwise the files are
+ * extracted to a new temporary directory on every run.
+ */
+
+// Needed for "readlink", "setenv" and the like, when compiling in strict C11 mode.
+#if !defined(_WIN32) && !defined(_GNU_SOURCE)
+#define _GNU_SOURCE
+#endif
+
+#if defined(_WIN32)
+#define WIN32_LEAN_AND_MEAN
+#include <windows.h>
+#else
+#include <errno.h>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <sys/types.h>
+#include <unistd.h>
+#endif
+
+#if defined(__APPLE__)
+#include <mach-o/dyld.h>
+#endif
+
+#if defined(__FreeBSD__)
+#include <sys/sysctl.h>
+#endif
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifndef MAXPATHLEN
+#define MAXPATHLEN 4096
+#endif
+
+#define ONEFILE_MAGIC "NUITKAOF"
+#define ONEFILE_TRAILER_SIZE (8 + 8 + 8 + 8 + 4 + 4 + 32)
+#define ONEFILE_ENTRY_HEADER_SIZE (4 + 4 + 8 + 8)
+
+// Flags of index entries.
+#define ONEFILE_FLAG_EXECUTABLE 1
+
+// Name of the file, that marks a completed extraction, it contains the hash.
+#define ONEFILE_MARKER_NAME ".nuitka-onefile"
+
+struct OnefileEntry {
+    char const *name;
+    unsigned int name_size;
+    unsigned int flags;
+    unsigned char const *data;
+    unsigned long long size;
+};
+
+static unsigned int readUInt32(unsigned char const *buffer) {
+    return (unsigned int)buffer[0] | ((unsigned int)buffer[1] << 8) | ((unsigned int)buffer[2] << 16) |
+           ((unsigned int)buffer[3] << 24);
+}
+
+static unsigned long long readUInt64(unsigned char const *buffer) {
+    return (unsigned long long)readUInt32(buffer) | ((unsigned long long)readUInt32(buffer + 4) << 32);
+}
+
+static void fatalError(char const *message) {
+    fprintf(stderr, "Error, onefile bootstrap failed: %s\n", message);
+    exit(1);
+}
+
+// Check the trailer and split the index into entries.
+static struct OnefileEntry *parsePayload(unsigned char const *file_data, unsigned long long file_size,
+                                         unsigned int *entry_count, unsigned int *main_entry, char *hash) {
+    if (file_size < ONEFILE_TRAILER_SIZE) {
+        fatalError("no payload attached");
+    }
+
+    unsigned char const *trailer = file_data + file_size - ONEFILE_TRAILER_SIZE;
+
+    if (memcmp(trailer, ONEFILE_MAGIC, 8) != 0) {
+        fatalError("no payload attached");
+    }
+
+    unsigned long long payload_start = readUInt64(trailer + 8);
+    unsigned long long index_start = readUInt64(trailer + 16);
+    unsigned long long index_size = readUInt64(trailer + 24);
+    *entry_count = readUInt32(trailer + 32);
+    *main_entry = readUInt32(trailer + 36);
+    memcpy(hash, trailer + 40, 32);
+    hash[32] = 0;
+
+    if (index_start + index_size > file_size - ONEFILE_TRAILER_SIZE || *main_entry >= *entry_count) {
+        fatalError("payload index is corrupt");
+    }
+
+    struct OnefileEntry *entries = (struct OnefileEntry *)malloc(sizeof(struct OnefileEntry) * *entry_count);
+
+    unsigned char const *current = file_data + index_start;
+    unsigned char const *index_end = current + index_size;
+
+    for (unsigned int i = 0; i < *entry_count; i++) {
+        if (current + ONEFILE_ENTRY_HEADER_SIZE > index_end) {
+            fatalError("payload index is corrupt");
+        }
+
+        entries[i].name_size = readUInt32(current);
+        entries[i].flags = readUInt32(current + 4);
+        unsigned long long offset = readUInt64(current + 8);
+        entries[i].size = readUInt64(current + 16);
+        entries[i].name = (char const *)current + ONEFILE_ENTRY_HEADER_SIZE;
+        entries[i].data = file_data + payload_start + offset;
+
+        current += ONEFILE_ENTRY_HEADER_SIZE + entries[i].name_size;
+
+        if (current > index_end || payload_start + offset + entries[i].size > index_start) {
+            fatalError("payload index is corrupt");
+        }
+    }
+
+    return entries;
+}
+
+#if defined(_WIN32)
+
+typedef wchar_t filename_char_t;
+#define FILENAME_SEP L'\\'
+
+static void appendUTF8(filename_char_t *target, char const *source, unsigned int source_size) {
+    size_t length = wcslen(target);
+
+    int res = MultiByteToWideChar(CP_UTF8, 0, source, source_size, target + length, MAXPATHLEN - (int)length - 1);
+
+    if (res == 0 && source_size != 0) {
+        fatalError("filename too long");
+    }
+
+    target[length + res] = 0;
+
+    for (filename_char_t *c = target + length; *c != 0; c++) {
+        if (*c == L'/') {
+            *c = FILENAME_SEP;
+        }
+    }
+}
+
+static void appendChars(filename_char_t *target, char const *source) {
+    appendUTF8(target, source, (unsigned int)strlen(source));
+}
+
+static void appendSep(filename_char_t *target) {
+    size_t length = wcslen(target);
+    target[length] = FILENAME_SEP;
+    target[length + 1] = 0;
+}
+
+static void getCacheBaseDirectory(filename_char_t *target) {
+    DWORD res = GetEnvironmentVariableW(L"LOCALAPPDATA", target, MAXPATHLEN);
+
+    if (res == 0 || res >= MAXPATHLEN) {
+        res = GetTempPathW(MAXPATHLEN, target);
+
+        if (res == 0 || res >= MAXPATHLEN) {
+            fatalError("cannot locate cache directory");
+        }
+    }
+
+    size_t length = wcslen(target);
+    if (length > 0 && target[length - 1] == FILENAME_SEP) {
+        target[length - 1] = 0;
+    }
+}
+
+static int makeDirectory(filename_char_t const *path) {
+    return CreateDirectoryW(path, NULL) || GetLastError() == ERROR_ALREADY_EXISTS;
+}
+
+// The cache directory is below the profile of the user, or its temporary
+// directory, neither of which other users can write to, so only links are
+// not trusted.
+static int isPrivateDirectory(filename_char_t const *path) {
+    DWORD attributes = GetFileAttributesW(path);
+
+    return attributes != INVALID_FILE_ATTRIBUTES && (attributes & FILE_ATTRIBUTE_DIRECTORY) != 0 &&
+           (attributes & FILE_ATTRIBUTE_REPARSE_POINT) == 0;
+}
+
+static int makeTempDirectory(filename_char_t *target) {
+    DWORD res = GetTempPathW(MAXPATHLEN, target);
+
+    if (res == 0 || res >= MAXPATHLEN - 32) {
+        return 0;
+    }
+
+    size_t length = wcslen(target);
+
+    for (unsigned int attempt = 0; attempt < 100; attempt++) {
+        _snwprintf(target + length, MAXPATHLEN - length, L"nuitka-onefile-%lu-%u",
+                   (unsigned long)GetCurrentProcessId(), attempt);
+
+        if (CreateDirectoryW(target, NULL)) {
+            return 1;
+        }
+    }
+
+    return 0;
+}
+
+static int isFileOfSize(filename_char_t const *path, unsigned long long size) {
+    WIN32_FILE_ATTRIBUTE_DATA file_data;
+
+    if (!GetFileAttributesExW(path, GetFileExInfoStandard, &file_data)) {
+        return 0;
+    }
+
+    return (file_data.dwFileAttributes & (FILE_ATTRIBUTE_DIRECTORY | FILE_ATTRIBUTE_REPARSE_POINT)) == 0 &&
+           (((unsigned long long)file_data.nFileSizeHigh << 32) | file_data.nFileSizeLow) == size;
+}
+
+static int writeFile(filename_char_t const *path, unsigned char const *data, unsigned long long size,
+                     unsigned int flags) {
+    HANDLE handle = CreateFileW(path, GENERIC_WRITE, 0, NULL, CREATE_ALWAYS, FILE_ATTRIBUTE_NORMAL, NULL);
+
+    if (handle == INVALID_HANDLE_VALUE) {
+        return 0;
+    }
+
+    while (size > 0) {
+        DWORD chunk = size > 0x40000000 ? 0x40000000 : (DWORD)size;
+        DWORD written;
+
+        if (!WriteFile(handle, data, chunk, &written, NULL)) {
+            CloseHandle(handle);
+            return 0;
+        }
+
+        data += written;
+        size -= written;
+    }
+
+    CloseHandle(handle);
+    return 1;
+}
+
+static int readFileStart(filename_char_t const *path, char *buffer, unsigned int size) {
+    HANDLE handle = CreateFileW(path, GENERIC_READ, FILE_SHARE_READ, NULL, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, NULL);
+
+    if (handle == INVALID_HANDLE_VALUE) {
+        return 0;
+    }
+
+    DWORD read_size = 0;
+    BOOL res = ReadFile(handle, buffer, size, &read_size, NULL);
+    CloseHandle(handle);
+
+    return res && read_size == size;
+}
+
+static int renameDirectory(filename_char_t const *source, filename_char_t const *dest) {
+    return MoveFileW(source, dest);
+}
+
+static void removeFile(filename_char_t const *path) { DeleteFileW(path); }
+
+static void removeDirectory(filename_char_t const *path) { RemoveDirectoryW(path); }
+
+#else
+
+typedef char filename_char_t;
+#define FILENAME_SEP '/'
+
+static void appendUTF8(filename_char_t *target, char const *source, unsigned int source_size) {
+    size_t length = strlen(target);
+
+    if (length + source_size >= MAXPATHLEN) {
+        fatalError("filename too long");
+    }
+
+    memcpy(target + length, source, source_size);
+    target[length + source_size] = 0;
+}
+
+static void appendChars(filename_char_t *target, char const *source) {
+    appendUTF8(target, source, (unsigned int)strlen(source));
+}
+
+static void appendSep(filename_char_t *target) { appendChars(target, "/"); }
+
+static void getCacheBaseDirectory(filename_char_t *target) {
+    char const *xdg_cache_home = getenv("XDG_CACHE_HOME");
+    char const *home = getenv("HOME");
+
+    target[0] = 0;
+
+    if (xdg_cache_home != NULL && xdg_cache_home[0] == '/') {
+        appendChars(target, xdg_cache_home);
+    } else if (home != NULL && home[0] == '/') {
+        appendChars(target, home);
+        appendChars(target, "/.cache");
+    } else {
+        appendChars(target, "/tmp");
+    }
+}
+
+static int makeDirectory(filename_char_t const *path) { return mkdir(path, 0700) == 0 || errno == EEXIST; }
+
+// Existing directories may have been created by other users, e.g. in "/tmp",
+// only ours, that nobody else can write to, are trusted.
+static int isPrivateDirectory(filename_char_t const *path) {
+    struct stat stat_buffer;
+
+    if (lstat(path, &stat_buffer) != 0) {
+        return 0;
+    }
+
+    return S_ISDIR(stat_buffer.st_mode) && stat_buffer.st_uid == getuid() &&
+           (stat_buffer.st_mode & (S_IWGRP | S_IWOTH)) == 0;
+}
+
+static int makeTempDirectory(filename_char_t *target) {
+    char const *tmpdir = getenv("TMPDIR");
+
+    target[0] = 0;
+
+    if (tmpdir != NULL && tmpdir[0] == '/') {
+        appendChars(target, tmpdir);
+    } else {
+        appendChars(target, "/tmp");
+    }
+
+    appendChars(target, "/nuitka-onefile-XXXXXX");
+
+    return mkdtemp(target) != NULL;
+}
+
+static int isFileOfSize(filename_char_t const *path, unsigned long long size) {
+    struct stat stat_buffer;
+
+    if (lstat(path, &stat_buffer) != 0) {
+        return 0;
+    }
+
+    return S_ISREG(stat_buffer.st_mode) && (unsigned long long)stat_buffer.st_size == size;
+}
+
+static int writeFile(filename_char_t const *path, unsigned char const *data, unsigned long long size,
+                     unsigned int flags) {
+    int fd = open(path, O_WRONLY | O_CREAT | O_TRUNC, (flags & ONEFILE_FLAG_EXECUTABLE) ? 0755 : 0644);
+
+    if (fd == -1) {
+        return 0;
+    }
+
+    while (size > 0) {
+        size_t chunk = size > 0x40000000 ? 0x40000000 : (size_t)size;
+        ssize_t written = write(fd, data, chunk);
+
+        if (written <= 0) {
+            close(fd);
+            return 0;
+        }
+
+        data += written;
+        size -= written;
+    }
+
+    return close(fd) == 0;
+}
+
+static int readFileStart(filename_char_t const *path, char *buffer, unsigned int size) {
+    int fd = open(path, O_RDONLY);
+
+    if (fd == -1) {
+        return 0;
+    }
+
+    ssize_t read_size = read(fd, buffer, size);
+    close(fd);
+
+    return read_size == (ssize_t)size;
+}
+
+static int renameDirectory(filename_char_t const *source, filename_char_t const *dest) {
+    return rename(source, dest) == 0;
+}
+
+static void removeFile(filename_char_t const *path) { unlink(path); }
+
+static void removeDirectory(filename_char_t const *path) { rmdir(path); }
+
+#endif
+
+static void copyFilename(filename_char_t *target, filename_char_t const *source) {
+    memcpy(target, source, sizeof(filename_char_t) * (MAXPATHLEN));
+}
+
+// Create the directories leading to a file, the given base must exist.
+static void makeParentDirectories(filename_char_t *filename, size_t base_length) {
+    for (filename_char_t *c = filename + base_length + 1; *c != 0; c++) {
+        if (*c == FILENAME_SEP) {
+            *c = 0;
+            int res = makeDirectory(filename);
+            *c = FILENAME_SEP;
+
+            if (!res) {
+                fatalError("cannot create directory for extraction");
+            }
+        }
+    }
+}
+
+// Check the marker, and that all entries are present as files with the
+// expected sizes, which is cheap compared to checking their contents.
+static int isValidExtraction(filename_char_t const *directory, struct OnefileEntry const *entries,
+                             unsigned int entry_count, char const *hash) {
+    static filename_char_t filename[MAXPATHLEN];
+    char marker_contents[32];
+
+    if (!isPrivateDirectory(directory)) {
+        return 0;
+    }
+
+    copyFilename(filename, directory);
+    appendSep(filename);
+    appendChars(filename, ONEFILE_MARKER_NAME);
+
+    if (!readFileStart(filename, marker_contents, 32) || memcmp(marker_contents, hash, 32) != 0) {
+        return 0;
+    }
+
+    for (unsigned int i = 0; i < entry_count; i++) {
+        copyFilename(filename, directory);
+        appendSep(filename);
+        appendUTF8(filename, entries[i].name, entries[i].name_size);
+
+        if (!isFileOfSize(filename, entries[i].size)) {
+            return 0;
+        }
+    }
+
+    return 1;
+}
+
+static void extractPayload(filename_char_t const *directory, struct OnefileEntry const *entries,
+                           unsigned int entry_count, char const *hash) {
+    static filename_char_t filename[MAXPATHLEN];
+
+    if (!makeDirectory(directory)) {
+        fatalError("cannot create directory for extraction");
+    }
+
+    size_t base_length;
+
+    for (unsigned int i = 0; i < entry_count; i++) {
+        copyFilename(filename, directory);
+        appendSep(filename);
+
+#if defined(_WIN32)
+        base_length = wcslen(filename) - 1;
+#else
+        base_length = strlen(filename) - 1;
+#endif
+        appendUTF8(filename, entries[i].name, entries[i].name_size);
+
+        makeParentDirectories(filename, base_length);
+
+        if (!writeFile(filename, entries[i].data, entries[i].size, entries[i].flags)) {
+            fatalError("cannot write extracted file");
+        }
+    }
+
+    // Only written when all files are complete.
+    copyFilename(filename, directory);
+    appendSep(filename);
+    appendChars(filename, ONEFILE_MARKER_NAME);
+
+    if (!writeFile(filename, (unsigned char const *)hash, 32, 0)) {
+        fatalError("cannot write extracted file");
+    }
+}
+
+// Remove an extraction that lost against another process, best effort.
+static void removeExtraction(filename_char_t const *directory, struct OnefileEntry const *entries,
+                             unsigned int entry_count) {
+    static filename_char_t filename[MAXPATHLEN];
+
+    for (unsigned int i = 0; i < entry_count; i++) {
+        copyFilename(filename, directory);
+        appendSep(filename);
+        appendUTF8(filename, entries[i].name, entries[i].name_size);
+
+        removeFile(filename);
+
+        // Remove parent directories as far as they are empty now.
+        for (;;) {
+            filename_char_t *last_sep = NULL;
+
+            for (filename_char_t *c = filename; *c != 0; c++) {
+                if (*c == FILENAME_SEP) {
+                    last_sep = c;
+                }
+            }
+
+            if (last_sep == NULL) {
+                break;
+            }
+
+            *last_sep = 0;
+
+#if defined(_WIN32)
+            if (wcslen(filename) <= wcslen(directory)) {
+#else
+            if (strlen(filename) <= strlen(directory)) {
+#endif
+                break;
+            }
+
+            removeDirectory(filename);
+        }
+    }
+
+    copyFilename(filename, directory);
+    appendSep(filename);
+    appendChars(filename, ONEFILE_MARKER_NAME);
+    removeFile(filename);
+
+    removeDirectory(directory);
+}
+
+int main(int argc, char **argv) {
+    static filename_char_t cache_directory[MAXPATHLEN];
+    static filename_char_t temp_directory[MAXPATHLEN];
+    static filename_char_t run_filename[MAXPATHLEN];
+    char hash[33];
+    char pid_buffer[64];
+
+    // Map ourselves into memory, the payload is then only read where needed.
+#if defined(_WIN32)
+    static wchar_t binary_filename[MAXPATHLEN];
+
+    DWORD res = GetModuleFileNameW(NULL, binary_filename, MAXPATHLEN);
+    if (res == 0 || res >= MAXPATHLEN) {
+        fatalError("cannot locate own binary");
+    }
+
+    HANDLE file_handle =
+        CreateFileW(binary_filename, GENERIC_READ, FILE_SHARE_READ, NULL, OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, NULL);
+
+    if (file_handle == INVALID_HANDLE_VALUE) {
+        fatalError("cannot open own binary");
+    }
+
+    LARGE_INTEGER file_size_large;
+    if (!GetFileSizeEx(file_handle, &file_size_large)) {
+        fatalError("cannot open own binary");
+    }
+    unsigned long long file_size = (unsigned long long)file_size_large.QuadPart;
+
+    HANDLE mapping_handle = CreateFileMappingW(file_handle, NULL, PAGE_READONLY, 0, 0, NULL);
+    if (mapping_handle == NULL) {
+        fatalError("cannot map own binary");
+    }
+
+    unsigned char const *file_data = (unsigned char const *)MapViewOfFile(mapping_handle, FILE_MAP_READ, 0, 0, 0);
+    if (file_data == NULL) {
+        fatalError("cannot map own binary");
+    }
+#else
+    static char binary_filename[MAXPATHLEN + 1];
+    memset(binary_filename, 0, sizeof(binary_filename));
+
+#if defined(__APPLE__)
+    uint32_t bufsize = MAXPATHLEN;
+    if (_NSGetExecutablePath(binary_filename, &bufsize) != 0) {
+        fatalError("cannot locate own binary");
+    }
+#elif defined(__FreeBSD__)
+    int mib[4] = {CTL_KERN, KERN_PROC, KERN_PROC_PATHNAME, -1};
+    size_t cb = MAXPATHLEN;
+    if (sysctl(mib, 4, binary_filename, &cb, NULL, 0) != 0) {
+        fatalError("cannot locate own binary");
+    }
+#else
+    if (readlink("/proc/self/exe", binary_filename, MAXPATHLEN) == -1) {
+        fatalError("cannot locate own binary");
+    }
+#endif
+
+    int fd = open(binary_filename, O_RDONLY);
+    if (fd == -1) {
+        fatalError("cannot open own binary");
+    }
+
+    struct stat stat_buffer;
+    if (fstat(fd, &stat_buffer) != 0) {
+        fatalError("cannot open own binary");
+    }
+    unsigned long long file_size = (unsigned long long)stat_buffer.st_size;
+
+    unsigned char const *file_data =
+        (unsigned char const *)mmap(NULL, (size_t)file_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    if (file_data == (unsigned char const *)MAP_FAILED) {
+        fatalError("cannot map own binary");
+    }
+#endif
+
+    unsigned int entry_count, main_entry;
+    struct OnefileEntry *entries = parsePayload(file_data, file_size, &entry_count, &main_entry, hash);
+
+    // The cache directory is named after the hash of the payload, so it can
+    // only ever contain these contents.
+    getCacheBaseDirectory(cache_directory);
+    appendSep(cache_directory);
+    appendChars(cache_directory, "nuitka-onefile");
+
+    if (!makeDirectory(cache_directory)) {
+        fatalError("cannot create cache directory");
+    }
+
+    filename_char_t const *run_directory = cache_directory;
+
+    if (!isPrivateDirectory(cache_directory)) {
+        // Others could have placed files into it, then do not use a cache.
+        if (!makeTempDirectory(temp_directory)) {
+            fatalError("cannot create temporary directory");
+        }
+
+        extractPayload(temp_directory, entries, entry_count, hash);
+
+        run_directory = temp_directory;
+    } else {
+        appendSep(cache_directory);
+        appendChars(cache_directory, hash);
+    }
+
+    if (run_directory == cache_directory && !isValidExtraction(cache_directory, entries, entry_count, hash)) {
+        // Extract to a directory of our own, and then rename it into place, so
+        // concurrent first runs do not see partial results.
+#if defined(_WIN32)
+        snprintf(pid_buffer, sizeof(pid_buffer), ".tmp%lu", (unsigned long)GetCurrentProcessId());
+#else
+        snprintf(pid_buffer, sizeof(pid_buffer), ".tmp%lu", (unsigned long)getpid());
+#endif
+        copyFilename(temp_directory, cache_directory);
+        appendChars(temp_directory, pid_buffer);
+
+        extractPayload(temp_directory, entries, entry_count, hash);
+
+        if (!renameDirectory(temp_directory, cache_directory)) {
+            if (isValidExtraction(cache_directory, entries, entry_count, hash)) {
+                removeExtraction(temp_directory, entries, entry_count);
+            } else {
+                // Something unusable is in the way, then use our extraction.
+                run_directory = temp_directory;
+            }
+        }
+    }
+
+    copyFilename(run_filename, run_directory);
+    appendSep(run_filename);
+    appendUTF8(run_filename, entries[main_entry].name, entries[main_entry].name_size);
+
+    // Let the program know, where it was started from.
+#if defined(_WIN32)
+    SetEnvironmentVariableW(L"NUITKA_ONEFILE_BINARY", binary_filename);
+
+    STARTUPINFOW startup_info;
+    PROCESS_INFORMATION process_info;
+
+    memset(&startup_info, 0, sizeof(startup_info));
+    startup_info.cb = sizeof(startup_info);
+
+    if (!CreateProcessW(run_filename, GetCommandLineW(), NULL, NULL, FALSE, 0, NULL, NULL, &startup_info,
+                        &process_info)) {
+        fatalError("cannot run extracted program");
+    }
+
+    CloseHandle(process_info.hThread);
+    WaitForSingleObject(process_info.hProcess, INFINITE);
+
+    DWORD exit_code = 1;
+    GetExitCodeProcess(process_info.hProcess, &exit_code);
+
+    return (int)exit_code;
+#else
+    (void)argc;
+
+    setenv("NUITKA_ONEFILE_BINARY", binary_filename, 1);
+
+    execv(run_filename, argv);
+
+    fatalError("cannot run extracted program");
+    return 1;
+#endif
+}
@@ -20,8 +20,20 @@
 This module offers means to store and encode binary blobs in C semi
 efficiently. The "StreamData" class is used in two places, for constants
 and for freezing of bytecode.
+
+The blob can be compressed, then it is split into chunks, that are compressed
+independently, and preceded by an index of them. The C code accesses ranges
+of the blob through "CONSTANT_BIN_RANGE", which decompresses the chunks of a
+range on first use.
 """
 
+import struct
+import zlib
+
+# Size of independently compressed chunks of the blob, the smaller, the less
+# gets decompressed needlessly, but the worse the compression becomes.
+blob_chunk_size = 64 * 1024
+
 
 class StreamData(object):
     def __init__(self):
@@ -31,9 +43,13 @@ class StreamData(object):
         offset = self.getStreamDataOffset(value)
 
         if fixed_size:
-            return "&constant_bin[ %d ]" % offset
+            return "CONSTANT_BIN_RANGE( %d, %d )" % (offset, len(value))
         else:
-            return "&constant_bin[ %d ], %d" % (offset, len(value))
+            return "CONSTANT_BIN_RANGE( %d, %d ), %d" % (
+                offset,
+                len(value),
+                len(value),
+            )
 
     def getStreamDataOffset(self, value):
         offset = self.stream_data.find(value)
@@ -43,9 +59,41 @@ class StreamData(object):
 
         return offset
 
-    def getBytes(self):
+    def getBytes(self, compressed=False):
         r = self.stream_data
 
         # Release memory as soon as we are finished.
         del self.stream_data
+
+        if compressed:
+            r = _compressStreamData(r)
+
         return r
+
+
+def _compressStreamData(stream_data):
+    """ Compress the stream data into independently decompressable chunks.
+
+    The result starts with the uncompressed size, the chunk size, the number
+    of chunks, and the offsets of the chunks plus their end, all as 32 bit
+    little endian values, followed by the chunks in raw "deflate" format.
+    """
+
+    chunks = []
+
+    for start in range(0, len(stream_data), blob_chunk_size):
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+
+        chunks.append(
+            compressor.compress(stream_data[start : start + blob_chunk_size])
+            + compressor.flush()
+        )
+
+    offsets = [0]
+    for chunk in chunks:
+        offsets.append(offsets[-1] + len(chunk))
+
+    header = struct.pack("<III", len(stream_data), blob_chunk_size, len(chunks))
+    header += struct.pack("<%dI" % len(offsets), *offsets)
+
+    return header + b"".join(chunks)
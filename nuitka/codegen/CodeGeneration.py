@@ -145,6 +145,7 @@ from .IdCodes import generateBuiltinHashCode, generateBuiltinIdCode
 from .ImportCodes import (
     generateBuiltinImportCode,
     generateImportModuleHardCode,
+    generateImportModuleLazyCode,
     generateImportModuleNameHardCode,
     generateImportNameCode,
     generateImportStarCode,
@@ -601,6 +602,7 @@ setExpressionDispatchDict(
         "EXPRESSION_FUNCTION_CREATION": generateFunctionCreationCode,
         "EXPRESSION_FUNCTION_CALL": generateFunctionCallCode,
         "EXPRESSION_IMPORT_MODULE_HARD": generateImportModuleHardCode,
+        "EXPRESSION_IMPORT_MODULE_LAZY": generateImportModuleLazyCode,
         "EXPRESSION_IMPORT_MODULE_NAME_HARD": generateImportModuleNameHardCode,
         "EXPRESSION_IMPORT_NAME": generateImportNameCode,
         "EXPRESSION_LIST_OPERATION_EXTEND": generateListOperationExtendCode,
@@ -24,7 +24,7 @@ typical support functions to building parts.
 
 from contextlib import contextmanager
 
-from nuitka.Options import shallTraceExecution
+from nuitka.Options import shallProvideRuntimeStatistics, shallTraceExecution
 from nuitka.PythonVersions import python_version
 from nuitka.Tracing import printError
 
@@ -279,7 +279,9 @@ def withObjectCodeTemporaryAssignment(to_name, value_name, expression, emit, con
         getReleaseCode(value_name, emit, context)
 
 
-def pickCodeHelper(prefix, suffix, left_shape, right_shape, helpers, warn_missing=True):
+def pickCodeHelper(
+    prefix, suffix, left_shape, right_shape, helpers, emit, warn_missing=True
+):
     left_part = left_shape.helper_code
     right_part = right_shape.helper_code
 
@@ -294,6 +296,10 @@ def pickCodeHelper(prefix, suffix, left_shape, right_shape, helpers, warn_missin
     if warn_missing:
         onMissingHelper(ideal_helper)
 
+    # Count the uses of the fallback at run time, if asked to.
+    if shallProvideRuntimeStatistics():
+        emit('NUITKA_STATISTICS_FALLBACK("%s");' % ideal_helper)
+
     fallback_helper = "%s_%s_%s%s" % (prefix, "OBJECT", "OBJECT", suffix)
 
     return fallback_helper
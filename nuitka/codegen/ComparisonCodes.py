@@ -177,6 +177,7 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
                 left_shape=left.getTypeShape(),
                 right_shape=expression.getRight().getTypeShape(),
                 helpers=_cmp_obj_result_helpers_set,
+                emit=emit,
                 # TODO: Too many for now, so disable it
                 warn_missing=False,
             )
@@ -187,6 +188,7 @@ def generateComparisonExpressionCode(to_name, expression, emit, context):
                 left_shape=left.getTypeShape(),
                 right_shape=expression.getRight().getTypeShape(),
                 helpers=_cmp_bool_result_helpers_set,
+                emit=emit,
                 # TODO: Too many for now, so disable it
                 warn_missing=False,
             )
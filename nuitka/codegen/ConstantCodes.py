@@ -370,13 +370,23 @@ def __addConstantInitCode(
         This may be module or global init. Code makes sure that nested
         constants belong into the same scope.
     """
-    # This has many cases, that all return, and do a lot.
-    # pylint: disable=too-many-branches,too-many-locals,too-many-return-statements,too-many-statements
 
     # For the module level, we only mean to create constants that are used only
     # inside of it. For the global level, it must must be single use.
     if module_level:
         if context.global_context.getConstantUseCount(constant_identifier) != 1:
+            # Shared constants may be left for the modules using them to
+            # create, whichever is loaded first.
+            if Options.shallCreateConstantsLazily():
+                _addLazyConstantInitCode(
+                    context=context,
+                    emit=emit,
+                    check=check,
+                    constant_type=constant_type,
+                    constant_value=constant_value,
+                    constant_identifier=constant_identifier,
+                )
+
             return
     else:
         if context.getConstantUseCount(constant_identifier) == 1:
@@ -386,6 +396,69 @@ def __addConstantInitCode(
     # to be done now.
     done.add(constant_identifier)
 
+    _addConstantCreationCode(
+        context,
+        emit,
+        check,
+        constant_type,
+        constant_value,
+        constant_identifier,
+        module_level,
+    )
+
+
+# Shared constants already created lazily by module name.
+lazy_done = {}
+
+
+def _addLazyConstantInitCode(
+    context, emit, check, constant_type, constant_value, constant_identifier
+):
+    """ Emit code to create a shared constant, unless another module did.
+
+        Nested constants of shared constants are shared too, so these get
+        created by the same kind of code.
+    """
+    if context.global_context.isConstantEager(constant_identifier):
+        return
+
+    module_done = lazy_done.setdefault(context.getName(), set())
+
+    if constant_identifier in module_done:
+        return
+
+    module_done.add(constant_identifier)
+
+    creation_emit = SourceCodeCollector()
+
+    _addConstantCreationCode(
+        context=context,
+        emit=creation_emit,
+        check=check,
+        constant_type=constant_type,
+        constant_value=constant_value,
+        constant_identifier=constant_identifier,
+        module_level=True,
+    )
+
+    emit("if ( %s == NULL )" % constant_identifier)
+    emit("{")
+    emit(indented(creation_emit.codes))
+    emit("}")
+
+
+def _addConstantCreationCode(
+    context,
+    emit,
+    check,
+    constant_type,
+    constant_value,
+    constant_identifier,
+    module_level,
+):
+    # This has many cases, that all return, and do a lot.
+    # pylint: disable=too-many-branches,too-many-locals,too-many-return-statements,too-many-statements
+
     # Use shortest code for ints and longs.
     if constant_type is long:
         # See above, same for long values. Note: These are of course not
@@ -847,6 +920,12 @@ def getConstantsInitCode(context):
     )
 
     for constant_identifier, constant_value in sorted_constants:
+        # With lazy creation, the modules create what is not needed before.
+        if Options.shallCreateConstantsLazily() and not context.isConstantEager(
+            constant_identifier
+        ):
+            continue
+
         _addConstantInitCode(
             emit=emit,
             check=check,
@@ -1033,6 +1112,18 @@ def getConstantInitCodes(module_context):
         else:
             qualifier = "extern"
 
+            if Options.shallCreateConstantsLazily():
+                constant_value = global_context.constants[constant_identifier]
+
+                _addLazyConstantInitCode(
+                    emit=inits,
+                    check=checks,
+                    constant_type=type(constant_value),
+                    constant_value=constant_value,
+                    constant_identifier=constant_identifier,
+                    context=module_context,
+                )
+
         decls.append("%s PyObject *%s;" % (qualifier, constant_identifier))
 
         if Options.isDebug():
@@ -703,6 +703,10 @@ class PythonGlobalContext(object):
         self.constants = {}
         self.constant_use_count = {}
 
+        # Constants that must exist before any module is loaded, not even
+        # with lazy constants creation, e.g. because helper code uses them.
+        self.eager_constants = set()
+
         for constant in _getConstantDefaultPopulation():
             code = self.getConstantCode(constant)
 
@@ -710,6 +714,8 @@ class PythonGlobalContext(object):
             self.countConstantUse(code)
             self.countConstantUse(code)
 
+            self.markConstantEager(code)
+
     def getConstantCode(self, constant):
         # Use in user code, or for constants building code itself, many
         # constant types get special code immediately.
@@ -783,6 +789,12 @@ class PythonGlobalContext(object):
     def getConstantUseCount(self, constant):
         return self.constant_use_count[constant]
 
+    def markConstantEager(self, constant):
+        self.eager_constants.add(constant)
+
+    def isConstantEager(self, constant):
+        return constant in self.eager_constants
+
     def getConstants(self):
         return self.constants
 
@@ -56,6 +56,43 @@ def generateBuiltinImportCode(to_name, expression, emit, context):
         )
 
 
+def generateImportModuleLazyCode(to_name, expression, emit, context):
+    # We know that 5 expressions are created, pylint: disable=W0632
+    module_name, globals_name, locals_name, import_list_name, level_name = generateChildExpressionsCode(
+        expression=expression.getImport(), emit=emit, context=context
+    )
+
+    args = (
+        context.getConstantCode(expression.getVariableName()),
+        module_name,
+        globals_name,
+        locals_name,
+        import_list_name,
+        level_name,
+    )
+
+    with withObjectCodeTemporaryAssignment(
+        to_name, "imported_value", expression, emit, context
+    ) as value_name:
+        emit(
+            "%s = IMPORT_MODULE_LAZY( %s );"
+            % (
+                value_name,
+                ", ".join("NULL" if arg is None else str(arg) for arg in args),
+            )
+        )
+
+        getErrorExitCode(
+            check_name=value_name,
+            release_names=args[1:],
+            needs_check=True,
+            emit=emit,
+            context=context,
+        )
+
+        context.addCleanupTempName(value_name)
+
+
 # TODO: Maybe use this for other cases too, not just import.
 def _getCountedArgumentsHelperCallCode(
     helper_prefix, to_name, args, min_args, needs_check, emit, context
@@ -36,7 +36,7 @@ from .templates.CodeTemplatesLoader import (
 
 
 def getModuleMetapathLoaderEntryCode(
-    module_name, module_identifier, is_shlib, is_package
+    module_name, module_identifier, is_shlib, is_package, children
 ):
     if is_shlib:
         assert module_name != "__main__"
@@ -49,6 +49,7 @@ def getModuleMetapathLoaderEntryCode(
         return template_metapath_loader_compiled_package_entry % {
             "module_name": module_name,
             "module_identifier": module_identifier,
+            "children": children,
         }
     else:
         return template_metapath_loader_compiled_module_entry % {
@@ -60,62 +61,91 @@ def getModuleMetapathLoaderEntryCode(
 stream_data = ConstantCodes.stream_data
 
 
+def _getBytecodeModuleEntryCode(module, children):
+    code_data = module.getByteCode()
+
+    flags = ["NUITKA_BYTECODE_FLAG"]
+    if module.isUncompiledPythonPackage():
+        flags.append("NUITKA_PACKAGE_FLAG")
+
+    return template_metapath_loader_bytecode_module_entry % {
+        "module_name": module.getFullName(),
+        "bytecode": stream_data.getStreamDataOffset(code_data),
+        "size": len(code_data),
+        "flags": " | ".join(flags),
+        "children": children,
+    }
+
+
+def _isPackage(module):
+    return module.isCompiledPythonPackage() or module.isUncompiledPythonPackage()
+
+
+def _getPackageChildren(modules):
+    """ Indexes of the direct children of each package in sorted modules.
+
+    Triggers of plug-ins, e.g. "package.module-preLoad", are not children.
+    """
+    result = dict(
+        (module.getFullName(), []) for module in modules if _isPackage(module)
+    )
+
+    for count, module in enumerate(modules):
+        parent_name, _, child_name = module.getFullName().rpartition(".")
+
+        if parent_name in result and "-" not in child_name:
+            result[parent_name].append(count)
+
+    return result
+
+
 def getMetapathLoaderBodyCode(other_modules):
+    # The loader does binary searches with "strcmp" on these, which orders
+    # like UTF-8 encoded names do.
+    modules = sorted(
+        list(other_modules) + list(getUncompiledNonTechnicalModules()),
+        key=lambda module: module.getFullName().encode("utf8"),
+    )
+
+    package_children = _getPackageChildren(modules)
+
+    metapath_loader_children = []
     metapath_loader_inittab = []
     metapath_module_decls = []
 
-    for other_module in other_modules:
-        if other_module.isUncompiledPythonModule():
-            code_data = other_module.getByteCode()
-            is_package = other_module.isUncompiledPythonPackage()
+    for module in modules:
+        children = package_children.get(module.getFullName())
 
-            flags = ["NUITKA_BYTECODE_FLAG"]
-            if is_package:
-                flags.append("NUITKA_PACKAGE_FLAG")
+        if children:
+            children_code = "&meta_path_loader_children[%d], %d" % (
+                len(metapath_loader_children),
+                len(children),
+            )
 
+            metapath_loader_children.extend("%d," % child for child in children)
+        else:
+            children_code = "NULL, 0"
+
+        if module.isUncompiledPythonModule():
             metapath_loader_inittab.append(
-                template_metapath_loader_bytecode_module_entry
-                % {
-                    "module_name": other_module.getFullName(),
-                    "bytecode": stream_data.getStreamDataOffset(code_data),
-                    "size": len(code_data),
-                    "flags": " | ".join(flags),
-                }
+                _getBytecodeModuleEntryCode(module=module, children=children_code)
             )
         else:
             metapath_loader_inittab.append(
                 getModuleMetapathLoaderEntryCode(
-                    module_name=other_module.getFullName(),
-                    module_identifier=other_module.getCodeName(),
-                    is_shlib=other_module.isPythonShlibModule(),
-                    is_package=other_module.isCompiledPythonPackage(),
+                    module_name=module.getFullName(),
+                    module_identifier=module.getCodeName(),
+                    is_shlib=module.isPythonShlibModule(),
+                    is_package=module.isCompiledPythonPackage(),
+                    children=children_code,
                 )
             )
 
-        if other_module.isCompiledPythonModule():
-            metapath_module_decls.append(
-                "MOD_INIT_DECL( %s );" % other_module.getCodeName()
-            )
-
-    for uncompiled_module in getUncompiledNonTechnicalModules():
-        code_data = uncompiled_module.getByteCode()
-        is_package = uncompiled_module.isUncompiledPythonPackage()
-
-        flags = ["NUITKA_BYTECODE_FLAG"]
-        if is_package:
-            flags.append("NUITKA_PACKAGE_FLAG")
-
-        metapath_loader_inittab.append(
-            template_metapath_loader_bytecode_module_entry
-            % {
-                "module_name": uncompiled_module.getFullName(),
-                "bytecode": stream_data.getStreamDataOffset(code_data),
-                "size": len(code_data),
-                "flags": " | ".join(flags),
-            }
-        )
+        if module.isCompiledPythonModule():
+            metapath_module_decls.append("MOD_INIT_DECL( %s );" % module.getCodeName())
 
     return template_metapath_loader_body % {
         "metapath_module_decls": indented(metapath_module_decls, 0),
+        "metapath_loader_children": indented(metapath_loader_children),
         "metapath_loader_inittab": indented(metapath_loader_inittab),
     }
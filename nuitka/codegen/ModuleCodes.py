@@ -126,10 +126,11 @@ def getModuleValues(
     allocateNestedConstants(context)
 
     # Force internal module to not need constants init, by making all its
-    # constants be shared.
+    # constants be shared, and created at startup.
     if is_internal_module:
         for constant in context.getConstants():
             context.global_context.countConstantUse(constant)
+            context.global_context.markConstantEager(constant)
 
     return module_body_template_values
 
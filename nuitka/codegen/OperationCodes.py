@@ -179,6 +179,7 @@ def _getBinaryOperationCode(
             left_shape=left.getTypeShape(),
             right_shape=expression.getRight().getTypeShape(),
             helpers=_add_helpers_set,
+            emit=emit,
         )
     elif operator == "IAdd" and in_place:
         helper = pickCodeHelper(
@@ -187,6 +188,7 @@ def _getBinaryOperationCode(
             left_shape=left.getTypeShape(),
             right_shape=expression.getRight().getTypeShape(),
             helpers=_iadd_helpers_set,
+            emit=emit,
         )
     elif operator == "IMult" and in_place:
         helper = "BINARY_OPERATION_MUL_INPLACE"
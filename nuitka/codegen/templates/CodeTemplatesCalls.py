@@ -35,6 +35,8 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d( PyObject *called, PyObject **ar
     }
 #endif
 
+    NUITKA_STATISTICS_CALL( called );
+
     if ( Nuitka_Function_Check( called ) )
     {
         if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
@@ -367,7 +369,7 @@ PyObject *CALL_FUNCTION_WITH_ARGS%(args_count)d( PyObject *called, PyObject **ar
 
     PyObject *pos_args = MAKE_TUPLE( args, %(args_count)d );
 
-    PyObject *result = CALL_FUNCTION(
+    PyObject *result = _CALL_FUNCTION(
         called,
         pos_args,
         NULL
@@ -493,6 +495,8 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
         {
             if ( func == Nuitka_Function_Type.tp_descr_get )
             {
+                NUITKA_STATISTICS_CALL( descr );
+
                 PyObject *result = Nuitka_CallMethodFunctionPosArgs(
                     (struct Nuitka_FunctionObject const *)descr,
                     source,
@@ -588,6 +592,8 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
 
             if ( descr_get == Nuitka_Function_Type.tp_descr_get )
             {
+                NUITKA_STATISTICS_CALL( called_object );
+
                 return Nuitka_CallMethodFunctionPosArgs(
                     (struct Nuitka_FunctionObject const *)called_object,
                     source,
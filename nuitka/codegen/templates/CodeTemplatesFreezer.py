@@ -42,8 +42,14 @@ struct frozen_desc {
     int size;
 };
 
+// Where the modules got copied to, sorted by name, for the meta path based
+// loader to find them with a binary search.
+struct _frozen const *nuitka_frozen_modules = NULL;
+
 void copyFrozenModulesTo( struct _frozen *destination )
 {
+    nuitka_frozen_modules = destination;
+
     struct frozen_desc frozen_modules[] = {
 %(frozen_modules)s
         { NULL, 0, 0 }
@@ -54,7 +60,11 @@ void copyFrozenModulesTo( struct _frozen *destination )
     for(;;)
     {
         destination->name = (char *)current->name;
-        destination->code = (unsigned char *)&constant_bin[ current->start ];
+        // Packages are indicated with negative size.
+        destination->code = (unsigned char *)CONSTANT_BIN_RANGE(
+            current->start,
+            current->size < 0 ? -current->size : current->size
+        );
         destination->size = current->size;
 
         if (destination->name == NULL) break;
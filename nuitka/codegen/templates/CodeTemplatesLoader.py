@@ -21,16 +21,16 @@
 
 
 template_metapath_loader_compiled_module_entry = """\
-{ "%(module_name)s", MOD_INIT_NAME( %(module_identifier)s ), 0, 0, NUITKA_COMPILED_MODULE },"""
+{ "%(module_name)s", MOD_INIT_NAME( %(module_identifier)s ), 0, 0, NUITKA_COMPILED_MODULE, NULL, 0 },"""
 
 template_metapath_loader_compiled_package_entry = """\
-{ "%(module_name)s", MOD_INIT_NAME( %(module_identifier)s ), 0, 0, NUITKA_PACKAGE_FLAG },"""
+{ "%(module_name)s", MOD_INIT_NAME( %(module_identifier)s ), 0, 0, NUITKA_PACKAGE_FLAG, %(children)s },"""
 
 template_metapath_loader_shlib_module_entry = """\
-{ "%(module_name)s", NULL, 0, 0, NUITKA_SHLIB_FLAG },"""
+{ "%(module_name)s", NULL, 0, 0, NUITKA_SHLIB_FLAG, NULL, 0 },"""
 
 template_metapath_loader_bytecode_module_entry = """\
-{ "%(module_name)s", NULL, %(bytecode)s, %(size)d, %(flags)s },"""
+{ "%(module_name)s", NULL, %(bytecode)s, %(size)d, %(flags)s, %(children)s },"""
 
 
 template_metapath_loader_body = """\
@@ -43,10 +43,19 @@ template_metapath_loader_body = """\
  * our own loading for each of these.
  */
 %(metapath_module_decls)s
+/* Indexes of the direct children of packages in the table below, which is
+ * sorted by module name, so that the loader can do binary searches.
+ */
+static int const meta_path_loader_children[] =
+{
+%(metapath_loader_children)s
+    -1
+};
+
 static struct Nuitka_MetaPathBasedLoaderEntry meta_path_loader_entries[] =
 {
 %(metapath_loader_inittab)s
-    { NULL, NULL, 0, 0, 0 }
+    { NULL, NULL, 0, 0, 0, NULL, 0 }
 };
 
 void setupMetaPathBasedLoader( void )
@@ -388,8 +388,15 @@ MOD_INIT_DECL( %(module_identifier)s )
             PyObject *path_importer_cache = PySys_GetObject((char *)"path_importer_cache");
             CHECK_OBJECT( path_importer_cache );
 
-            int res = PyDict_SetItem( path_importer_cache, path_element, (PyObject *)&Nuitka_Loader_Type );
-            assert( res == 0 );
+            PyObject *loader = CALL_FUNCTION_WITH_SINGLE_ARG( (PyObject *)&Nuitka_Loader_Type, %(module_name_obj)s );
+
+            if ( loader )
+            {
+                int res = PyDict_SetItem( path_importer_cache, path_element, loader );
+                assert( res == 0 );
+
+                Py_DECREF( loader );
+            }
         }
     }
 #endif
@@ -41,7 +41,14 @@ stream_data = ConstantCodes.stream_data
 def generateBytecodeFrozenCode():
     frozen_defs = []
 
-    for uncompiled_module in getUncompiledTechnicalModules():
+    # The meta path based loader does a binary search with "strcmp" for these,
+    # which orders like UTF-8 encoded names do.
+    uncompiled_modules = sorted(
+        getUncompiledTechnicalModules(),
+        key=lambda module: module.getFullName().encode("utf8"),
+    )
+
+    for uncompiled_module in uncompiled_modules:
         module_name = uncompiled_module.getFullName()
         code_data = uncompiled_module.getByteCode()
         is_package = uncompiled_module.isUncompiledPythonPackage()
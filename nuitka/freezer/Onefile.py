@@ -0,0 +1,127 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Pack the standalone distribution folder into a single executable.
+
+The bootstrap program from "OnefileBootstrap.c" gets the files of the folder
+appended, followed by an index and a trailer, see there for the layout. The
+hash in the trailer names the directory the bootstrap extracts to, so it only
+needs to extract on the first run of a given payload.
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+import struct
+from logging import info
+
+from nuitka import Options
+from nuitka.utils.FileOperations import getFileList
+
+onefile_magic = b"NUITKAOF"
+
+# Flags of index entries.
+onefile_flag_executable = 1
+
+
+def _isExecutable(filename):
+    return os.stat(filename).st_mode & stat.S_IXUSR != 0
+
+
+def packDistFolder(bootstrap_filename, dist_dir, main_filename, result_filename):
+    """ Create the onefile binary from bootstrap and distribution folder.
+
+    Args:
+        bootstrap_filename: the compiled bootstrap program
+        dist_dir: standalone distribution folder to pack
+        main_filename: program in the distribution folder to run
+        result_filename: onefile binary to create
+    """
+
+    dist_dir = os.path.abspath(dist_dir)
+    main_filename = os.path.abspath(main_filename)
+
+    payload_hash = hashlib.md5()
+    index = []
+    main_entry = None
+
+    with open(result_filename, "wb") as output_file:
+        with open(bootstrap_filename, "rb") as bootstrap_file:
+            shutil.copyfileobj(bootstrap_file, output_file)
+
+        payload_start = output_file.tell()
+
+        for filename in getFileList(dist_dir):
+            name = os.path.relpath(filename, dist_dir).replace(os.path.sep, "/")
+
+            if filename == main_filename:
+                main_entry = len(index)
+
+            offset = output_file.tell() - payload_start
+            size = 0
+
+            with open(filename, "rb") as input_file:
+                while True:
+                    block = input_file.read(1024 * 1024)
+
+                    if not block:
+                        break
+
+                    payload_hash.update(block)
+                    output_file.write(block)
+                    size += len(block)
+
+            flags = onefile_flag_executable if _isExecutable(filename) else 0
+
+            index.append((name.encode("utf8"), flags, offset, size))
+
+        assert main_entry is not None, main_filename
+
+        index_start = output_file.tell()
+
+        for name, flags, offset, size in index:
+            entry = struct.pack("<IIQQ", len(name), flags, offset, size) + name
+
+            payload_hash.update(entry)
+            output_file.write(entry)
+
+        index_size = output_file.tell() - index_start
+
+        output_file.write(onefile_magic)
+        output_file.write(
+            struct.pack(
+                "<QQQII",
+                payload_start,
+                index_start,
+                index_size,
+                len(index),
+                main_entry,
+            )
+        )
+        output_file.write(payload_hash.hexdigest().encode("ascii"))
+
+    os.chmod(
+        result_filename,
+        os.stat(result_filename).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH,
+    )
+
+    if Options.isShowProgress():
+        info(
+            "Packed %d files of %r into onefile binary %r."
+            % (len(index), dist_dir, result_filename)
+        )
@@ -30,6 +30,7 @@ import inspect
 import marshal
 import os
 import shutil
+import stat
 import subprocess
 import sys
 from logging import debug, info, warning
@@ -48,20 +49,25 @@ from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 from nuitka.utils import Utils
 from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.ElfFiles import getElfDependencies, readElfInfo
 from nuitka.utils.Execution import withEnvironmentPathAdded
 from nuitka.utils.FileOperations import (
     areSamePaths,
+    breakHardLink,
+    cloneFile,
     deleteFile,
     getFileContentByLine,
     getFileContents,
+    getFileContentsHash,
     getSubDirectories,
     isPathBelow,
     listDir,
     makePath,
 )
+from nuitka.utils.PersistentCache import PersistentCache
 from nuitka.utils.SharedLibraries import getWindowsDLLVersion, removeSxsFromDLL
 from nuitka.utils.ThreadedExecutor import Lock, ThreadPoolExecutor, waitWorkers
-from nuitka.utils.Timing import TimerReport
+from nuitka.utils.Timing import StopWatch, TimerReport
 from nuitka.utils.Utils import getArchitecture
 
 from .DependsExe import getDependsExePath
@@ -117,6 +123,35 @@ def _detectedPrecompiledFile(filename, module_name, result, user_provided, techn
     module_names.add(module_name)
 
 
+def _compileFrozenSourceCode(source_code, filename):
+    # The compilation depends on the source code, the Python version and the
+    # optimization level of the running interpreter, which is what "compile"
+    # uses, with all of these in the key, it can be shared between builds.
+    cache_key = "%s\n%s\n%d\n%s\n%s" % (
+        sys.executable,
+        sys.version,
+        sys.flags.optimize,
+        filename,
+        hashlib.md5(
+            source_code.encode("utf8") if str is not bytes else source_code
+        ).hexdigest(),
+    )
+
+    cached = _getFrozenBytecodeCache().getEntry(cache_key)
+
+    if cached is not None:
+        try:
+            return marshal.loads(cached)
+        except (EOFError, ValueError, TypeError):
+            pass
+
+    bytecode = compile(source_code, filename, "exec", dont_inherit=True)
+
+    _getFrozenBytecodeCache().putEntry(cache_key, marshal.dumps(bytecode))
+
+    return bytecode
+
+
 def _detectedSourceFile(filename, module_name, result, user_provided, technical):
     if module_name in module_names:
         return
@@ -160,7 +195,7 @@ __file__ = (__nuitka_binary_dir + '%s%s') if '__nuitka_binary_dir' in dict(__bui
         module_name=module_name, is_package=is_package, source_code=source_code
     )
 
-    bytecode = compile(source_code, filename, "exec", dont_inherit=True)
+    bytecode = _compileFrozenSourceCode(source_code, filename)
 
     bytecode = Plugins.onFrozenModuleBytecode(
         module_name=module_name, is_package=is_package, bytecode=bytecode
@@ -205,16 +240,14 @@ def _detectedShlibFile(filename, module_name):
         name=name, package_name=package_name, source_ref=source_ref
     )
 
-    ModuleRegistry.addRootModule(shlib_module)
+    # Only detected as used, it may not be needed by the program.
+    ModuleRegistry.addRootModule(shlib_module, required=False)
     ImportCache.addImportedModule(shlib_module)
 
     module_names.add(module_name)
 
 
 def _detectImports(command, user_provided, technical):
-    # This is pretty complicated stuff, with variants to deal with.
-    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
-
     # Print statements for stuff to show, the modules loaded.
     if python_version >= 300:
         command += (
@@ -238,6 +271,46 @@ def _detectImports(command, user_provided, technical):
         "import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)
     ) + command
 
+    cache_key = _getStandardLibraryCacheKey() + "\n" + command
+
+    detections = _getCachedImportDetections(cache_key)
+
+    if detections is None:
+        detections = _runImportDetection(command)
+
+        _storeCachedImportDetections(cache_key, detections)
+
+    result = []
+
+    for module_name, _prio, kind, filename in sorted(detections):
+        if kind == "precompiled":
+            _detectedPrecompiledFile(
+                filename=filename,
+                module_name=module_name,
+                result=result,
+                user_provided=user_provided,
+                technical=technical,
+            )
+        elif kind == "sourcefile":
+            _detectedSourceFile(
+                filename=filename,
+                module_name=module_name,
+                result=result,
+                user_provided=user_provided,
+                technical=technical,
+            )
+        elif kind == "shlib":
+            _detectedShlibFile(filename=filename, module_name=module_name)
+        else:
+            assert False, kind
+
+    return result
+
+
+def _runImportDetection(command):
+    # This is pretty complicated stuff, with variants to deal with.
+    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+
     import tempfile
 
     tmp_file, tmp_filename = tempfile.mkstemp()
@@ -265,8 +338,6 @@ def _detectImports(command, user_provided, technical):
             Tracing.printError(line)
         sys.exit("Error, please report the issue with above output.")
 
-    result = []
-
     debug("Detecting imports:")
 
     detections = []
@@ -328,31 +399,109 @@ def _detectImports(command, user_provided, technical):
 
                 detections.append((module_name, 1, "shlib", filename))
 
-    for module_name, _prio, kind, filename in sorted(detections):
-        if kind == "precompiled":
-            _detectedPrecompiledFile(
-                filename=filename,
-                module_name=module_name,
-                result=result,
-                user_provided=user_provided,
-                technical=technical,
-            )
-        elif kind == "sourcefile":
-            _detectedSourceFile(
-                filename=filename,
-                module_name=module_name,
-                result=result,
-                user_provided=user_provided,
-                technical=technical,
-            )
-        elif kind == "shlib":
-            _detectedShlibFile(filename=filename, module_name=module_name)
-        else:
-            assert False, kind
+    return detections
+
+
+# The scans of the standard library depend only on the Python installation,
+# entries are small, this is plenty.
+_stdlib_cache_size = 10 * 1024 * 1024
+_stdlib_cache = None
+
+
+def _getStandardLibraryCache():
+    # This is a singleton, pylint: disable=global-statement
+    global _stdlib_cache
+
+    if _stdlib_cache is None:
+        _stdlib_cache = PersistentCache(
+            name="stdlib_scans", max_size=_stdlib_cache_size
+        )
+
+    return _stdlib_cache
+
+
+# Bytecode of the frozen modules, these are larger.
+_frozen_bytecode_cache_size = 100 * 1024 * 1024
+_frozen_bytecode_cache = None
+
+
+def _getFrozenBytecodeCache():
+    # This is a singleton, pylint: disable=global-statement
+    global _frozen_bytecode_cache
+
+    if _frozen_bytecode_cache is None:
+        _frozen_bytecode_cache = PersistentCache(
+            name="frozen_bytecode", max_size=_frozen_bytecode_cache_size
+        )
+
+    return _frozen_bytecode_cache
+
+
+def _getStandardLibraryCacheKey():
+    """ Identify the Python installation for caching scans of it.
+
+        Updates of the Python, or packages installed into the standard library
+        change the modification time of the binary or the directories.
+    """
+
+    # Using the function object to cache its result, avoiding global variable
+    # usage.
+    if not hasattr(_getStandardLibraryCacheKey, "result"):
+        parts = [
+            sys.executable,
+            "%.3f" % os.path.getmtime(sys.executable),
+            sys.version,
+        ]
+
+        for stdlib_dir in sorted(getStandardLibraryPaths()):
+            parts.append(stdlib_dir)
+            parts.append("%.3f" % os.path.getmtime(stdlib_dir))
+
+            for dirname, filename in listDir(stdlib_dir):
+                # Bytecode writing and third party packages do not matter.
+                if filename in ("__pycache__", "site-packages", "dist-packages"):
+                    continue
+
+                if os.path.isdir(dirname):
+                    parts.append("%.3f" % os.path.getmtime(dirname))
+
+        _getStandardLibraryCacheKey.result = "\n".join(parts)
+
+    return _getStandardLibraryCacheKey.result
+
+
+def _getCachedImportDetections(cache_key):
+    cached = _getStandardLibraryCache().getEntry(cache_key)
+
+    if cached is None:
+        return None
+
+    if str is not bytes:
+        cached = cached.decode("utf8")
+
+    result = []
+
+    for line in cached.splitlines():
+        module_name, prio, kind, filename = line.split("\t")
+
+        # Should not happen with unchanged directory times, but be safe.
+        if not os.path.exists(filename):
+            return None
+
+        result.append((module_name, int(prio), kind, filename))
 
     return result
 
 
+def _storeCachedImportDetections(cache_key, detections):
+    value = "\n".join("%s\t%d\t%s\t%s" % detection for detection in detections)
+
+    if str is not bytes:
+        value = value.encode("utf8")
+
+    _getStandardLibraryCache().putEntry(cache_key, value)
+
+
 # Some modules we want to blacklist.
 ignore_modules = ["__main__.py", "__init__.py", "antigravity.py"]
 
@@ -447,6 +596,29 @@ def scanStandardLibraryPath(stdlib_dir):
                 yield import_path + "." + dirname
 
 
+def _getStandardLibraryModuleNames(stdlib_dir):
+    cache_key = "%s\nscan %s" % (_getStandardLibraryCacheKey(), stdlib_dir)
+
+    cached = _getStandardLibraryCache().getEntry(cache_key)
+
+    if cached is not None:
+        if str is not bytes:
+            cached = cached.decode("utf8")
+
+        return cached.split()
+
+    result = list(scanStandardLibraryPath(stdlib_dir))
+
+    value = "\n".join(result)
+
+    if str is not bytes:
+        value = value.encode("utf8")
+
+    _getStandardLibraryCache().putEntry(cache_key, value)
+
+    return result
+
+
 def detectEarlyImports():
     encoding_names = [
         filename[:-3]
@@ -481,8 +653,7 @@ def detectEarlyImports():
 
         # Scan the standard library paths (multiple in case of virtualenv.
         for stdlib_dir in getStandardLibraryPaths():
-            for module_name in scanStandardLibraryPath(stdlib_dir):
-                stdlib_modules.add(module_name)
+            stdlib_modules.update(_getStandardLibraryModuleNames(stdlib_dir))
 
         # Put here ones that should be imported first.
         first_ones = ("Tkinter",)
@@ -548,20 +719,13 @@ _detected_python_rpath = None
 ldd_result_cache = {}
 
 
-def _detectBinaryPathDLLsLinuxBSD(dll_filename):
-    # This is complex, as it also includes the caching mechanism
-    # pylint: disable=too-many-branches
-
-    if ldd_result_cache.get(dll_filename):
-        return ldd_result_cache[dll_filename]
-
-    # Ask "ldd" about the libraries being used by the created binary, these
-    # are the ones that interest us.
-    result = set()
+def _getPythonLibraryPaths():
+    """ The RPATH of the Python binary, which will be effective when loading
+        the other DLLs too. This happens at least for Python installs on
+        Travis.
+    """
 
-    # This is the rpath of the Python binary, which will be effective when
-    # loading the other DLLs too. This happens at least for Python installs
-    # on Travis. pylint: disable=global-statement
+    # pylint: disable=global-statement
     global _detected_python_rpath
     if _detected_python_rpath is None and not Utils.isPosixWindows():
         _detected_python_rpath = getSharedLibraryRPATH(sys.executable) or False
@@ -571,84 +735,133 @@ def _detectBinaryPathDLLsLinuxBSD(dll_filename):
                 b"$ORIGIN", os.path.dirname(sys.executable).encode("utf-8")
             )
 
-    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _detected_python_rpath):
+    return _detected_python_rpath
+
+
+def _detectBinaryPathDLLsLdd(dll_filename):
+    # Ask "ldd" about the libraries being used by the created binary, these
+    # are the ones that interest us.
+    result = []
+
+    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _getPythonLibraryPaths()):
         process = subprocess.Popen(
             args=["ldd", dll_filename], stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
 
         stdout, _stderr = process.communicate()
 
-        for line in stdout.split(b"\n"):
-            if not line:
-                continue
+    for line in stdout.split(b"\n"):
+        if not line:
+            continue
 
-            if b"=>" not in line:
-                continue
+        if b"=>" not in line:
+            continue
 
-            part = line.split(b" => ", 2)[1]
+        part = line.split(b" => ", 2)[1]
 
-            if b"(" in part:
-                filename = part[: part.rfind(b"(") - 1]
-            else:
-                filename = part
+        if b"(" in part:
+            filename = part[: part.rfind(b"(") - 1]
+        else:
+            filename = part
 
-            if not filename:
-                continue
+        if not filename:
+            continue
 
-            if python_version >= 300:
-                filename = filename.decode("utf-8")
+        if python_version >= 300:
+            filename = filename.decode("utf-8")
 
-            # Sometimes might use stuff not found or supplied by ldd itself.
-            if filename in ("not found", "ldd"):
-                continue
+        # Sometimes might use stuff not found or supplied by ldd itself.
+        if filename in ("not found", "ldd"):
+            continue
 
-            # Do not include kernel / glibc specific libraries. This list has been
-            # assembled by looking what are the most common .so files provided by
-            # glibc packages from ArchLinux, Debian Stretch and CentOS.
-            #
-            # Online sources:
-            #  - https://centos.pkgs.org/7/puias-computational-x86_64/glibc-aarch64-linux-gnu-2.24-2.sdl7.2.noarch.rpm.html
-            #  - https://centos.pkgs.org/7/centos-x86_64/glibc-2.17-222.el7.x86_64.rpm.html
-            #  - https://archlinux.pkgs.org/rolling/archlinux-core-x86_64/glibc-2.28-5-x86_64.pkg.tar.xz.html
-            #  - https://packages.debian.org/stretch/amd64/libc6/filelist
-            #
-            # Note: This list may still be incomplete. Some additional libraries
-            # might be provided by glibc - it may vary between the package versions
-            # and between Linux distros. It might or might not be a problem in the
-            # future, but it should be enough for now.
-            if os.path.basename(filename).startswith(
-                (
-                    "ld-linux-x86-64.so",
-                    "libc.so.",
-                    "libpthread.so.",
-                    "libm.so.",
-                    "libdl.so.",
-                    "libBrokenLocale.so.",
-                    "libSegFault.so",
-                    "libanl.so.",
-                    "libcidn.so.",
-                    "libcrypt.so.",
-                    "libmemusage.so",
-                    "libmvec.so.",
-                    "libnsl.so.",
-                    "libnss_compat.so.",
-                    "libnss_db.so.",
-                    "libnss_dns.so.",
-                    "libnss_files.so.",
-                    "libnss_hesiod.so.",
-                    "libnss_nis.so.",
-                    "libnss_nisplus.so.",
-                    "libpcprofile.so",
-                    "libresolv.so.",
-                    "librt.so.",
-                    "libthread_db-1.0.so",
-                    "libthread_db.so.",
-                    "libutil.so.",
-                )
-            ):
-                continue
+        result.append(filename)
 
-            result.add(filename)
+    return result
+
+
+def _detectBinaryPathDLLsElf(dll_filename):
+    # Search like the loader does, as if "ldd" was run, but without loading
+    # anything or running a process.
+    library_paths = []
+
+    if os.environ.get("LD_LIBRARY_PATH"):
+        library_paths += os.environ["LD_LIBRARY_PATH"].split(os.pathsep)
+
+    python_rpath = _getPythonLibraryPaths()
+
+    if python_rpath:
+        if python_version >= 300:
+            python_rpath = python_rpath.decode("utf-8")
+
+        library_paths += python_rpath.split(os.pathsep)
+
+    return getElfDependencies(dll_filename, library_paths)
+
+
+def _detectBinaryPathDLLsLinuxBSD(dll_filename):
+    if ldd_result_cache.get(dll_filename):
+        return ldd_result_cache[dll_filename]
+
+    result = set()
+
+    # The ELF reader knows how the Linux loader searches, for other systems
+    # and files it cannot read, "ldd" is still asked.
+    filenames = None
+
+    if Utils.getOS() == "Linux":
+        filenames = _detectBinaryPathDLLsElf(dll_filename)
+
+    if filenames is None:
+        filenames = _detectBinaryPathDLLsLdd(dll_filename)
+
+    for filename in filenames:
+        # Do not include kernel / glibc specific libraries. This list has been
+        # assembled by looking what are the most common .so files provided by
+        # glibc packages from ArchLinux, Debian Stretch and CentOS.
+        #
+        # Online sources:
+        #  - https://centos.pkgs.org/7/puias-computational-x86_64/glibc-aarch64-linux-gnu-2.24-2.sdl7.2.noarch.rpm.html
+        #  - https://centos.pkgs.org/7/centos-x86_64/glibc-2.17-222.el7.x86_64.rpm.html
+        #  - https://archlinux.pkgs.org/rolling/archlinux-core-x86_64/glibc-2.28-5-x86_64.pkg.tar.xz.html
+        #  - https://packages.debian.org/stretch/amd64/libc6/filelist
+        #
+        # Note: This list may still be incomplete. Some additional libraries
+        # might be provided by glibc - it may vary between the package versions
+        # and between Linux distros. It might or might not be a problem in the
+        # future, but it should be enough for now.
+        if os.path.basename(filename).startswith(
+            (
+                "ld-linux-x86-64.so",
+                "libc.so.",
+                "libpthread.so.",
+                "libm.so.",
+                "libdl.so.",
+                "libBrokenLocale.so.",
+                "libSegFault.so",
+                "libanl.so.",
+                "libcidn.so.",
+                "libcrypt.so.",
+                "libmemusage.so",
+                "libmvec.so.",
+                "libnsl.so.",
+                "libnss_compat.so.",
+                "libnss_db.so.",
+                "libnss_dns.so.",
+                "libnss_files.so.",
+                "libnss_hesiod.so.",
+                "libnss_nis.so.",
+                "libnss_nisplus.so.",
+                "libpcprofile.so",
+                "libresolv.so.",
+                "librt.so.",
+                "libthread_db-1.0.so",
+                "libthread_db.so.",
+                "libutil.so.",
+            )
+        ):
+            continue
+
+        result.add(filename)
 
     # Allow plugins to prevent inclusion.
     blocked = Plugins.removeDllDependencies(
@@ -705,35 +918,129 @@ def _detectBinaryPathDLLsMacOS(original_dir, binary_filename):
     return result
 
 
-def _getCacheFilename(is_main_executable, source_dir, original_dir, binary_filename):
-    original_filename = os.path.join(original_dir, os.path.basename(binary_filename))
-
-    original_filename = os.path.normcase(original_filename)
-
+def _getCacheKey(is_main_executable, source_dir, binary_filename, package_name):
     if is_main_executable:
         # Normalize main program name for caching as well, but need to use the
         # scons information to distinguish different Python and arches, and
         # compilers, so we use different libs there.
         hashed_value = getFileContents(os.path.join(source_dir, "scons-report.txt"))
     else:
-        hashed_value = original_filename
+        # The contents decide, so the same library installed to another place,
+        # e.g. a new virtualenv, still uses the cached result.
+        hashed_value = getFileContentsHash(binary_filename)
+
+    # Have different values for different Python versions and arches, but not
+    # for virtualenvs of the same Python, the prefixes are replaced in the
+    # cached paths.
+    return "%s\n%s\n%s\n%s" % (
+        hashed_value,
+        package_name,
+        sys.version,
+        getArchitecture(),
+    )
+
+
+# Cached DLL dependencies of all projects, entries are tiny, so this is plenty.
+_dependency_cache_size = 20 * 1024 * 1024
+_dependency_cache = None
+
+
+def _getDependencyCache():
+    # This is a singleton, pylint: disable=global-statement
+    global _dependency_cache
+
+    if _dependency_cache is None:
+        _dependency_cache = PersistentCache(
+            name="library_deps_pefile"
+            if Options.isExperimental("use_pefile")
+            else "library_deps",
+            max_size=_dependency_cache_size,
+        )
+
+    return _dependency_cache
+
+
+def _getCachedPathBases(original_dir):
+    result = []
+
+    if original_dir is not None:
+        result.append(("ORIGINAL_DIR", original_dir))
+
+    result.append(("PREFIX", sys.prefix))
+
+    # For virtualenv, the DLLs of the real Python installation.
+    base_prefix = getattr(sys, "real_prefix", getattr(sys, "base_prefix", sys.prefix))
+    result.append(("BASE_PREFIX", base_prefix))
+
+    if "SYSTEMROOT" in os.environ:
+        result.append(("SYSTEMROOT", os.environ["SYSTEMROOT"]))
+
+    return [
+        (name, os.path.normcase(os.path.abspath(base_dir)))
+        for name, base_dir in result
+    ]
+
+
+def _encodeCachedPath(path, bases):
+    for name, base_dir in bases:
+        if path.startswith(base_dir + os.path.sep):
+            return "$%s/%s" % (
+                name,
+                path[len(base_dir) + 1 :].replace(os.path.sep, "/"),
+            )
 
-    # Have different values for different Python major versions.
-    hashed_value += sys.version + sys.executable
+    return path
+
+
+def _decodeCachedPath(line, bases):
+    if not line.startswith("$"):
+        return line
+
+    name, rest = line[1:].split("/", 1)
+
+    return os.path.join(dict(bases)[name], rest.replace("/", os.path.sep))
+
+
+def _getCachedDLLs(cache_key, original_dir):
+    cached = _getDependencyCache().getEntry(cache_key)
+
+    if cached is None:
+        return None
 
     if str is not bytes:
-        hashed_value = hashed_value.encode("utf8")
+        cached = cached.decode("utf8")
+
+    bases = _getCachedPathBases(original_dir)
+
+    result = set()
 
-    cache_dir = os.path.join(
-        getCacheDir(),
-        "library_deps_pefile"
-        if Options.isExperimental("use_pefile")
-        else "library_deps",
+    for line in cached.splitlines():
+        try:
+            dll_filename = _decodeCachedPath(line, bases)
+        except (KeyError, ValueError):
+            return None
+
+        # Libraries may have gone, or not exist in a new virtualenv, then the
+        # result is not reliable.
+        if not os.path.isfile(dll_filename):
+            return None
+
+        result.add(dll_filename)
+
+    return result
+
+
+def _storeCachedDLLs(cache_key, original_dir, dll_filenames):
+    bases = _getCachedPathBases(original_dir)
+
+    value = "\n".join(
+        sorted(_encodeCachedPath(dll_filename, bases) for dll_filename in dll_filenames)
     )
 
-    makePath(cache_dir)
+    if str is not bytes:
+        value = value.encode("utf8")
 
-    return os.path.join(cache_dir, hashlib.md5(hashed_value).hexdigest())
+    _getDependencyCache().putEntry(cache_key, value)
 
 
 # Locking seems to be only required for Windows currently, expressed that in the
@@ -1018,20 +1325,15 @@ def _detectBinaryPathDLLsWindows(
 
     result = set()
 
-    cache_filename = _getCacheFilename(
-        is_main_executable, source_dir, original_dir, binary_filename
+    cache_key = _getCacheKey(
+        is_main_executable, source_dir, binary_filename, package_name
     )
 
-    if (
-        os.path.exists(cache_filename)
-        and not Options.shallNotUseDependsExeCachedResults()
-    ):
-        for line in getFileContentByLine(cache_filename):
-            line = line.strip()
+    if not Options.shallNotUseDependsExeCachedResults():
+        cached_result = _getCachedDLLs(cache_key, original_dir)
 
-            result.add(line)
-
-        return result
+        if cached_result is not None:
+            return cached_result
 
     # User query should only happen once if at all.
     with _withLock():
@@ -1105,9 +1407,7 @@ SxS
     deleteFile(binary_filename + ".dwp", must_exist=True)
 
     if not Options.shallNotStoreDependsExeCachedResults():
-        with open(cache_filename, "w") as cache_file:
-            for dll_filename in result:
-                print(dll_filename, file=cache_file)
+        _storeCachedDLLs(cache_key, original_dir, result)
 
     return result
 
@@ -1186,20 +1486,15 @@ def _detectBinaryPathDLLsWindowsPE(
 
     result = set()
 
-    cache_filename = _getCacheFilename(
-        is_main_executable, source_dir, original_dir, binary_filename
+    cache_key = _getCacheKey(
+        is_main_executable, source_dir, binary_filename, package_name
     )
 
-    if (
-        os.path.exists(cache_filename)
-        and not Options.shallNotUseDependsExeCachedResults()
-    ):
-        for line in getFileContentByLine(cache_filename):
-            line = line.strip()
+    if not Options.shallNotUseDependsExeCachedResults():
+        cached_result = _getCachedDLLs(cache_key, original_dir)
 
-            result.add(line)
-
-        return result
+        if cached_result is not None:
+            return cached_result
 
     scan_dirs = [sys.prefix]
 
@@ -1264,9 +1559,7 @@ def _detectBinaryPathDLLsWindowsPE(
     _parsePEFileOutput(binary_filename, scan_dirs, result)
 
     if not Options.shallNotStoreDependsExeCachedResults():
-        with open(cache_filename, "w") as cache_file:
-            for dll_filename in result:
-                print(dll_filename, file=cache_file)
+        _storeCachedDLLs(cache_key, original_dir, result)
 
     return result
 
@@ -1391,6 +1684,8 @@ def fixupBinaryDLLPaths(binary_filename, is_exe, dll_map):
     for original_path, dist_path in dll_map:
         command += ["-change", original_path, "@executable_path/" + dist_path]
 
+    breakHardLink(binary_filename)
+
     os.chmod(binary_filename, int("644", 8))
     command.append(binary_filename)
     process = subprocess.Popen(
@@ -1404,6 +1699,17 @@ def fixupBinaryDLLPaths(binary_filename, is_exe, dll_map):
 
 
 def getSharedLibraryRPATH(filename):
+    if Utils.getOS() == "Linux":
+        elf_info = readElfInfo(filename)
+
+        if elf_info is not None:
+            rpath = elf_info.rpath or elf_info.runpath
+
+            if rpath is not None and python_version >= 300:
+                rpath = rpath.encode("utf-8", "surrogateescape")
+
+            return rpath
+
     process = subprocess.Popen(
         ["readelf", "-d", filename],
         stdout=subprocess.PIPE,
@@ -1441,6 +1747,8 @@ Error, needs 'chrpath' on your system, due to 'RPATH' settings in used shared
 libraries that need to be removed."""
             )
 
+        breakHardLink(filename)
+
         os.chmod(filename, int("644", 8))
         process = subprocess.Popen(
             ["chrpath", "-d", filename],
@@ -1455,42 +1763,54 @@ libraries that need to be removed."""
         assert retcode == 0, filename
 
 
-def copyUsedDLLs(source_dir, dist_dir, standalone_entry_points):
-    # This is terribly complex, because we check the list of used DLLs
-    # trying to avoid duplicates, and detecting errors with them not
-    # being binary identical, so we can report them. And then of course
-    # we also need to handle OS specifics.
-    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
+def _getFileContentsHashes(filenames):
+    def getHash(filename):
+        return filename, getFileContentsHash(filename)
 
-    used_dlls = detectUsedDLLs(source_dir, standalone_entry_points)
+    result = {}
 
-    removed_dlls = set()
+    if not filenames:
+        return result
 
-    # Fist make checks and remove some.
-    for dll_filename1, sources1 in tuple(iterItems(used_dlls)):
-        if dll_filename1 in removed_dlls:
-            continue
+    with ThreadPoolExecutor(max_workers=Utils.getCoreCount() * 3) as worker_pool:
+        workers = [worker_pool.submit(getHash, filename) for filename in filenames]
 
-        for dll_filename2, sources2 in tuple(iterItems(used_dlls)):
-            if dll_filename1 == dll_filename2:
-                continue
+        for filename, hash_value in waitWorkers(workers):
+            result[filename] = hash_value
 
-            if dll_filename2 in removed_dlls:
-                continue
+    return result
 
-            # Colliding basenames are an issue to us.
-            if os.path.basename(dll_filename1) != os.path.basename(dll_filename2):
-                continue
 
-            # May already have been removed earlier
-            if dll_filename1 not in used_dlls:
-                continue
+def _removeDuplicateDLLs(used_dlls):
+    # Group by DLL name, only those with colliding names need checks.
+    dll_groups = OrderedDict()
 
-            if dll_filename2 not in used_dlls:
-                continue
+    for dll_filename in used_dlls:
+        dll_name = os.path.basename(dll_filename)
+
+        if dll_name not in dll_groups:
+            dll_groups[dll_name] = []
+        dll_groups[dll_name].append(dll_filename)
+
+    colliding_groups = [
+        (dll_name, dll_filenames)
+        for dll_name, dll_filenames in iterItems(dll_groups)
+        if len(dll_filenames) > 1
+    ]
+
+    # Read every colliding file only once, and in parallel.
+    dll_hashes = _getFileContentsHashes(
+        [
+            dll_filename
+            for _dll_name, dll_filenames in colliding_groups
+            for dll_filename in dll_filenames
+        ]
+    )
 
-            dll_name = os.path.basename(dll_filename1)
+    for dll_name, dll_filenames in colliding_groups:
+        dll_filename1 = dll_filenames[0]
 
+        for dll_filename2 in dll_filenames[1:]:
             if Options.isShowInclusion():
                 info(
                     """Colliding DLL names for %s, checking identity of \
@@ -1500,11 +1820,8 @@ def copyUsedDLLs(source_dir, dist_dir, standalone_entry_points):
 
             # Check that if a DLL has the same name, if it's identical,
             # happens at least for OSC and Fedora 20.
-            import filecmp
-
-            if filecmp.cmp(dll_filename1, dll_filename2):
+            if dll_hashes[dll_filename1] == dll_hashes[dll_filename2]:
                 del used_dlls[dll_filename2]
-                removed_dlls.add(dll_filename2)
 
                 continue
 
@@ -1515,12 +1832,11 @@ def copyUsedDLLs(source_dir, dist_dir, standalone_entry_points):
 
                 if dll_version2 < dll_version1:
                     del used_dlls[dll_filename2]
-                    removed_dlls.add(dll_filename2)
 
                     solved = True
                 elif dll_version1 < dll_version2:
                     del used_dlls[dll_filename1]
-                    removed_dlls.add(dll_filename1)
+                    dll_filename1 = dll_filename2
 
                     solved = True
                 else:
@@ -1544,14 +1860,111 @@ different from
                 % (
                     dll_name,
                     dll_filename1,
-                    "\n   ".join(sources1),
+                    "\n   ".join(used_dlls[dll_filename1]),
                     dll_filename2,
-                    "\n   ".join(sources2),
+                    "\n   ".join(used_dlls[dll_filename2]),
                 )
             )
 
             del used_dlls[dll_filename2]
-            removed_dlls.add(dll_filename2)
+
+
+def _getDistStoreFilename(source_filename, preserve_stat):
+    """ Get the filename of a copy of the file in the content addressed store.
+
+        With stat preserved, the mode is part of the name, as hard links share
+        it. The copy is made if it does not exist yet.
+    """
+
+    store_name = getFileContentsHash(source_filename)
+
+    if preserve_stat:
+        store_name += "-%o" % stat.S_IMODE(os.stat(source_filename).st_mode)
+
+    store_dir = os.path.join(getCacheDir(), "dist_files", store_name[:2])
+    store_filename = os.path.join(store_dir, store_name)
+
+    if not os.path.exists(store_filename):
+        makePath(store_dir)
+
+        temp_filename = "%s.%d.tmp" % (store_filename, os.getpid())
+
+        if preserve_stat:
+            shutil.copy2(source_filename, temp_filename)
+        else:
+            shutil.copyfile(source_filename, temp_filename)
+
+        try:
+            os.rename(temp_filename, store_filename)
+        except OSError:
+            # Another process was faster on Windows, same contents.
+            deleteFile(temp_filename, must_exist=False)
+
+    return store_filename
+
+
+_dist_link_failed = False
+
+
+def copyDistFile(source_filename, target_filename, preserve_stat=False):
+    """ Put a file into the distribution folder.
+
+    Args:
+        source_filename: file to copy
+        target_filename: filename inside the distribution folder
+        preserve_stat: copy mode and times too, like "shutil.copy2"
+
+    Notes:
+        Depending on "--dist-file-links" this links or clones from the
+        store of files in the cache directory rather than copying. Code that
+        modifies deployed files in place, must use "breakHardLink" first.
+    """
+    # This is a singleton, pylint: disable=global-statement
+    global _dist_link_failed
+
+    link_mode = Options.getDistFileLinkMode()
+
+    if link_mode != "copy" and not _dist_link_failed:
+        store_filename = _getDistStoreFilename(source_filename, preserve_stat)
+
+        deleteFile(target_filename, must_exist=False)
+
+        if link_mode == "hardlink":
+            try:
+                os.link(store_filename, target_filename)
+                return
+            except (AttributeError, OSError):
+                # Python2 on Windows has no "os.link", and file systems may
+                # not support it, or the store is on another device.
+                pass
+        elif cloneFile(store_filename, target_filename):
+            if preserve_stat:
+                shutil.copystat(store_filename, target_filename)
+
+            return
+
+        warning(
+            "Cannot use '%s' for distribution folder files, copying instead."
+            % link_mode
+        )
+        _dist_link_failed = True
+
+    if preserve_stat:
+        shutil.copy2(source_filename, target_filename)
+    else:
+        shutil.copyfile(source_filename, target_filename)
+
+
+def copyUsedDLLs(source_dir, dist_dir, standalone_entry_points):
+    # This is terribly complex, because we check the list of used DLLs
+    # trying to avoid duplicates, and detecting errors with them not
+    # being binary identical, so we can report them. And then of course
+    # we also need to handle OS specifics.
+
+    used_dlls = detectUsedDLLs(source_dir, standalone_entry_points)
+
+    # Fist make checks and remove some.
+    _removeDuplicateDLLs(used_dlls)
 
     dll_map = []
 
@@ -1560,7 +1973,7 @@ different from
 
         target_path = os.path.join(dist_dir, dll_name)
 
-        shutil.copyfile(dll_filename, target_path)
+        copyDistFile(dll_filename, target_path)
 
         dll_map.append((dll_filename, dll_name))
 
@@ -1570,39 +1983,108 @@ different from
                 % (dll_filename, ", ".join(sources))
             )
 
+    # For macOS, the binary and the DLLs needs to be changed to reflect the
+    # relative DLL location in the ".dist" folder, for Linux, the "rpath" of
+    # libraries may be an issue and must be removed, and for Win32 we might
+    # have to remove SXS paths. These and stripping are done in parallel.
     if Utils.getOS() == "Darwin":
-        # For macOS, the binary and the DLLs needs to be changed to reflect
-        # the relative DLL location in the ".dist" folder.
-        for standalone_entry_point in standalone_entry_points:
-            fixupBinaryDLLPaths(
-                binary_filename=standalone_entry_point[1],
-                is_exe=standalone_entry_point is standalone_entry_points[0],
-                dll_map=dll_map,
+        binary_filenames = [
+            (
+                standalone_entry_point[1],
+                standalone_entry_point is standalone_entry_points[0],
             )
+            for standalone_entry_point in standalone_entry_points
+        ]
+    else:
+        binary_filenames = [
+            (standalone_entry_point[1], False)
+            for standalone_entry_point in standalone_entry_points[1:]
+        ]
 
-        for _original_path, dll_filename in dll_map:
-            fixupBinaryDLLPaths(
-                binary_filename=os.path.join(dist_dir, dll_filename),
-                is_exe=False,
-                dll_map=dll_map,
-            )
+    binary_filenames += [
+        (os.path.join(dist_dir, dll_filename), False)
+        for _original_path, dll_filename in dll_map
+    ]
 
-    if Utils.getOS() == "Linux":
-        # For Linux, the "rpath" of libraries may be an issue and must be
-        # removed.
-        for standalone_entry_point in standalone_entry_points[1:]:
-            removeSharedLibraryRPATH(standalone_entry_point[1])
+    _postProcessDistBinaries(binary_filenames, dll_map)
+
+    return used_dlls
+
+
+def _stripBinary(filename):
+    if Utils.getOS() == "Darwin":
+        command = ["strip", "-S", filename]
+    else:
+        command = ["strip", "--strip-debug", filename]
+
+    breakHardLink(filename)
+
+    old_mode = os.stat(filename).st_mode
+    os.chmod(filename, int("644", 8))
+    process = subprocess.Popen(
+        args=command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    _stdout, stderr = process.communicate()
+    os.chmod(filename, old_mode)
 
-        for _original_path, dll_filename in dll_map:
-            removeSharedLibraryRPATH(os.path.join(dist_dir, dll_filename))
+    if process.returncode != 0:
+        warning("Failed to strip '%s': %s" % (filename, stderr))
+
+
+def _postProcessDistBinary(binary_filename, is_exe, dll_map):
+    if Utils.getOS() == "Darwin":
+        fixupBinaryDLLPaths(
+            binary_filename=binary_filename, is_exe=is_exe, dll_map=dll_map
+        )
+    elif Utils.getOS() == "Linux":
+        removeSharedLibraryRPATH(binary_filename)
     elif Utils.isWin32Windows():
         if python_version < 300:
-            # For Win32, we might have to remove SXS paths
-            for standalone_entry_point in standalone_entry_points[1:]:
-                removeSxsFromDLL(standalone_entry_point[1])
+            removeSxsFromDLL(binary_filename)
+
+    if is_exe or not Options.shallStripDistBinaries():
+        return 0
+
+    old_size = os.path.getsize(binary_filename)
+    _stripBinary(binary_filename)
+
+    return old_size - os.path.getsize(binary_filename)
+
+
+def _postProcessDistBinaries(binary_filenames, dll_map):
+    if not binary_filenames:
+        return
 
-            for _original_path, dll_filename in dll_map:
-                removeSxsFromDLL(os.path.join(dist_dir, dll_filename))
+    if Options.shallStripDistBinaries() and not Utils.isExecutableCommand("strip"):
+        sys.exit("Error, needs 'strip' on your system, for '--strip-dist-binaries'.")
+
+    timer = StopWatch()
+    timer.start()
+
+    saved_size = 0
+
+    # These are mostly external tool runs, so not limited by our own work.
+    with ThreadPoolExecutor(max_workers=Utils.getCoreCount()) as worker_pool:
+        workers = [
+            worker_pool.submit(_postProcessDistBinary, binary_filename, is_exe, dll_map)
+            for binary_filename, is_exe in binary_filenames
+        ]
+
+        for size_saved in waitWorkers(workers):
+            saved_size += size_saved
+
+    timer.stop()
+
+    if Options.shallStripDistBinaries():
+        info(
+            "Post-processed %d binaries in %.2f seconds, stripping saved %d bytes."
+            % (len(binary_filenames), timer.delta(), saved_size)
+        )
+    elif Options.isShowProgress():
+        info(
+            "Post-processed %d binaries in %.2f seconds."
+            % (len(binary_filenames), timer.delta())
+        )
 
 
 def copyDataFiles(dist_dir, data_files):
@@ -1632,4 +2114,4 @@ def copyDataFiles(dist_dir, data_files):
             ) as output:
                 output.write(content)
         else:
-            shutil.copy2(source_desc, target_filename)
+            copyDistFile(source_desc, target_filename, preserve_stat=True)
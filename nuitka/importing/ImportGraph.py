@@ -0,0 +1,279 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Import graph of the included modules.
+
+After optimization, the imports that remain in the compiled modules are
+collected, and for uncompiled modules, the imports from their bytecode. Each
+import is marked as executed at module level, i.e. when the module is loaded,
+or inside a function, i.e. only when that is called. Imports in class bodies
+count for where the class is defined.
+
+Modules that are imported, but not included, e.g. because they are not
+followed, are part of the graph as "external" ones, these are still loaded by
+the compiled program at run time.
+
+The graph is written as JSON, or as GraphML if the filename asks for it, and
+the "nuitka.tools.profiler.import_chain" tool can combine it with the import
+times measured by the compiled program.
+"""
+
+import json
+from logging import info
+from xml.sax.saxutils import escape, quoteattr
+
+from nuitka import ModuleRegistry
+from nuitka.containers.odict import OrderedDict
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+
+from .Reachability import getUncompiledModuleImports
+
+
+def _getConstantValue(node):
+    if node is not None and node.isCompileTimeConstant():
+        return node.getCompileTimeConstant()
+    else:
+        return None
+
+
+def _getBuiltinImportNames(node):
+    result = []
+
+    if node.imported_module_desc is not None:
+        result.append(node.imported_module_desc[0])
+    else:
+        # Not included modules are still imported at run time, but relative
+        # imports of those cannot be resolved here.
+        module_name = _getConstantValue(node.getImportName())
+        level = _getConstantValue(node.getLevel())
+
+        if type(module_name) is str and module_name and level in (None, 0, -1):
+            result.append(module_name)
+
+    for module_desc in node.import_list_modules_desc:
+        result.append(module_desc[0])
+
+    for module_desc in node.package_modules_desc or ():
+        result.append(module_desc[0])
+
+    return result
+
+
+class ImportCollector(VisitorNoopMixin):
+    def __init__(self):
+        # Tuples of imported module name, at module level, and line number.
+        self.imports = []
+
+    def onEnterNode(self, node):
+        if node.isExpressionBuiltinImport():
+            module_names = _getBuiltinImportNames(node)
+        elif (
+            node.isExpressionImportModuleHard()
+            or node.isExpressionImportModuleNameHard()
+        ):
+            module_names = [node.getModuleName()]
+        else:
+            return
+
+        # Lazy imports are done when functions use the module.
+        at_module_level = (
+            node.isExecutedAtModuleLevel()
+            and not node.getParent().isExpressionImportModuleLazy()
+        )
+        line_number = node.getSourceReference().getLineNumber()
+
+        for module_name in module_names:
+            self.imports.append((module_name, at_module_level, line_number))
+
+
+def _getCompiledModuleImports(module):
+    collector = ImportCollector()
+
+    if module.getBody() is not None:
+        visitTree(module.getBody(), collector)
+
+    for function_body in sorted(
+        module.getUsedFunctions(), key=lambda function: function.getCodeName()
+    ):
+        visitTree(function_body, collector)
+
+    return collector.imports
+
+
+def _getModuleKind(module):
+    if module.isCompiledPythonModule():
+        return "compiled"
+    elif module.isPythonShlibModule():
+        return "extension"
+    else:
+        return "bytecode"
+
+
+def _getModuleFilename(module):
+    if module.isCompiledPythonModule():
+        return module.getCompileTimeFilename()
+    else:
+        return module.getFilename()
+
+
+def getImportGraph():
+    """ Get the import graph of the included modules.
+
+    Notes:
+        This must be called after optimization, as only then the imports
+        that remain are known.
+
+    Returns:
+        Dictionary with "modules", a list of dictionaries with "name", "kind"
+        and "filename", and "imports", a list of dictionaries with "importer",
+        "imported", "level" being "module" or "function", and "line" giving
+        the first line it is done in, or None for uncompiled modules.
+    """
+
+    modules = OrderedDict()
+
+    for module in ModuleRegistry.getDoneModules():
+        modules[module.getFullName()] = module
+
+    for module in ModuleRegistry.getUncompiledModules():
+        modules.setdefault(module.getFullName(), module)
+
+    edges = OrderedDict()
+
+    def addEdge(importer_name, imported_name, at_module_level, line_number):
+        # Modules importing themselves, e.g. for "from . import x" in a
+        # package, are not of interest.
+        if imported_name == importer_name:
+            return
+
+        key = (importer_name, imported_name)
+
+        level = "module" if at_module_level else "function"
+
+        if key in edges:
+            # The module level import is what makes it loaded always.
+            if edges[key][0] == "module" or level == "function":
+                return
+
+        edges[key] = (level, line_number)
+
+    for module_name, module in sorted(modules.items()):
+        if module.isCompiledPythonModule():
+            for imported_name, at_module_level, line_number in (
+                _getCompiledModuleImports(module)
+            ):
+                addEdge(module_name, imported_name, at_module_level, line_number)
+        elif module.isUncompiledPythonModule():
+            for imported_name, at_module_level in getUncompiledModuleImports(module):
+                # The names imported from modules need not be modules.
+                if imported_name in modules:
+                    addEdge(module_name, imported_name, at_module_level, None)
+
+    module_entries = [
+        {
+            "name": module_name,
+            "kind": _getModuleKind(module),
+            "filename": _getModuleFilename(module),
+        }
+        for module_name, module in sorted(modules.items())
+    ]
+
+    for imported_name in sorted(set(key[1] for key in edges)):
+        if imported_name not in modules:
+            module_entries.append(
+                {"name": imported_name, "kind": "external", "filename": None}
+            )
+
+    import_entries = [
+        {
+            "importer": importer_name,
+            "imported": imported_name,
+            "level": level,
+            "line": line_number,
+        }
+        for (importer_name, imported_name), (level, line_number) in edges.items()
+    ]
+
+    return {"modules": module_entries, "imports": import_entries}
+
+
+def _writeGraphML(graph_file, graph):
+    graph_file.write(
+        """\
+<?xml version="1.0" encoding="UTF-8"?>
+<graphml xmlns="http://graphml.graphdrawing.org/xmlns">
+  <key id="kind" for="node" attr.name="kind" attr.type="string"/>
+  <key id="filename" for="node" attr.name="filename" attr.type="string"/>
+  <key id="level" for="edge" attr.name="level" attr.type="string"/>
+  <key id="line" for="edge" attr.name="line" attr.type="int"/>
+  <graph id="imports" edgedefault="directed">
+"""
+    )
+
+    for module_entry in graph["modules"]:
+        graph_file.write(
+            '    <node id=%s>\n      <data key="kind">%s</data>\n'
+            % (quoteattr(module_entry["name"]), module_entry["kind"])
+        )
+
+        if module_entry["filename"] is not None:
+            graph_file.write(
+                '      <data key="filename">%s</data>\n'
+                % escape(module_entry["filename"])
+            )
+
+        graph_file.write("    </node>\n")
+
+    for import_entry in graph["imports"]:
+        graph_file.write(
+            '    <edge source=%s target=%s>\n      <data key="level">%s</data>\n'
+            % (
+                quoteattr(import_entry["importer"]),
+                quoteattr(import_entry["imported"]),
+                import_entry["level"],
+            )
+        )
+
+        if import_entry["line"] is not None:
+            graph_file.write(
+                '      <data key="line">%d</data>\n' % import_entry["line"]
+            )
+
+        graph_file.write("    </edge>\n")
+
+    graph_file.write("  </graph>\n</graphml>\n")
+
+
+def writeImportGraph(graph_filename):
+    """ Write the import graph to a file.
+
+    Notes:
+        Filenames ending in ".graphml" get GraphML, all others JSON.
+    """
+
+    graph = getImportGraph()
+
+    with open(graph_filename, "w") as graph_file:
+        if graph_filename.lower().endswith(".graphml"):
+            _writeGraphML(graph_file, graph)
+        else:
+            json.dump(graph, graph_file, indent=2)
+
+    info(
+        "Wrote import graph with %d modules and %d imports to '%s'."
+        % (len(graph["modules"]), len(graph["imports"]), graph_filename)
+    )
@@ -37,7 +37,6 @@ the ``os`` module like it's done in ``isStandardLibraryPath`` of this module.
 
 from __future__ import print_function
 
-import hashlib
 import imp
 import os
 import sys
@@ -50,7 +49,8 @@ from nuitka.importing import StandardLibrary
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.FileOperations import listDir
+from nuitka.utils.FileOperations import getFileContentsHash, removeDirectory
+from nuitka.utils.PersistentCache import PersistentCache
 
 from .PreloadedPackages import getPreloadedPackagePath, isPreloadedPackagePath
 from .Whitelisting import isWhiteListedNotExistingModule
@@ -74,6 +74,105 @@ def setMainScriptDirectory(main_dir):
     main_path = main_dir
 
 
+case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
+
+# Listings of directories, by directory name, so that module and package
+# existence checks do not need a stat call each. The search path is not
+# changed during compilation, so these are kept for the whole of it.
+_directory_listings = {}
+
+
+def _getDirectoryListing(dirname):
+    """ Get the entries of a directory from the listing index.
+
+    Returns:
+        Dictionary of names, lower case on case insensitive systems, to lists
+        of the name on disk and the kind of entry, "dir", "file", "other",
+        or None if not yet known. None if this is not a directory.
+    """
+
+    if dirname not in _directory_listings:
+        result = {}
+
+        try:
+            if hasattr(os, "scandir"):
+                for entry in os.scandir(dirname or "."):  # @UndefinedVariable
+                    try:
+                        if entry.is_dir():
+                            kind = "dir"
+                        elif entry.is_file():
+                            kind = "file"
+                        else:
+                            kind = "other"
+                    except OSError:
+                        kind = "other"
+
+                    result[entry.name if case_sensitive else entry.name.lower()] = [
+                        entry.name,
+                        kind,
+                    ]
+            else:
+                for name in os.listdir(dirname or "."):
+                    result[name if case_sensitive else name.lower()] = [name, None]
+        except OSError:
+            result = None
+
+        _directory_listings[dirname] = result
+
+    return _directory_listings[dirname]
+
+
+def _getDirectoryEntry(path):
+    """ Get name on disk and kind of a path from the listing index.
+
+    Notes:
+        Like file system checks, this ignores case on case insensitive
+        systems, the name on disk allows to check the case.
+
+    Returns:
+        Tuple of name and kind, see "_getDirectoryListing", or None if the
+        path does not exist.
+    """
+
+    dirname, basename = os.path.split(path)
+
+    # Not a name in a directory, ask the file system.
+    if basename in ("", ".", ".."):
+        return (basename, "dir") if os.path.isdir(path) else None
+
+    listing = _getDirectoryListing(dirname)
+
+    if listing is None:
+        return None
+
+    entry = listing.get(basename if case_sensitive else basename.lower())
+
+    if entry is None:
+        return None
+
+    if entry[1] is None:
+        if os.path.isdir(path):
+            entry[1] = "dir"
+        elif os.path.isfile(path):
+            entry[1] = "file"
+        else:
+            entry[1] = "other"
+
+    return tuple(entry)
+
+
+def _isDirectory(path):
+    entry = _getDirectoryEntry(path)
+
+    return entry is not None and entry[1] == "dir"
+
+
+def _isFile(path):
+    entry = _getDirectoryEntry(path)
+
+    return entry is not None and entry[1] == "file"
+
+
 def isPackageDir(dirname):
     """ Decide if a directory is a package.
 
@@ -84,10 +183,10 @@ def isPackageDir(dirname):
 
     return (
         "." not in os.path.basename(dirname)
-        and os.path.isdir(dirname)
+        and _isDirectory(dirname)
         and (
             python_version >= 300
-            or os.path.isfile(os.path.join(dirname, "__init__.py"))
+            or _isFile(os.path.join(dirname, "__init__.py"))
             or isPreloadedPackagePath(dirname)
         )
     )
@@ -317,9 +416,6 @@ def findModule(importing, module_name, parent_package, level, warn):
 
 
 # Some platforms are case insensitive.
-case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
-
-
 def _findModuleInPath2(module_name, search_path):
     """ This is out own module finding low level implementation.
 
@@ -347,7 +443,7 @@ def _findModuleInPath2(module_name, search_path):
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if os.path.isdir(package_directory):
+        if _isDirectory(package_directory):
             for suffix, _mode, mtype in imp.get_suffixes():
                 if mtype == imp.C_EXTENSION:
                     continue
@@ -356,7 +452,7 @@ def _findModuleInPath2(module_name, search_path):
 
                 file_path = os.path.join(package_directory, package_file_name)
 
-                if os.path.isfile(file_path):
+                if _isFile(file_path):
                     candidates.add((entry, 1, package_directory))
                     break
             else:
@@ -366,7 +462,7 @@ def _findModuleInPath2(module_name, search_path):
         # Then, check out suffixes of all kinds.
         for suffix, _mode, _type in imp.get_suffixes():
             file_path = os.path.join(entry, module_name + suffix)
-            if os.path.isfile(file_path):
+            if _isFile(file_path):
                 candidates.add((entry, 1, file_path))
                 break
 
@@ -384,9 +480,10 @@ def _findModuleInPath2(module_name, search_path):
             return candidates[0][2]
         else:
             for candidate in candidates:
-                for fullname, _filename in listDir(candidate[0]):
-                    if fullname == candidate[2]:
-                        return candidate[2]
+                if _getDirectoryEntry(candidate[2])[0] == os.path.basename(
+                    candidate[2]
+                ):
+                    return candidate[2]
 
             # Only exact case matches matter, all candidates were ignored,
             # lets just fall through to raising the import error.
@@ -395,32 +492,122 @@ def _findModuleInPath2(module_name, search_path):
     raise ImportError
 
 
-_egg_files = {}
+# Archives on the search path, by path element, to the directories their
+# contents were extracted to.
+_archive_dirs = {}
+
+# Content hashes of archives, by filename, size and modification time.
+_archive_checksums = None
+
+
+def _getArchiveChecksum(archive_filename):
+    """ Get the content hash of an archive, hashing it only when changed. """
+
+    # Singleton, pylint: disable=global-statement
+    global _archive_checksums
+
+    if _archive_checksums is None:
+        _archive_checksums = PersistentCache("archive-checksums", 1024 * 1024)
+
+    stat = os.stat(archive_filename)
+
+    key = "%s\n%d\n%r" % (
+        os.path.abspath(archive_filename),
+        stat.st_size,
+        stat.st_mtime,
+    )
+
+    checksum = _archive_checksums.getEntry(key)
+
+    if checksum is None:
+        checksum = getFileContentsHash(archive_filename).encode("ascii")
+
+        _archive_checksums.putEntry(key, checksum)
+
+    if str is not bytes:
+        checksum = checksum.decode("ascii")
+
+    return checksum
+
+
+def _getArchiveDirectory(archive_filename):
+    """ Get a directory with the contents of an archive, extracting it once. """
+
+    target_dir = os.path.join(
+        getCacheDir(), "egg-content", _getArchiveChecksum(archive_filename)
+    )
+
+    if not os.path.isdir(target_dir):
+        # Extract to a private name, so no other process sees it incomplete.
+        temp_dir = "%s.tmp%d" % (target_dir, os.getpid())
+
+        zip_file = zipfile.ZipFile(archive_filename, "r")
+        zip_file.extractall(temp_dir)
+        zip_file.close()
+
+        try:
+            os.rename(temp_dir, target_dir)
+        except OSError:
+            # Another process was faster.
+            if not os.path.isdir(target_dir):
+                raise
+
+            removeDirectory(temp_dir, ignore_errors=True)
+
+    return target_dir
+
+
+def _getArchivePathElement(path_entry):
+    # Archives can also be given with a directory inside of them, look for an
+    # existing file first.
+    archive_filename = path_entry
+    inner_path = ""
+
+    while not os.path.exists(archive_filename):
+        archive_filename, tail = os.path.split(archive_filename)
+
+        if not tail:
+            return path_entry
+
+        inner_path = os.path.join(tail, inner_path) if inner_path else tail
+
+    if not os.path.isfile(archive_filename) or not zipfile.is_zipfile(
+        archive_filename
+    ):
+        return path_entry
+
+    archive_dir = _getArchiveDirectory(archive_filename)
+
+    if inner_path:
+        return os.path.join(archive_dir, inner_path)
+    else:
+        return archive_dir
 
 
 def _unpackPathElement(path_entry):
     if not path_entry:
         return "."  # empty means current directory
 
-    if os.path.isfile(path_entry) and path_entry.lower().endswith(".egg"):
-        if path_entry not in _egg_files:
-            with open(path_entry, "rb") as f:
-                checksum = hashlib.md5(f.read()).hexdigest()
+    # Eggs and other zip files need to be extracted, as the module finding
+    # and everything after it works with files.
+    if path_entry not in _archive_dirs:
+        _archive_dirs[path_entry] = _getArchivePathElement(path_entry)
+
+    return _archive_dirs[path_entry]
 
-            target_dir = os.path.join(getCacheDir(), "egg-content", checksum)
 
-            zip_ref = zipfile.ZipFile(path_entry, "r")
-            zip_ref.extractall(target_dir)
-            zip_ref.close()
+# Search paths by package name, computed once.
+_package_search_paths = {}
 
-            _egg_files[path_entry] = target_dir
 
-        return _egg_files[path_entry]
+def getPackageSearchPath(package_name):
+    if package_name not in _package_search_paths:
+        _package_search_paths[package_name] = _getPackageSearchPath(package_name)
 
-    return path_entry
+    return _package_search_paths[package_name]
 
 
-def getPackageSearchPath(package_name):
+def _getPackageSearchPath(package_name):
     assert main_path is not None
 
     if package_name is None:
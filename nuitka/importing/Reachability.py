@@ -0,0 +1,441 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Reachability of included modules.
+
+Modules get included because the optimized code of another module imports
+them, because plugins say they are used, or because they were detected as used
+by the Python library during startup. The later are only candidates, and e.g.
+extension modules among them may be unused by the program.
+
+After optimization, this computes which modules are reachable from the
+required ones, i.e. the main module, modules the user asked for, and the
+uncompiled modules, by following the modules each one used during the last
+traversal. For uncompiled modules, their bytecode is scanned for imports, in
+all branches. Unreachable modules can then be removed, and a report can be
+written that attributes sizes to the modules.
+"""
+
+import dis
+import inspect
+import marshal
+import os
+from logging import info
+
+from nuitka import ModuleRegistry, Options
+from nuitka.containers.odict import OrderedDict
+from nuitka.utils.FileOperations import getFileList
+
+# Module to the module it was first reached from, "None" for required ones.
+_reached_via = None
+
+# Modules that were found unreachable, and if they were removed.
+_unreachable_modules = None
+_pruned = False
+
+# Bytecode sizes of uncompiled modules, as it is released after code
+# generation.
+_bytecode_sizes = {}
+
+
+def _iterCodeObjectInstructions(code_object):
+    if hasattr(dis, "get_instructions"):
+        for instruction in dis.get_instructions(code_object):
+            yield instruction.opname, instruction.argval
+
+        return
+
+    # Python2 has no instruction API, decode it ourselves.
+    code = bytearray(code_object.co_code)
+
+    count = 0
+    extended_arg = 0
+
+    while count < len(code):
+        opcode = code[count]
+
+        if opcode >= dis.HAVE_ARGUMENT:
+            arg = code[count + 1] + code[count + 2] * 256 + extended_arg
+            extended_arg = 0
+            count += 3
+
+            if opcode == dis.EXTENDED_ARG:
+                extended_arg = arg * 65536
+                continue
+        else:
+            arg = None
+            count += 1
+
+        opname = dis.opname[opcode]
+
+        if opname == "LOAD_CONST":
+            yield opname, code_object.co_consts[arg]
+        elif opname == "IMPORT_NAME":
+            yield opname, code_object.co_names[arg]
+        else:
+            yield opname, arg
+
+
+def _getCodeObjectImports(code_object, at_module_level=True):
+    """ Get the module names imported by a code object and nested ones.
+
+    Returns:
+        List of tuples of module name, level, the names in the from list, and
+        if the import is executed at module level, i.e. not in a function.
+    """
+
+    result = []
+
+    consts = [None, None]
+
+    for opname, argval in _iterCodeObjectInstructions(code_object):
+        if opname == "LOAD_CONST":
+            consts = [consts[1], argval]
+        elif opname == "IMPORT_NAME":
+            level, fromlist = consts
+
+            if type(level) is not int:
+                level = 0
+
+            if type(fromlist) is not tuple:
+                fromlist = ()
+
+            result.append((argval, level, fromlist, at_module_level))
+
+    for constant in code_object.co_consts:
+        if type(constant) is type(code_object):
+            # Class bodies are executed where they are defined, functions and
+            # lambdas only when called, these have optimized locals.
+            result.extend(
+                _getCodeObjectImports(
+                    constant,
+                    at_module_level and not constant.co_flags & inspect.CO_OPTIMIZED,
+                )
+            )
+
+    return result
+
+
+def getUncompiledModuleImports(module):
+    """ Get the modules imported by the bytecode of an uncompiled module.
+
+    Notes:
+        For "from" imports, the imported names are also given, as these may
+        be modules too, and for Python2 the implicit relative import too.
+
+    Returns:
+        List of tuples of module name and if the import is executed at module
+        level, i.e. not in a function.
+    """
+
+    if module.isUncompiledPythonPackage():
+        package_name = module.getFullName()
+    else:
+        package_name = module.getPackage()
+
+    code_object = marshal.loads(module.getByteCode())
+
+    result = []
+
+    for module_name, level, fromlist, at_module_level in _getCodeObjectImports(
+        code_object
+    ):
+        if level > 0:
+            if package_name is None:
+                continue
+
+            parts = package_name.split(".")
+
+            if level - 1 >= len(parts):
+                continue
+
+            base_name = ".".join(parts[: len(parts) - level + 1])
+
+            module_name = base_name + "." + module_name if module_name else base_name
+
+        # Python2 implicit relative imports are also possible.
+        candidates = [module_name]
+
+        if level == -1 and package_name is not None:
+            candidates.append(package_name + "." + module_name)
+
+        for candidate in candidates:
+            result.append((candidate, at_module_level))
+
+            for name in fromlist:
+                if name != "*":
+                    result.append((candidate + "." + name, at_module_level))
+
+    return result
+
+
+def _getUncompiledModuleImportNames(module):
+    result = set(module_name for module_name, _filename in module.getUsedModules())
+
+    for module_name, _at_module_level in getUncompiledModuleImports(module):
+        result.add(module_name)
+
+    return result
+
+
+def _getModuleUses(module, modules_by_name):
+    result = list(ModuleRegistry.getModuleUses(module))
+
+    package_name = module.getPackage()
+
+    if package_name is not None and package_name in modules_by_name:
+        result.append(modules_by_name[package_name])
+
+    if module.isUncompiledPythonModule():
+        for module_name in sorted(_getUncompiledModuleImportNames(module)):
+            if module_name in modules_by_name:
+                result.append(modules_by_name[module_name])
+
+    return result
+
+
+def _getModulesByName():
+    result = {}
+
+    for module in ModuleRegistry.getUncompiledModules():
+        result[module.getFullName()] = module
+
+    for module in ModuleRegistry.getDoneModules():
+        result[module.getFullName()] = module
+
+    return result
+
+
+def _isRequiredModule(module):
+    if module.isUncompiledPythonModule():
+        return True
+
+    return ModuleRegistry.isRequiredRootModule(module)
+
+
+def analyzeModuleReachability():
+    """ Compute the reachable modules, and remove the others if asked to.
+
+    Notes:
+        This must be called after optimization, as it uses the modules each
+        module used during the last traversal.
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _reached_via, _unreachable_modules, _pruned
+
+    modules_by_name = _getModulesByName()
+
+    for module in modules_by_name.values():
+        if module.isUncompiledPythonModule():
+            _bytecode_sizes[module] = len(module.getByteCode())
+
+    _reached_via = OrderedDict()
+
+    pending = []
+
+    for module in sorted(modules_by_name.values(), key=lambda m: m.getFullName()):
+        if _isRequiredModule(module):
+            _reached_via[module] = None
+            pending.append(module)
+
+    while pending:
+        module = pending.pop(0)
+
+        for used_module in _getModuleUses(module, modules_by_name):
+            if used_module not in _reached_via:
+                _reached_via[used_module] = module
+                pending.append(used_module)
+
+    _unreachable_modules = [
+        module
+        for module in ModuleRegistry.getDoneModules()
+        if module not in _reached_via
+    ]
+
+    if _unreachable_modules and Options.isShowProgress():
+        info(
+            "Found %d modules unreachable from the program: %s"
+            % (
+                len(_unreachable_modules),
+                ", ".join(module.getFullName() for module in _unreachable_modules),
+            )
+        )
+
+    if Options.shallPruneUnreachableModules():
+        for module in _unreachable_modules:
+            ModuleRegistry.removeDoneModule(module)
+            ModuleRegistry.removeRootModule(module)
+
+            if Options.isShowInclusion():
+                info("Pruned unreachable module '%s'." % module.getFullName())
+
+        _pruned = True
+
+
+def _getFileSize(filename):
+    if filename is not None and os.path.isfile(filename):
+        return os.path.getsize(filename)
+    else:
+        return 0
+
+
+def _getObjectFilename(c_filename):
+    for suffix in (".o", ".obj"):
+        object_filename = os.path.splitext(c_filename)[0] + suffix
+
+        if os.path.isfile(object_filename):
+            return object_filename
+
+    return None
+
+
+def _getDistDLLSizes(dist_dir, used_dlls):
+    """ Attribute the sizes of the DLLs to the binaries using them.
+
+    Shared ones are split evenly among their users.
+    """
+
+    result = {}
+
+    for dll_filename, binary_filenames in used_dlls.items():
+        dist_filename = os.path.join(dist_dir, os.path.basename(dll_filename))
+        size = _getFileSize(dist_filename)
+
+        for binary_filename in binary_filenames:
+            binary_filename = os.path.normcase(os.path.abspath(binary_filename))
+
+            result[binary_filename] = result.get(binary_filename, 0) + size // len(
+                binary_filenames
+            )
+
+    return result
+
+
+def writeModuleReport(report_filename, module_filenames, dist_dir, used_dlls):
+    """ Write a report of included modules, their reachability and sizes.
+
+    Args:
+        report_filename: file to write the report to
+        module_filenames: dictionary of compiled modules to their C files
+        dist_dir: standalone distribution folder or None
+        used_dlls: dictionary of DLLs to the binaries using them
+    """
+
+    dll_sizes = _getDistDLLSizes(dist_dir, used_dlls) if dist_dir else {}
+
+    lines = []
+    totals = [0, 0, 0, 0, 0]
+
+    for module, via in _reached_via.items():
+        lines.append((module, "required" if via is None else "reachable", via))
+
+    for module in _unreachable_modules:
+        lines.append((module, "pruned" if _pruned else "unreachable", None))
+
+    rows = []
+
+    for module, status, via in lines:
+        c_bytes = object_bytes = bytecode_bytes = binary_bytes = dll_bytes = 0
+
+        if module.isCompiledPythonModule():
+            kind = "compiled"
+
+            if module in module_filenames:
+                c_filename = module_filenames[module]
+
+                # Without C11 compiler, these were renamed to C++ files.
+                c_bytes = _getFileSize(c_filename) or _getFileSize(c_filename + "pp")
+                object_bytes = _getFileSize(_getObjectFilename(c_filename))
+        elif module.isPythonShlibModule():
+            kind = "extension"
+
+            binary_bytes = _getFileSize(module.getFilename())
+
+            if dist_dir is not None:
+                dist_filename = os.path.join(
+                    dist_dir, *module.getFullName().split(".")
+                ) + os.path.splitext(module.getFilename())[1]
+
+                dll_bytes = dll_sizes.get(
+                    os.path.normcase(os.path.abspath(dist_filename)), 0
+                )
+        else:
+            kind = "bytecode"
+
+            bytecode_bytes = _bytecode_sizes.get(module, 0)
+
+        sizes = (c_bytes, object_bytes, bytecode_bytes, binary_bytes, dll_bytes)
+
+        # Pruned modules are not part of the result.
+        if status != "pruned":
+            for count, size in enumerate(sizes):
+                totals[count] += size
+
+        rows.append(
+            (
+                -sum(sizes),
+                module.getFullName(),
+                status,
+                kind,
+                sizes,
+                via.getFullName() if via is not None else "-",
+            )
+        )
+
+    rows.sort()
+
+    row_format = "%-40s %-11s %-9s %10s %10s %10s %10s %10s  %s\n"
+
+    with open(report_filename, "w") as report_file:
+        report_file.write(
+            """\
+# Modules included by Nuitka, largest first. Sizes are in bytes, of generated
+# C code, object code, bytecode, extension module binaries, and of the DLLs
+# these use, shared ones split evenly among their users. The last column
+# names the module, that a module was first reached from.
+"""
+        )
+        report_file.write(
+            row_format
+            % (
+                "module",
+                "status",
+                "kind",
+                "c",
+                "object",
+                "bytecode",
+                "binary",
+                "dlls",
+                "via",
+            )
+        )
+
+        for _order, module_name, status, kind, sizes, via_name in rows:
+            report_file.write(
+                row_format % ((module_name, status, kind) + sizes + (via_name,))
+            )
+
+        report_file.write(row_format % (("total", "", "") + tuple(totals) + ("",)))
+
+        if dist_dir is not None:
+            report_file.write(
+                "# Distribution folder total: %d\n"
+                % sum(_getFileSize(filename) for filename in getFileList(dist_dir))
+            )
+
+    info("Wrote module report to '%s'." % report_filename)
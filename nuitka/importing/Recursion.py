@@ -19,6 +19,7 @@
 
 """
 
+import ast
 import fnmatch
 import glob
 import marshal
@@ -30,7 +31,10 @@ from nuitka import ModuleRegistry, Options
 from nuitka.importing import ImportCache, Importing, StandardLibrary
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
-from nuitka.tree.SourceReading import readSourceCodeFromFilename
+from nuitka.tree.SourceReading import (
+    prefetchSourceCode,
+    readSourceCodeFromFilename,
+)
 from nuitka.utils.FileOperations import listDir, relpath
 
 
@@ -172,8 +176,6 @@ def recurseTo(module_package, module_filename, module_relpath, module_kind, reas
 def decideRecursion(
     module_filename, module_name, module_package, module_kind, extra_recursion=False
 ):
-    # Many branches, which make decisions immediately, by returning
-    # pylint: disable=too-many-branches,too-many-return-statements
     if module_name == "__main__":
         return False, "Main program is not recursed to again."
 
@@ -184,6 +186,20 @@ def decideRecursion(
     if plugin_decision:
         return plugin_decision
 
+    return _decideRecursionByOptions(
+        module_filename=module_filename,
+        module_name=module_name,
+        module_package=module_package,
+        module_kind=module_kind,
+        extra_recursion=extra_recursion,
+    )
+
+
+def _decideRecursionByOptions(
+    module_filename, module_name, module_package, module_kind, extra_recursion
+):
+    # Many branches, which make decisions immediately, by returning
+    # pylint: disable=too-many-branches,too-many-return-statements
     if module_kind == "shlib":
         if Options.isStandaloneMode():
             return True, "Shared library for inclusion."
@@ -232,6 +248,93 @@ def decideRecursion(
     return (None, "Default behavior, not recursing without request.")
 
 
+def _iterImportedModuleNames(body):
+    """ Module names, levels, and from lists of imports in the given nodes. """
+
+    for statement in body:
+        for node in ast.walk(statement):
+            if type(node) is ast.Import:
+                for alias in node.names:
+                    yield alias.name, 0, ()
+            elif type(node) is ast.ImportFrom:
+                yield node.module or "", node.level, tuple(
+                    alias.name for alias in node.names if alias.name != "*"
+                )
+
+
+def prefetchImportedModules(module, body):
+    """ Start reading the source of modules the given one will recurse to.
+
+    Notes:
+        This looks at all imports in the module body, the decision to recurse
+        is only predicted from the options, plugins are asked only when the
+        import is actually done, and will be for other modules too.
+    """
+
+    if module.isCompiledPythonPackage():
+        parent_package = module.getFullName()
+    else:
+        parent_package = module.getPackage()
+
+    for module_name, level, from_list in _iterImportedModuleNames(body):
+        # Python2 imports are relative too, unless made absolute, it's only
+        # a prediction anyway.
+        if level == 0 and python_version < 300:
+            level = -1
+
+        candidates = [module_name] if module_name else []
+
+        for name in from_list:
+            candidates.append(module_name + "." + name if module_name else name)
+
+        for candidate in candidates:
+            module_package, module_filename, _finding = Importing.findModule(
+                importing=module,
+                module_name=candidate,
+                parent_package=parent_package,
+                level=level,
+                warn=False,
+            )
+
+            if module_filename is None:
+                continue
+
+            module_filename = os.path.normpath(module_filename)
+
+            imported_name, module_kind = Importing.getModuleNameAndKindFromFilename(
+                module_filename
+            )
+
+            if module_kind != "py":
+                continue
+
+            full_name = Importing.getModuleFullNameFromPackageAndName(
+                module_package, imported_name
+            )
+
+            if ImportCache.isImportedModuleByName(full_name):
+                continue
+
+            decision, _reason = _decideRecursionByOptions(
+                module_filename=module_filename,
+                module_name=imported_name,
+                module_package=module_package,
+                module_kind=module_kind,
+                extra_recursion=False,
+            )
+
+            if not decision:
+                continue
+
+            if os.path.isdir(module_filename):
+                module_filename = os.path.join(module_filename, "__init__.py")
+
+                if not os.path.isfile(module_filename):
+                    continue
+
+            prefetchSourceCode(module_filename)
+
+
 def considerFilename(module_filename):
     module_filename = os.path.normpath(module_filename)
 
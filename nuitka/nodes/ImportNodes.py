@@ -447,6 +447,48 @@ Not recursing to '%(full_path)s' (%(filename)s), please specify \
         return self.type_shape
 
 
+class ExpressionImportModuleLazy(ExpressionChildHavingBase):
+    """ Module level import done only on first attribute access.
+
+        The module variable gets assigned a proxy, that does the import of the
+        wrapped import node on attribute lookups, and then replaces itself as
+        the value of the variable. This is only created for variables that
+        are used for nothing but attribute lookups in functions, see the
+        "LazyImports" optimization.
+    """
+
+    kind = "EXPRESSION_IMPORT_MODULE_LAZY"
+
+    named_child = "import_node"
+
+    __slots__ = ("variable_name",)
+
+    def __init__(self, import_node, variable_name, source_ref):
+        ExpressionChildHavingBase.__init__(
+            self, value=import_node, source_ref=source_ref
+        )
+
+        self.variable_name = variable_name
+
+    def getDetails(self):
+        return {"variable_name": self.variable_name}
+
+    def getVariableName(self):
+        return self.variable_name
+
+    getImport = ExpressionChildHavingBase.childGetter("import_node")
+
+    def computeExpressionRaw(self, trace_collection):
+        # The import is not done here, but the modules are still used, as
+        # they will be imported later, pylint: disable=protected-access
+        self.getImport()._addUsedModules(trace_collection)
+
+        return self, None, None
+
+    def mayHaveSideEffects(self):
+        return False
+
+
 class StatementImportStar(StatementChildHavingBase):
     kind = "STATEMENT_IMPORT_STAR"
 
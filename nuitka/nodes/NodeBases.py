@@ -209,6 +209,24 @@ class NodeBase(NodeMetaClassBase):
 
         return parent
 
+    def isExecutedAtModuleLevel(self):
+        """ Is this executed when the module is loaded, i.e. not in a function.
+
+            Class bodies and other outlines count for where they are.
+        """
+        parent = self.getParent()
+
+        while not parent.isCompiledPythonModule():
+            if (
+                parent.isExpressionFunctionBodyBase()
+                and not parent.isExpressionOutlineFunctionBodyBase()
+            ):
+                return False
+
+            parent = parent.getParent()
+
+        return True
+
     def isParentVariableProvider(self):
         # Check if it's a closure giver, in which cases it can provide variables,
         return isinstance(self, ClosureGiverNodeMixin)
@@ -0,0 +1,178 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Decide between compiled and bytecode modules from a runtime profile.
+
+The profile comes from a training run of the program, and gives hit counts
+per module. Modules with fewer hits than the threshold, including the ones not
+used at all in the training run, are cold and get included as bytecode, which
+saves compile time and binary size, while the hot ones are compiled.
+
+Two profile formats are accepted. The output of "python -m cProfile -o", where
+the call counts of the functions of a module, including its module code, are
+added up, and these are matched by filename. And text files with lines of
+module name and hit count, separated by white space, with "#" comments.
+"""
+
+import marshal
+import os
+import sys
+from logging import info
+
+from nuitka import Options
+
+# Hit counts by module name and by normalized filename, loaded on first use.
+_module_hits = None
+_filename_hits = None
+
+
+def _normalizeFilename(filename):
+    return os.path.normcase(os.path.abspath(filename))
+
+
+def _loadProfileStats(profile_filename):
+    """ Load a profile written by "cProfile" or "profile" if it is one.
+
+    Returns:
+        Dictionary of "pstats" style, or None if it is not such a profile.
+    """
+
+    with open(profile_filename, "rb") as profile_file:
+        try:
+            stats = marshal.load(profile_file)
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    if type(stats) is not dict:
+        return None
+
+    return stats
+
+
+def _loadTextProfile(profile_filename):
+    result = {}
+
+    with open(profile_filename) as profile_file:
+        for line_number, line in enumerate(profile_file, 1):
+            line = line.split("#", 1)[0].strip()
+
+            if not line:
+                continue
+
+            parts = line.split()
+
+            if len(parts) != 2 or not parts[1].isdigit():
+                sys.exit(
+                    "Error, line %d of compilation profile '%s' is not module name"
+                    " and hit count." % (line_number, profile_filename)
+                )
+
+            module_name, hits = parts[0], int(parts[1])
+
+            result[module_name] = result.get(module_name, 0) + hits
+
+    return result
+
+
+def _loadProfile():
+    # Singleton, pylint: disable=global-statement
+    global _module_hits, _filename_hits
+
+    profile_filename = Options.getCompilationProfileFilename()
+
+    if not os.path.isfile(profile_filename):
+        sys.exit("Error, compilation profile '%s' does not exist." % profile_filename)
+
+    stats = _loadProfileStats(profile_filename)
+
+    _module_hits = {}
+    _filename_hits = {}
+
+    if stats is not None:
+        for (filename, _line_number, _function_name), values in stats.items():
+            # Built-in functions have no source file.
+            if filename == "~" or filename.startswith("<"):
+                continue
+
+            filename = _normalizeFilename(filename)
+
+            # Primitive and total call counts, then times and callers.
+            _filename_hits[filename] = _filename_hits.get(filename, 0) + values[1]
+    else:
+        _module_hits.update(_loadTextProfile(profile_filename))
+
+    if Options.isShowProgress():
+        info(
+            "Loaded compilation profile '%s' with %d modules."
+            % (profile_filename, len(_module_hits) + len(_filename_hits))
+        )
+
+
+def _isModuleModeTopFilename(filename):
+    if not Options.shallMakeModule():
+        return False
+
+    top_filename = Options.getPositionalArgs()[0]
+
+    if os.path.isdir(top_filename):
+        top_filename = os.path.join(top_filename, "__init__.py")
+
+    return _normalizeFilename(filename) == _normalizeFilename(top_filename)
+
+
+def decideCompilationFromProfile(module_name, source_ref):
+    """ Decide compilation of a module with the profile given, if any.
+
+    Notes:
+        The main module, and the top module in module mode, are always
+        compiled, and so are modules that do not have a source file to
+        create bytecode from.
+
+    Returns:
+        "compiled" or "bytecode" or None without profile
+    """
+
+    if Options.getCompilationProfileFilename() is None:
+        return None
+
+    if module_name == "__main__":
+        return None
+
+    filename = source_ref.getFilename()
+
+    if not os.path.isfile(filename) or _isModuleModeTopFilename(filename):
+        return None
+
+    if _module_hits is None:
+        _loadProfile()
+
+    hits = _module_hits.get(module_name, 0) + _filename_hits.get(
+        _normalizeFilename(filename), 0
+    )
+
+    if hits >= Options.getCompilationProfileThreshold():
+        result = "compiled"
+    else:
+        result = "bytecode"
+
+    if Options.isShowInclusion():
+        info(
+            "Compilation profile has %d hits for '%s', using %s mode."
+            % (hits, module_name, result)
+        )
+
+    return result
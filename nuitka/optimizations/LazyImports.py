@@ -0,0 +1,186 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Make module level imports lazy, where the module itself does not notice.
+
+For modules of the packages given with "--lazy-imports", plain "import"
+statements at module level are considered, that are not inside of any
+control flow. When the module variable assigned is used only for attribute
+lookups in functions, and not otherwise read or written, the import is
+replaced with a proxy, that does it on first attribute access.
+
+Other modules can still see the proxy, e.g. with "from module import name",
+"getattr" or "vars" of the module, before a function of the module used it.
+The proxy only replaces itself in the dictionary of its own module, so
+copies of it taken elsewhere remain proxies, that forward attribute access.
+
+This must be done after optimization, as only then the uses of variables
+are final, and e.g. unused functions are gone.
+"""
+
+from logging import info
+
+from nuitka import Options
+from nuitka.nodes.ImportNodes import ExpressionImportModuleLazy
+from nuitka.tree.Operations import VisitorNoopMixin, visitTree
+
+
+def _isLazyImportModule(module):
+    full_name = module.getFullName()
+
+    for package_name in Options.getLazyImportPackages():
+        if full_name == package_name or full_name.startswith(package_name + "."):
+            return True
+
+    return False
+
+
+def _isPlainImport(import_node):
+    module_name = import_node.getImportName()
+    import_list = import_node.getFromList()
+
+    return (
+        module_name.isCompileTimeConstant()
+        and type(module_name.getCompileTimeConstant()) is str
+        and (
+            import_list is None
+            or import_list.isCompileTimeConstant()
+            and import_list.getCompileTimeConstant() is None
+        )
+    )
+
+
+def _isUnconditional(statement):
+    parent = statement.getParent()
+
+    while not parent.isCompiledPythonModule():
+        if not parent.isStatementsSequence() and not parent.isStatementsFrame():
+            return False
+
+        parent = parent.getParent()
+
+    return True
+
+
+class CandidatesCollector(VisitorNoopMixin):
+    def __init__(self):
+        # Assignments of plain imports to module variables.
+        self.candidates = []
+
+    def onEnterNode(self, node):
+        if (
+            node.isStatementAssignmentVariable()
+            and node.getVariable().isModuleVariable()
+            and node.getAssignSource().isExpressionBuiltinImport()
+            and _isPlainImport(node.getAssignSource())
+            and _isUnconditional(node)
+        ):
+            self.candidates.append(node)
+
+
+class VariableUsesCollector(VisitorNoopMixin):
+    def __init__(self, variables):
+        # Nodes using the variables, by variable.
+        self.uses = dict((variable, []) for variable in variables)
+
+        # Names of variables, that are looked up by name only.
+        self.name_uses = set()
+
+    def onEnterNode(self, node):
+        if (
+            node.isExpressionVariableNameRef()
+            or node.isExpressionVariableLocalNameRef()
+        ):
+            self.name_uses.add(node.getVariableName())
+        elif hasattr(node, "getVariable"):
+            variable = node.getVariable()
+
+            if variable in self.uses:
+                self.uses[variable].append(node)
+
+
+def _isAttributeLookupInFunction(node):
+    if not node.isExpressionVariableRef() or node.isExecutedAtModuleLevel():
+        return False
+
+    parent = node.getParent()
+
+    return parent.isExpressionAttributeLookup() and parent.getLookupSource() is node
+
+
+def makeModuleImportsLazy(module):
+    """ Replace the module level imports of a module that can be lazy.
+
+    Returns:
+        Number of imports that were made lazy.
+    """
+
+    if module.getBody() is None or not _isLazyImportModule(module):
+        return 0
+
+    candidates_collector = CandidatesCollector()
+    visitTree(module.getBody(), candidates_collector)
+    candidates = candidates_collector.candidates
+
+    if not candidates:
+        return 0
+
+    collector = VariableUsesCollector(
+        [statement.getVariable() for statement in candidates]
+    )
+
+    visitTree(module.getBody(), collector)
+
+    for function_body in module.getUsedFunctions():
+        visitTree(function_body, collector)
+
+    count = 0
+
+    for statement in candidates:
+        variable = statement.getVariable()
+
+        if variable.getName() in collector.name_uses:
+            continue
+
+        if not all(
+            use is statement or _isAttributeLookupInFunction(use)
+            for use in collector.uses[variable]
+        ):
+            continue
+
+        import_node = statement.getAssignSource()
+
+        statement.setAssignSource(
+            ExpressionImportModuleLazy(
+                import_node=import_node,
+                variable_name=variable.getName(),
+                source_ref=import_node.getSourceReference(),
+            )
+        )
+
+        if Options.isShowProgress():
+            info(
+                "Made import of '%s' lazy in module '%s'."
+                % (
+                    import_node.getImportName().getCompileTimeConstant(),
+                    module.getFullName(),
+                )
+            )
+
+        count += 1
+
+    return count
@@ -35,6 +35,7 @@ from nuitka.utils import MemoryUsage
 
 from . import Graphs, TraceCollections
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
+from .LazyImports import makeModuleImportsLazy
 from .Tags import TagSet
 
 _progress = Options.isShowProgress()
@@ -560,4 +561,9 @@ def optimize(output_filename):
     while not finished:
         finished = makeOptimizationPass(initial_pass=False)
 
+    if Options.getLazyImportPackages():
+        for module in ModuleRegistry.getDoneUserModules():
+            if module.isCompiledPythonModule():
+                makeModuleImportsLazy(module)
+
     Graphs.endGraph(output_filename)
@@ -35,6 +35,7 @@ from logging import info
 
 from nuitka import Options
 from nuitka.ModuleRegistry import addUsedModule
+from nuitka.optimizations.CompilationProfile import decideCompilationFromProfile
 from nuitka.plugins.standard.EnumPlugin import (
     NuitkaPluginDetectorEnumWorkarounds,
     NuitkaPluginEnumWorkarounds,
@@ -289,7 +290,8 @@ class Plugins(object):
         """ Let plugins decide whether to compile a module.
 
         Notes:
-            The decision is made by the first plugin not returning None.
+            The decision is made by the first plugin not returning None, and
+            without that, by the compilation profile, if one is given.
 
         Returns:
             "compiled" (default) or "bytecode".
@@ -301,7 +303,7 @@ class Plugins(object):
                 assert value in ("compiled", "bytecode")
                 return value
 
-        return "compiled"
+        return decideCompilationFromProfile(module_name, source_ref) or "compiled"
 
 
 def listPlugins():
@@ -0,0 +1,203 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+""" Tool to find the chain of imports that dominates startup time.
+
+It combines the import graph written by "--import-graph" with the import times
+written by a program compiled with "--runtime-statistics" to the file named by
+the "NUITKA_IMPORT_TIMES" environment variable, e.g.
+
+    python -m nuitka --import-graph=graph.json --runtime-statistics program.py
+    NUITKA_IMPORT_TIMES=times.json ./program.bin
+    python -m nuitka.tools.profiler.import_chain graph.json times.json
+
+The import times include the modules imported during the import. Starting from
+the main module, the chain follows the slowest import at each step, and each
+step says if it is done at module level, in a function, or implicitly, e.g.
+for the package of an imported module. Module level imports on that chain are
+the candidates for lazy imports.
+"""
+
+from __future__ import print_function
+
+import json
+import sys
+from optparse import OptionParser
+
+from nuitka.Tracing import my_print
+
+
+def _loadJSON(filename):
+    with open(filename) as json_file:
+        return json.load(json_file)
+
+
+def _getImportLevels(graph):
+    result = {}
+
+    for import_entry in graph["imports"]:
+        result[import_entry["importer"], import_entry["imported"]] = (
+            import_entry["level"],
+            import_entry["line"],
+        )
+
+    return result
+
+
+def _getChildren(times):
+    result = {}
+
+    for module_name, entry in times.items():
+        result.setdefault(entry["parent"], []).append(module_name)
+
+    return result
+
+
+def _getSelfTime(module_name, times, children):
+    return times[module_name]["seconds"] - sum(
+        times[child_name]["seconds"] for child_name in children.get(module_name, ())
+    )
+
+
+def _getCriticalChain(times, children):
+    roots = children.get(None, ())
+
+    if not roots:
+        return []
+
+    module_name = max(roots, key=lambda name: times[name]["seconds"])
+    result = [module_name]
+
+    while module_name in children:
+        module_name = max(
+            children[module_name], key=lambda name: times[name]["seconds"]
+        )
+        result.append(module_name)
+
+    return result
+
+
+def _describeLevel(import_levels, importer_name, imported_name):
+    if (importer_name, imported_name) not in import_levels:
+        return "implicit"
+
+    level, line_number = import_levels[importer_name, imported_name]
+
+    if line_number is not None:
+        return "%s:%d" % (level, line_number)
+    else:
+        return level
+
+
+def main():
+    parser = OptionParser(usage="%prog [options] GRAPH_FILE TIMES_FILE")
+
+    parser.add_option(
+        "--top",
+        action="store",
+        dest="top",
+        default="20",
+        help="""Number of modules to list by own import time. Default is %default.""",
+    )
+
+    options, positional_args = parser.parse_args()
+
+    if len(positional_args) != 2:
+        parser.print_help()
+        sys.exit("\nError, need import graph and import times files.")
+
+    graph_filename, times_filename = positional_args
+
+    import_levels = _getImportLevels(_loadJSON(graph_filename))
+    times = _loadJSON(times_filename)
+
+    children = _getChildren(times)
+    chain = _getCriticalChain(times, children)
+
+    if not chain:
+        sys.exit("Error, no import times recorded in '%s'." % times_filename)
+
+    total = times[chain[0]]["seconds"] or 1e-9
+
+    row_format = "%-50s %-16s %10s %10s %6s"
+
+    my_print("Critical import chain:")
+    my_print(row_format % ("module", "imported at", "inclusive", "self", "%"))
+
+    for count, module_name in enumerate(chain):
+        if count == 0:
+            level = "-"
+        else:
+            level = _describeLevel(import_levels, chain[count - 1], module_name)
+
+        seconds = times[module_name]["seconds"]
+
+        my_print(
+            row_format
+            % (
+                "  " * count + module_name,
+                level,
+                "%.4f" % seconds,
+                "%.4f" % _getSelfTime(module_name, times, children),
+                "%.1f" % (100.0 * seconds / total),
+            )
+        )
+
+    candidates = [
+        (
+            times[module_name]["seconds"],
+            chain[count - 1],
+            module_name,
+        )
+        for count, module_name in enumerate(chain)
+        if count > 0
+        and import_levels.get((chain[count - 1], module_name), ("",))[0] == "module"
+    ]
+
+    if candidates:
+        seconds, importer_name, imported_name = max(candidates)
+
+        my_print(
+            "\nLargest module level import on the chain: '%s' imports '%s' (%.4fs)."
+            % (importer_name, imported_name, seconds)
+        )
+
+    my_print("\nModules by own import time:")
+
+    by_self_time = sorted(
+        times, key=lambda name: _getSelfTime(name, times, children), reverse=True
+    )
+
+    for module_name in by_self_time[: int(options.top)]:
+        parent_name = times[module_name]["parent"]
+
+        my_print(
+            "%-50s %10s  via %s (%s)"
+            % (
+                module_name,
+                "%.4f" % _getSelfTime(module_name, times, children),
+                parent_name or "-",
+                _describeLevel(import_levels, parent_name, module_name)
+                if parent_name
+                else "-",
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -605,6 +605,13 @@ def main():
             setExtraFlags(None, "standalone", flags)
             executeSubTest("./tests/standalone/run_all.py search")
 
+            print(
+                "Running the onefile tests with options '%s' with %s:"
+                % (flags, use_python)
+            )
+            setExtraFlags(None, "onefile", flags)
+            executeSubTest("./tests/onefile/run_all.py search")
+
         if options.reflection_test and not options.coverage:
             print(
                 "Running the reflection test with options '%s' with %s:"
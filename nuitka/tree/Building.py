@@ -58,6 +58,7 @@ from nuitka.__past__ import long, unicode  # pylint: disable=I0021,redefined-bui
 from nuitka.importing import Importing
 from nuitka.importing.ImportCache import addImportedModule
 from nuitka.importing.PreloadedPackages import getPthImportedPackages
+from nuitka.importing.Recursion import prefetchImportedModules
 from nuitka.nodes.AssignNodes import StatementAssignmentVariableName
 from nuitka.nodes.AttributeNodes import (
     ExpressionAttributeLookup,
@@ -678,6 +679,11 @@ def buildParseTree(provider, source_code, source_ref, is_module, is_main):
     )
     body, doc = extractDocFromBody(body)
 
+    # Start reading the modules this one will recurse to, while it's built
+    # and optimized.
+    if is_module:
+        prefetchImportedModules(module=provider, body=body)
+
     if is_module and is_main and python_version >= 360:
         provider.markAsNeedsAnnotationsDictionary()
 
@@ -30,7 +30,8 @@ from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version, python_version_str
 from nuitka.utils.Shebang import getShebangFromSource, parseShebang
-from nuitka.utils.Utils import getOS
+from nuitka.utils.ThreadedExecutor import ThreadPoolExecutor, is_threaded
+from nuitka.utils.Utils import getCoreCount, getOS
 
 from .SyntaxErrors import raiseSyntaxError
 
@@ -111,11 +112,58 @@ see http://python.org/dev/peps/pep-0263/ for details"""
     return source_code
 
 
-def readSourceCodeFromFilename(module_name, source_filename):
+def _readSourceCodeFromFilename(source_filename):
     if python_version < 300:
-        source_code = _readSourceCodeFromFilename2(source_filename)
+        return _readSourceCodeFromFilename2(source_filename)
+    else:
+        return _readSourceCodeFromFilename3(source_filename)
+
+
+# Worker pool and pending reads of source files that are expected to be
+# needed, by filename.
+_prefetch_pool = None
+_prefetched_sources = {}
+
+
+def prefetchSourceCode(source_filename):
+    """ Start reading and decoding a source file in the background.
+
+    Notes:
+        This is for modules that are expected to be recursed to, so that
+        reading them, which is mostly waiting for the file system, overlaps
+        with building and optimizing other modules.
+    """
+
+    # Singleton, pylint: disable=global-statement
+    global _prefetch_pool
+
+    if not is_threaded or source_filename in _prefetched_sources:
+        return
+
+    if _prefetch_pool is None:
+        _prefetch_pool = ThreadPoolExecutor(max_workers=getCoreCount() * 3)
+
+    _prefetched_sources[source_filename] = _prefetch_pool.submit(
+        _readSourceCodeFromFilename, source_filename
+    )
+
+
+def stopSourceCodePrefetching():
+    """ Cancel reads that were not started yet, as no more modules are built. """
+
+    for future in _prefetched_sources.values():
+        future.cancel()
+
+    _prefetched_sources.clear()
+
+
+def readSourceCodeFromFilename(module_name, source_filename):
+    future = _prefetched_sources.pop(source_filename, None)
+
+    if future is not None and not future.cancelled():
+        source_code = future.result()
     else:
-        source_code = _readSourceCodeFromFilename3(source_filename)
+        source_code = _readSourceCodeFromFilename(source_filename)
 
     # Allow plug-ins to mess with source code.
     source_code = Plugins.onModuleSourceCode(module_name, source_code)
@@ -75,6 +75,10 @@ def extractDocFromBody(node):
 
 
 def parseSourceCodeToAst(source_code, filename, line_offset):
+    # Note: Parsing is not cached on disk. Restoring a stored tree, with pickle
+    # or marshal, creates the nodes in Python and is slower than "ast.parse"
+    # doing it in C, and parsing is only a small part of tree building.
+
     # Workaround: ast.parse cannot cope with some situations where a file is not
     # terminated by a new line.
     if not source_code.endswith("\n"):
@@ -0,0 +1,474 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Reading ELF files for their dependencies, without running "ldd".
+
+This reads the dynamic section of shared libraries and executables, i.e. the
+"DT_NEEDED", "DT_RPATH" and "DT_RUNPATH" entries, and resolves the needed
+libraries the same way the Linux dynamic loader does, using its search paths
+and "/etc/ld.so.cache", but without loading anything.
+"""
+
+import os
+import struct
+
+from nuitka.PythonVersions import python_version
+
+# Values from "elf.h", only what we need.
+_ELFCLASS32 = 1
+_ELFCLASS64 = 2
+
+_PT_LOAD = 1
+_PT_DYNAMIC = 2
+
+_DT_NULL = 0
+_DT_NEEDED = 1
+_DT_STRTAB = 5
+_DT_STRSZ = 10
+_DT_SONAME = 14
+_DT_RPATH = 15
+_DT_RUNPATH = 29
+
+
+class ElfInfo(object):
+    """ The dynamic linking information of an ELF file. """
+
+    __slots__ = ("elf_class", "machine", "needed", "soname", "rpath", "runpath")
+
+    def __init__(self, elf_class, machine, needed, soname, rpath, runpath):
+        self.elf_class = elf_class
+        self.machine = machine
+
+        self.needed = needed
+        self.soname = soname
+        self.rpath = rpath
+        self.runpath = runpath
+
+    def __repr__(self):
+        return "<ElfInfo needed=%r rpath=%r runpath=%r>" % (
+            self.needed,
+            self.rpath,
+            self.runpath,
+        )
+
+    def isCompatible(self, other):
+        return self.elf_class == other.elf_class and self.machine == other.machine
+
+
+def _decodeElfString(value):
+    if python_version >= 300:
+        return value.decode("utf-8", "surrogateescape")
+    else:
+        return value
+
+
+def _readElfHeader(elf_file):
+    ident = elf_file.read(16)
+
+    if len(ident) != 16 or ident[:4] != b"\x7fELF":
+        return None
+
+    elf_class = ord(ident[4:5])
+    byte_order = "<" if ord(ident[5:6]) == 1 else ">"
+
+    if elf_class == _ELFCLASS64:
+        header_format = byte_order + "HHIQQQIHHHHHH"
+    elif elf_class == _ELFCLASS32:
+        header_format = byte_order + "HHIIIIIHHHHHH"
+    else:
+        return None
+
+    header = elf_file.read(struct.calcsize(header_format))
+
+    if len(header) != struct.calcsize(header_format):
+        return None
+
+    _e_type, machine, _e_version, _e_entry, phoff, _e_shoff, _e_flags, _e_ehsize, phentsize, phnum, _e_shentsize, _e_shnum, _e_shstrndx = struct.unpack(
+        header_format, header
+    )
+
+    return elf_class, byte_order, machine, phoff, phentsize, phnum
+
+
+def _readProgramHeaders(elf_file, elf_class, byte_order, phoff, phentsize, phnum):
+    """ Yield type, offset, virtual address, and file size of segments. """
+
+    elf_file.seek(phoff)
+    data = elf_file.read(phentsize * phnum)
+
+    for count in range(phnum):
+        entry = data[count * phentsize : (count + 1) * phentsize]
+
+        if elf_class == _ELFCLASS64:
+            p_type, _p_flags, p_offset, p_vaddr, _p_paddr, p_filesz, _p_memsz, _p_align = struct.unpack(
+                byte_order + "IIQQQQQQ", entry[:56]
+            )
+        else:
+            p_type, p_offset, p_vaddr, _p_paddr, p_filesz, _p_memsz, _p_flags, _p_align = struct.unpack(
+                byte_order + "IIIIIIII", entry[:32]
+            )
+
+        yield p_type, p_offset, p_vaddr, p_filesz
+
+
+_elf_info_cache = {}
+
+
+def readElfInfo(filename):
+    """ Read the dynamic linking information of an ELF file.
+
+    Args:
+        filename: file to read
+
+    Returns:
+        ElfInfo object, or None if it is not an ELF file that can be read.
+
+    Notes:
+        Tools like "chrpath" and "strip" modify files in place, therefore
+        cached results are only used while size and mtime are unchanged.
+    """
+    try:
+        stat_result = os.stat(filename)
+    except OSError:
+        return None
+
+    file_stamp = stat_result.st_size, stat_result.st_mtime
+
+    cached = _elf_info_cache.get(filename)
+
+    if cached is None or cached[0] != file_stamp:
+        cached = _elf_info_cache[filename] = file_stamp, _readElfInfo(filename)
+
+    return cached[1]
+
+
+def _readElfInfo(filename):
+    # Many cases of unusable files to handle, pylint: disable=too-many-locals,too-many-return-statements
+    try:
+        elf_file = open(filename, "rb")
+    except (IOError, OSError):
+        return None
+
+    with elf_file:
+        header = _readElfHeader(elf_file)
+
+        if header is None:
+            return None
+
+        elf_class, byte_order, machine, phoff, phentsize, phnum = header
+
+        loads = []
+        dynamic = None
+
+        for p_type, p_offset, p_vaddr, p_filesz in _readProgramHeaders(
+            elf_file, elf_class, byte_order, phoff, phentsize, phnum
+        ):
+            if p_type == _PT_LOAD:
+                loads.append((p_vaddr, p_offset, p_filesz))
+            elif p_type == _PT_DYNAMIC:
+                dynamic = p_offset, p_filesz
+
+        # Statically linked, nothing needed.
+        if dynamic is None:
+            return ElfInfo(
+                elf_class=elf_class,
+                machine=machine,
+                needed=(),
+                soname=None,
+                rpath=None,
+                runpath=None,
+            )
+
+        elf_file.seek(dynamic[0])
+        data = elf_file.read(dynamic[1])
+
+        entry_format = byte_order + ("qQ" if elf_class == _ELFCLASS64 else "iI")
+        entry_size = struct.calcsize(entry_format)
+
+        entries = []
+        for offset in range(0, len(data) - entry_size + 1, entry_size):
+            tag, value = struct.unpack(
+                entry_format, data[offset : offset + entry_size]
+            )
+
+            if tag == _DT_NULL:
+                break
+
+            entries.append((tag, value))
+
+        string_table_address = None
+        string_table_size = None
+
+        for tag, value in entries:
+            if tag == _DT_STRTAB:
+                string_table_address = value
+            elif tag == _DT_STRSZ:
+                string_table_size = value
+
+        if string_table_address is None or string_table_size is None:
+            return None
+
+        # The string table is given as a virtual address, find where it is in
+        # the file from the loaded segments.
+        for p_vaddr, p_offset, p_filesz in loads:
+            if p_vaddr <= string_table_address < p_vaddr + p_filesz:
+                elf_file.seek(string_table_address - p_vaddr + p_offset)
+                string_table = elf_file.read(string_table_size)
+                break
+        else:
+            return None
+
+    def getString(offset):
+        return _decodeElfString(string_table[offset : string_table.find(b"\0", offset)])
+
+    needed = []
+    soname = rpath = runpath = None
+
+    for tag, value in entries:
+        if tag == _DT_NEEDED:
+            needed.append(getString(value))
+        elif tag == _DT_SONAME:
+            soname = getString(value)
+        elif tag == _DT_RPATH:
+            rpath = getString(value)
+        elif tag == _DT_RUNPATH:
+            runpath = getString(value)
+
+    return ElfInfo(
+        elf_class=elf_class,
+        machine=machine,
+        needed=tuple(needed),
+        soname=soname,
+        rpath=rpath,
+        runpath=runpath,
+    )
+
+
+_ld_so_cache = None
+
+
+def _parseLdSoCache(data):
+    """ Parse the contents of "ld.so.cache", old and new format. """
+
+    old_magic = b"ld.so-1.7.0"
+    new_magic = b"glibc-ld.so.cache1.1"
+
+    result = []
+
+    if data.startswith(old_magic):
+        (count,) = struct.unpack("=I", data[12:16])
+
+        # The new format follows the old one, aligned, and has the entries
+        # we want, old format entries do not know about 64 bits.
+        new_start = 16 + count * 12
+        new_start = (new_start + 7) & ~7
+
+        if data[new_start : new_start + len(new_magic)] != new_magic:
+            string_start = 16 + count * 12
+
+            for offset in range(16, 16 + count * 12, 12):
+                _flags, key, value = struct.unpack("=iII", data[offset : offset + 12])
+                result.append((string_start + key, string_start + value))
+
+            return data, result
+
+        data = data[new_start:]
+
+    if not data.startswith(new_magic):
+        return data, result
+
+    (count,) = struct.unpack("=I", data[20:24])
+
+    for offset in range(48, 48 + count * 24, 24):
+        _flags, key, value = struct.unpack("=iII", data[offset : offset + 12])
+        result.append((key, value))
+
+    return data, result
+
+
+def getLdSoCache():
+    """ Mapping of library names to paths, as in "/etc/ld.so.cache".
+
+    Returns:
+        dict of library names to lists of paths, in cache order
+
+    """
+    # Singleton, pylint: disable=global-statement
+    global _ld_so_cache
+
+    if _ld_so_cache is None:
+        _ld_so_cache = {}
+
+        try:
+            with open("/etc/ld.so.cache", "rb") as cache_file:
+                data = cache_file.read()
+        except (IOError, OSError):
+            data = b""
+
+        data, entries = _parseLdSoCache(data)
+
+        def getString(offset):
+            return _decodeElfString(data[offset : data.find(b"\0", offset)])
+
+        for key, value in entries:
+            _ld_so_cache.setdefault(getString(key), []).append(getString(value))
+
+    return _ld_so_cache
+
+
+def _getDefaultLibraryPaths(elf_info):
+    if elf_info.elf_class == _ELFCLASS64:
+        return ("/lib64", "/usr/lib64", "/lib", "/usr/lib")
+    else:
+        return ("/lib", "/usr/lib")
+
+
+def _expandSearchPath(search_path, origin, elf_info):
+    if not search_path:
+        return []
+
+    lib_name = "lib64" if elf_info.elf_class == _ELFCLASS64 else "lib"
+    platform = os.uname()[4]  # @UndefinedVariable
+
+    result = []
+
+    for path in search_path.split(":"):
+        for variable, value in (
+            ("ORIGIN", origin),
+            ("LIB", lib_name),
+            ("PLATFORM", platform),
+        ):
+            path = path.replace("${%s}" % variable, value)
+            path = path.replace("$%s" % variable, value)
+
+        # Empty elements mean the current directory to the loader.
+        result.append(path or ".")
+
+    return result
+
+
+def _isUsableLibrary(filename, elf_info):
+    if not os.path.isfile(filename):
+        return False
+
+    candidate_info = readElfInfo(filename)
+
+    return candidate_info is not None and candidate_info.isCompatible(elf_info)
+
+
+def _iterNeededCandidates(needed, elf_info, rpaths, runpaths, library_paths):
+    # The "DT_RPATH" values are ignored, if there is "DT_RUNPATH".
+    if elf_info.runpath is None:
+        for search_path in rpaths:
+            yield os.path.join(search_path, needed)
+
+    for search_path in library_paths:
+        yield os.path.join(search_path, needed)
+
+    for search_path in runpaths:
+        yield os.path.join(search_path, needed)
+
+    for cached_filename in getLdSoCache().get(needed, ()):
+        yield cached_filename
+
+    for search_path in _getDefaultLibraryPaths(elf_info):
+        yield os.path.join(search_path, needed)
+
+
+def _resolveNeeded(needed, elf_info, rpaths, runpaths, library_paths):
+    if "/" in needed:
+        return needed if _isUsableLibrary(needed, elf_info) else None
+
+    for candidate in _iterNeededCandidates(
+        needed=needed,
+        elf_info=elf_info,
+        rpaths=rpaths,
+        runpaths=runpaths,
+        library_paths=library_paths,
+    ):
+        if _isUsableLibrary(candidate, elf_info):
+            return candidate
+
+    return None
+
+
+def getElfDependencies(filename, library_paths=()):
+    """ Find the libraries an ELF file needs, including indirect ones.
+
+    Args:
+        filename: ELF file to analyse
+        library_paths: extra paths to search like "LD_LIBRARY_PATH" does
+
+    Returns:
+        List of paths of the needed libraries that were found, in load order,
+        or None if the file could not be read as an ELF file.
+
+    Notes:
+        The search order is "DT_RPATH" of the file and the files that load
+        it (unless it has "DT_RUNPATH"), then the given library paths, then
+        "DT_RUNPATH", then "/etc/ld.so.cache", and finally default paths.
+    """
+
+    elf_info = readElfInfo(filename)
+
+    if elf_info is None:
+        return None
+
+    result = []
+    loaded = set()
+
+    # Breadth first, as the loader does, with "DT_RPATH" values inherited by
+    # the libraries loaded, except from files that have "DT_RUNPATH".
+    pending = [(filename, elf_info, ())]
+
+    while pending:
+        current_filename, current_info, inherited_rpaths = pending.pop(0)
+
+        origin = os.path.dirname(os.path.abspath(current_filename))
+
+        if current_info.runpath is None:
+            rpaths = (
+                tuple(_expandSearchPath(current_info.rpath, origin, current_info))
+                + inherited_rpaths
+            )
+        else:
+            rpaths = inherited_rpaths
+
+        runpaths = _expandSearchPath(current_info.runpath, origin, current_info)
+
+        for needed in current_info.needed:
+            if needed in loaded:
+                continue
+
+            loaded.add(needed)
+
+            needed_filename = _resolveNeeded(
+                needed=needed,
+                elf_info=current_info,
+                rpaths=rpaths,
+                runpaths=runpaths,
+                library_paths=library_paths,
+            )
+
+            if needed_filename is None:
+                continue
+
+            result.append(needed_filename)
+
+            pending.append((needed_filename, readElfInfo(needed_filename), rpaths))
+
+    return result
@@ -22,6 +22,7 @@ stuff. It will also frequently add sorting.
 
 """
 
+import hashlib
 import os
 import shutil
 import tempfile
@@ -50,6 +51,48 @@ def _with_file_Lock():
         file_lock.release()
 
 
+@contextmanager
+def withFileLock(lock_filename):
+    """ Lock a file for exclusive use by this thread and process.
+
+    Args:
+        lock_filename: file to use for locking, created if necessary
+
+    Notes:
+        This serializes with other processes too, which the locks from
+        "threading" cannot do. Every use opens the file again, so threads
+        of one process exclude each other as well.
+    """
+    with open(lock_filename, "a+") as lock_file:
+        if os.name == "nt":
+            import msvcrt  # pylint: disable=I0021,import-error
+
+            # Only one byte is locked, this retries for 10 seconds and then
+            # raises, so we keep trying.
+            while True:
+                try:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except IOError:
+                    pass
+
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # pylint: disable=I0021,import-error
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 def areSamePaths(path1, path2):
     """ Decide if two paths the same.
 
@@ -267,6 +310,31 @@ def getFileContents(filename, mode="r"):
         return f.read()
 
 
+def getFileContentsHash(filename):
+    """ Get a hash value of the contents of a file.
+
+    Args:
+        filename: file to hash
+
+    Returns:
+        Hex digest of the file contents, read in blocks, so large binaries
+        are not loaded into memory all at once.
+    """
+
+    result = hashlib.md5()
+
+    with open(filename, "rb") as input_file:
+        while True:
+            block = input_file.read(65536)
+
+            if not block:
+                break
+
+            result.update(block)
+
+    return result.hexdigest()
+
+
 def renameFile(source_filename, dest_filename):
     # There is no way to safely update a file on Windows, but lets
     # try on Linux at least.
@@ -281,6 +349,58 @@ def renameFile(source_filename, dest_filename):
     os.chmod(dest_filename, old_stat.st_mode)
 
 
+def cloneFile(source_filename, dest_filename):
+    """ Create a copy-on-write clone of a file, where supported.
+
+    Args:
+        source_filename: file to clone
+        dest_filename: file to create, must not exist
+
+    Returns:
+        Boolean value indicating if the clone was made, only on Linux
+        file systems with "FICLONE" support, e.g. btrfs or xfs, it is.
+    """
+
+    if getOS() != "Linux":
+        return False
+
+    import fcntl  # pylint: disable=I0021,import-error
+
+    # The "_IOW(0x94, 9, int)" value from "linux/fs.h".
+    FICLONE = 0x40049409
+
+    try:
+        with open(source_filename, "rb") as source_file:
+            with open(dest_filename, "wb") as dest_file:
+                fcntl.ioctl(dest_file.fileno(), FICLONE, source_file.fileno())
+    except (IOError, OSError):
+        deleteFile(dest_filename, must_exist=False)
+        return False
+
+    return True
+
+
+def breakHardLink(filename):
+    """ Make sure a file is not shared with other hard links.
+
+    Args:
+        filename: file that is going to be modified in place
+
+    Notes:
+        Files deployed as hard links share their contents with other
+        files, these must not see the changes.
+    """
+
+    if os.stat(filename).st_nlink <= 1:
+        return
+
+    temp_filename = filename + ".tmp"
+
+    shutil.copy2(filename, temp_filename)
+    os.unlink(filename)
+    os.rename(temp_filename, filename)
+
+
 def isPathBelow(path, filename):
     path = os.path.abspath(path)
     filename = os.path.abspath(filename)
@@ -0,0 +1,190 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Persistent caches below the Nuitka cache directory.
+
+A cache is a directory with one file per entry, named after a hash of the key
+the user provides, and an index file, that records the size and the last use
+of every entry. Entries are written to a temporary file and renamed into place,
+so readers never see partial entries, and the index is only updated while
+holding a lock file, so several Nuitka processes can share a cache. When the
+entries exceed the size limit, the least recently used ones are removed.
+"""
+
+import atexit
+import hashlib
+import os
+import tempfile
+import time
+
+from .AppDirs import getCacheDir
+from .FileOperations import deleteFile, makePath, withFileLock
+from .ThreadedExecutor import Lock
+
+
+class PersistentCache(object):
+    """ Cache of byte strings in a named directory below the cache directory.
+
+        Keys are strings, which are hashed, values are byte strings. The user
+        has to put everything into the key that the value depends on.
+    """
+
+    index_filename = "index.txt"
+
+    # Number of entries used before the index is updated, and at exit.
+    flush_count = 64
+
+    def __init__(self, name, max_size):
+        self.cache_dir = os.path.join(getCacheDir(), name)
+        self.max_size = max_size
+
+        # Entries used by this process, the index is updated with them later.
+        self.used = {}
+        self.lock = Lock()
+
+        makePath(self.cache_dir)
+
+        atexit.register(self.flush)
+
+    @staticmethod
+    def getKeyHash(key):
+        if str is not bytes:
+            key = key.encode("utf8")
+
+        return hashlib.md5(key).hexdigest()
+
+    def getEntryFilename(self, key):
+        return os.path.join(self.cache_dir, self.getKeyHash(key))
+
+    def getEntry(self, key):
+        """ Get the cached value for a key, or None if it is not cached. """
+
+        entry_filename = self.getEntryFilename(key)
+
+        try:
+            with open(entry_filename, "rb") as entry_file:
+                result = entry_file.read()
+        except (IOError, OSError):
+            return None
+
+        with self.lock:
+            self.used[os.path.basename(entry_filename)] = len(result)
+
+        return result
+
+    def putEntry(self, key, value):
+        """ Store the value for a key, replacing existing values. """
+
+        entry_filename = self.getEntryFilename(key)
+
+        fd, temp_filename = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as output_file:
+            output_file.write(value)
+
+        _replaceFile(temp_filename, entry_filename)
+
+        with self.lock:
+            self.used[os.path.basename(entry_filename)] = len(value)
+
+            # Keep index writes infrequent, but do not let the cache grow too
+            # much beyond its size limit.
+            flush = len(self.used) >= self.flush_count
+
+        if flush:
+            self.flush()
+
+    def _readIndex(self):
+        result = {}
+
+        try:
+            with open(os.path.join(self.cache_dir, self.index_filename)) as f:
+                for line in f:
+                    parts = line.split()
+
+                    # Tolerate broken lines, entries are still found without
+                    # the index, they will just be evicted early.
+                    if len(parts) == 3:
+                        result[parts[0]] = int(parts[1]), float(parts[2])
+        except (IOError, OSError, ValueError):
+            pass
+
+        return result
+
+    def _writeIndex(self, index):
+        fd, temp_filename = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as output_file:
+            for entry_name, (size, last_used) in sorted(index.items()):
+                output_file.write("%s %d %.2f\n" % (entry_name, size, last_used))
+
+        _replaceFile(temp_filename, os.path.join(self.cache_dir, self.index_filename))
+
+    def flush(self):
+        """ Record the entries used in the index and evict if too large. """
+
+        with self.lock:
+            used = self.used
+            self.used = {}
+
+        if not used:
+            return
+
+        now = time.time()
+
+        with withFileLock(os.path.join(self.cache_dir, "index.lock")):
+            index = self._readIndex()
+
+            for entry_name, size in used.items():
+                index[entry_name] = size, now
+
+            total_size = sum(size for size, _last_used in index.values())
+
+            if total_size > self.max_size:
+                for entry_name in sorted(index, key=lambda name: index[name][1]):
+                    if total_size <= self.max_size // 2:
+                        break
+
+                    # Entries used in this process are kept.
+                    if entry_name in used:
+                        continue
+
+                    total_size -= index[entry_name][0]
+                    del index[entry_name]
+
+                    deleteFile(
+                        os.path.join(self.cache_dir, entry_name), must_exist=False
+                    )
+
+            self._writeIndex(index)
+
+
+def _replaceFile(source_filename, dest_filename):
+    try:
+        if hasattr(os, "replace"):
+            os.replace(source_filename, dest_filename)  # @UndefinedVariable
+        else:
+            # Python2 on Windows cannot rename onto existing files.
+            if os.name == "nt":
+                deleteFile(dest_filename, must_exist=False)
+
+            os.rename(source_filename, dest_filename)
+    except OSError:
+        # On Windows, files in use by another process cannot be replaced,
+        # then keep what the other process wrote.
+        if not os.path.exists(dest_filename):
+            raise
+
+        deleteFile(source_filename, must_exist=False)
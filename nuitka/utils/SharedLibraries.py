@@ -31,6 +31,7 @@ from nuitka.utils.WindowsResources import (
     getResourcesFromDLL,
 )
 
+from .FileOperations import breakHardLink
 from .Utils import isAlpineLinux
 
 
@@ -122,6 +123,7 @@ def removeSxsFromDLL(filename):
     res_names = getSxsFromDLL(filename)
 
     if res_names:
+        breakHardLink(filename)
         deleteWindowsResources(filename, RT_MANIFEST, res_names)
 
 
@@ -37,6 +37,8 @@ try:
         for future in as_completed(workers):
             yield future.result()
 
+    # Work is really done in the background.
+    is_threaded = True
 
 except ImportError:
     # No backport installed, use stub for at least Python 2.6, and potentially
@@ -64,6 +66,8 @@ except ImportError:
         if workers:
             return iter(workers[0].results)
 
+    is_threaded = False
+
 
 assert Lock
 assert ThreadPoolExecutor
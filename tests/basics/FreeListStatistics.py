@@ -0,0 +1,61 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Adaptive free lists and their statistics.
+
+This is compiled with a small free list for cells, adaptation and statistics
+enabled, see "run_all.py". For CPython, there is nothing to check, so the
+checks succeed, for the output to be the same.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+def makeClosure(value):
+    def closure():
+        return value
+
+    return closure
+
+
+def useCells(count):
+    # All cells are alive at the same time, then released together, which
+    # fills the free list of cells beyond its limit.
+    closures = [makeClosure(i) for i in range(count)]
+
+    return sum(closure() for closure in closures)
+
+
+getFreeListStatistics = getattr(sys, "_nuitka_freelist_statistics", None)
+
+print("Cells used:", useCells(50), useCells(50))
+
+if getFreeListStatistics is not None:
+    cells_statistics = getFreeListStatistics()["cells"]
+
+    # The limit given was 2, but releasing many cells at once adapted it.
+    print("Free list adapted:", cells_statistics["max_count"] > 2)
+    print("Free list full:", cells_statistics["count"] >= cells_statistics["max_count"])
+    print("Free list hits:", cells_statistics["hits"] > 0)
+    print("Free list discards:", cells_statistics["discards"] > 0)
+else:
+    print("Free list adapted:", True)
+    print("Free list full:", True)
+    print("Free list hits:", True)
+    print("Free list discards:", True)
@@ -42,6 +42,8 @@ python_version = setup(suite="basics", needs_io_encoding=True)
 
 search_mode = createSearchMode()
 
+extra_options = os.environ.get("NUITKA_EXTRA_OPTIONS", "")
+
 # Create large constants test on the fly, if it's not there, not going to
 # add it to release archives for no good reason.
 if not os.path.exists("BigConstants.py"):
@@ -49,6 +51,30 @@ if not os.path.exists("BigConstants.py"):
         output.write("# Automatically generated test, not part of releases or git.\n\n")
         output.write("print('%s')\n" % ("1234" * 17000))
 
+# Constants larger than the chunks of "--compress-constants", one of which is
+# incompressible and forces stored blocks. Same as above, created on the fly.
+if not os.path.exists("CompressedConstants.py"):
+    random_value = 12345
+    random_bytes = []
+
+    for _i in range(100000):
+        random_value = (random_value * 1103515245 + 12345) & 0x7FFFFFFF
+        random_bytes.append("\\x%02x" % ((random_value >> 16) & 0xFF))
+
+    with open("CompressedConstants.py", "w") as output:
+        output.write("# Automatically generated test, not part of releases or git.\n\n")
+        output.write("from __future__ import print_function\n\n")
+        output.write("import hashlib\n\n")
+        output.write("compressible = '%s'\n" % ("1234" * 40000))
+        output.write("incompressible = b'%s'\n\n" % "".join(random_bytes))
+        output.write(
+            "print(len(compressible), "
+            "hashlib.md5(compressible.encode('ascii')).hexdigest())\n"
+        )
+        output.write(
+            "print(len(incompressible), hashlib.md5(incompressible).hexdigest())\n"
+        )
+
 # Now run all the tests in this directory.
 for filename in sorted(os.listdir(".")):
     if not filename.endswith(".py"):
@@ -99,6 +125,19 @@ for filename in sorted(os.listdir(".")):
     if filename == "BuiltinOverload.py":
         extra_flags.append("ignore_warnings")
 
+    # This tests the statistics of adaptive free lists, with a limit that
+    # gets exceeded.
+    if filename == "FreeListStatistics.py":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = (
+            extra_options
+            + " --freelist-statistics --freelist-adaptive --freelist-size=cell=2"
+        )
+    # This tests the decompression of constants, the reason it exists.
+    elif filename == "CompressedConstants.py":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + " --compress-constants"
+    else:
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options
+
     active = search_mode.consider(dirname=None, filename=filename)
 
     if active:
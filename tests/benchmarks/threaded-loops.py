@@ -0,0 +1,74 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Throughput of loops in compiled code, run by several threads at once.
+
+This is to measure the cost of giving up the GIL in loops, which should only
+be done, when other threads can make use of it. Give the number of threads
+and the switch interval in seconds as arguments, for Python3 only.
+"""
+
+from __future__ import print_function
+
+import sys
+import threading
+import time
+
+thread_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+
+if len(sys.argv) > 2:
+    sys.setswitchinterval(float(sys.argv[2]))
+
+loop_count = 2000000
+
+
+def countLoops(results, index):
+    total = 0
+
+    for x in range(loop_count):
+        total += x & 7
+
+    results[index] = total
+
+
+def runThreads(count):
+    results = [None] * count
+    threads = [
+        threading.Thread(target=countLoops, args=(results, index))
+        for index in range(count)
+    ]
+
+    start = time.time()
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return time.time() - start
+
+
+# Single thread first, where the GIL should never be given up, then the
+# contended case.
+for count in (1, thread_count):
+    duration = runThreads(count)
+
+    print(
+        "%d thread(s): %.0f loops per second" % (count, count * loop_count / duration)
+    )
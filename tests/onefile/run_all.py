@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+""" Runner for onefile mode tests.
+
+Every program is compiled once with "--onefile" and then run with a cache
+directory, for which the output must be the same as with CPython. These
+runs extract to the cache and reuse it, recover from a damaged extraction,
+and, where permissions apply, refuse to use a cache directory, that others
+can write to.
+"""
+
+import os
+import sys
+
+# Find nuitka package relative to us. The replacement is for POSIX python
+# and Windows paths on command line.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__.replace("\\", os.sep))), "..", ".."
+        )
+    ),
+)
+
+# isort:start
+
+import subprocess
+import tempfile
+
+from nuitka.tools.testing.Common import (
+    createSearchMode,
+    decideFilenameVersionSkip,
+    my_print,
+    setup,
+)
+from nuitka.utils.FileOperations import removeDirectory
+
+python_version = setup(suite="onefile", needs_io_encoding=True)
+
+search_mode = createSearchMode()
+
+nuitka_binary = os.path.abspath(os.path.join("..", "..", "bin", "nuitka"))
+
+
+def runProgram(command, cache_dir, temp_dir):
+    env = dict(os.environ)
+
+    # Only the cache and temporary directories of the test are to be used.
+    env["XDG_CACHE_HOME"] = cache_dir
+    env["LOCALAPPDATA"] = cache_dir
+    env["TMPDIR"] = temp_dir
+    env["TMP"] = temp_dir
+
+    process = subprocess.Popen(
+        args=command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env
+    )
+
+    stdout, stderr = process.communicate()
+
+    if process.returncode != 0:
+        sys.exit("Error, running %r failed:\n%s" % (command, stderr))
+
+    return stdout
+
+
+def checkOutput(description, output, expected_output):
+    if output != expected_output:
+        sys.exit(
+            "Error, output of onefile binary %s differs from CPython:\n%s"
+            % (description, output)
+        )
+
+    my_print("OK, same output of onefile binary", description)
+
+
+def getExtractionDirs(cache_dir):
+    onefile_dir = os.path.join(cache_dir, "nuitka-onefile")
+
+    return [
+        os.path.join(onefile_dir, filename)
+        for filename in os.listdir(onefile_dir)
+        if not filename.startswith(".") and ".tmp" not in filename
+    ]
+
+
+def checkOnefileProgram(filename, work_dir):
+    output_dir = os.path.join(work_dir, "output")
+    cache_dir = os.path.join(work_dir, "cache")
+    temp_dir = os.path.join(work_dir, "temp")
+
+    for directory in (output_dir, cache_dir, temp_dir):
+        os.mkdir(directory)
+
+    expected_output = runProgram(
+        command=[os.environ["PYTHON"], filename],
+        cache_dir=cache_dir,
+        temp_dir=temp_dir,
+    )
+
+    subprocess.check_call(
+        [os.environ["PYTHON"], nuitka_binary, "--onefile", "--output-dir=" + output_dir]
+        + os.environ.get("NUITKA_EXTRA_OPTIONS", "").split()
+        + [filename]
+    )
+
+    binary_filename = os.path.join(
+        output_dir, filename[:-3] + (".exe" if os.name == "nt" else ".bin")
+    )
+
+    for description in ("extracting to cache", "reusing cache"):
+        checkOutput(
+            description,
+            runProgram(
+                command=[binary_filename], cache_dir=cache_dir, temp_dir=temp_dir
+            ),
+            expected_output,
+        )
+
+    extraction_dirs = getExtractionDirs(cache_dir)
+    assert len(extraction_dirs) == 1, extraction_dirs
+    extraction_dir = extraction_dirs[0]
+
+    if os.name != "nt":
+        for directory in (os.path.dirname(extraction_dir), extraction_dir):
+            assert os.stat(directory).st_mode & 0o077 == 0, directory
+
+    # Damage an extracted file, which must not be used then.
+    damaged_filename = os.path.join(
+        extraction_dir,
+        min(
+            filename
+            for filename in os.listdir(extraction_dir)
+            if os.path.isfile(os.path.join(extraction_dir, filename))
+            if filename != ".nuitka-onefile"
+        ),
+    )
+
+    with open(damaged_filename, "wb"):
+        pass
+
+    checkOutput(
+        "with damaged cache",
+        runProgram(command=[binary_filename], cache_dir=cache_dir, temp_dir=temp_dir),
+        expected_output,
+    )
+
+    if os.name != "nt":
+        # A cache directory others can write to, e.g. created by another user
+        # in "/tmp", must not be used.
+        untrusted_cache_dir = os.path.join(work_dir, "untrusted_cache")
+        os.mkdir(untrusted_cache_dir)
+        os.mkdir(os.path.join(untrusted_cache_dir, "nuitka-onefile"))
+        os.chmod(os.path.join(untrusted_cache_dir, "nuitka-onefile"), 0o777)
+
+        checkOutput(
+            "with untrusted cache",
+            runProgram(
+                command=[binary_filename],
+                cache_dir=untrusted_cache_dir,
+                temp_dir=temp_dir,
+            ),
+            expected_output,
+        )
+
+        assert not os.listdir(os.path.join(untrusted_cache_dir, "nuitka-onefile"))
+        assert any(
+            filename.startswith("nuitka-onefile-") for filename in os.listdir(temp_dir)
+        ), os.listdir(temp_dir)
+
+
+for filename in sorted(os.listdir(".")):
+    if not filename.endswith(".py") or filename == "run_all.py":
+        continue
+
+    if not decideFilenameVersionSkip(filename):
+        continue
+
+    active = search_mode.consider(dirname=None, filename=filename)
+
+    if active:
+        my_print("Consider onefile program:", filename)
+
+        work_dir = tempfile.mkdtemp(prefix="onefile-test-")
+
+        try:
+            checkOnefileProgram(filename, work_dir)
+        finally:
+            removeDirectory(work_dir, ignore_errors=True)
+
+        if search_mode.abortIfExecuted():
+            break
+    else:
+        my_print("Skipping", filename)
+
+search_mode.finish()
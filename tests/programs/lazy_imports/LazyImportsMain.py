@@ -0,0 +1,40 @@
+#     Copyright 2019, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+from __future__ import print_function
+
+# The modules of "lazy_package" are compiled with "--lazy-imports", and their
+# module level imports used only in functions then happen on first use.
+import lazy_package.user
+
+print("*** Main: First use", lazy_package.user.useFirst())
+print("*** Main: Second use", lazy_package.user.useFirst())
+print("*** Main: Dotted import use", lazy_package.user.useDotted())
+
+
+def tryBroken():
+    try:
+        import lazy_package.broken_user
+
+        return lazy_package.broken_user.useBroken()
+    except ImportError as e:
+        return "ImportError: %s" % e
+
+
+# The error of the lazy import must come at first use.
+print("*** Main: Broken import use", tryBroken())